@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+child.py — Run one generator under the bench harness.
+
+    python bench/child.py <script.py> [args...]
+
+Installs the nflverse snapshot layer when BENCH_NFL_SNAPSHOTS is set, then runs
+the script as __main__ with its own directory on sys.path, exactly as
+`cd scripts && python <script.py>` would.
+"""
+
+import os
+import runpy
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def main():
+    snapshots = os.environ.get("BENCH_NFL_SNAPSHOTS")
+    if snapshots:
+        import nflverse_snapshot
+        nflverse_snapshot.install(snapshots,
+                                  os.environ.get("BENCH_NFL_MODE", "replay"),
+                                  os.environ.get("BENCH_NFL_STATS", ""))
+
+    script = os.path.abspath(sys.argv[1])
+    sys.argv = [script] + sys.argv[2:]
+    sys.path.insert(0, os.path.dirname(script))
+    runpy.run_path(script, run_name="__main__")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+nflverse_snapshot.py — Serve nflverse / nfl_data_py downloads from local snapshots.
+
+The NFL generators read remote parquet / CSV files, either directly
+(pd.read_parquet(url)) or through nfl_data_py, which does the same internally.
+install() wraps pandas.read_parquet and pandas.read_csv so any http(s) URL is
+read from <snapshot_dir>/<host>/<path> instead:
+
+  replay  (default)  missing snapshot → FileNotFoundError, nothing leaves the box
+  record             missing snapshot → downloaded once, saved, then read locally
+
+Every URL read is counted; with stats_path set, the counts are written there as
+JSON at exit (the bench harness reports them as the run's upstream calls).
+"""
+
+import atexit
+import json
+import os
+import threading
+import urllib.request
+from urllib.parse import urlparse
+
+_counts: dict[str, int] = {}
+_lock = threading.Lock()
+
+
+def snapshot_path(root: str, url: str) -> str:
+    u = urlparse(url)
+    return os.path.join(root, u.netloc, *[p for p in u.path.split("/") if p])
+
+
+def _localize(root: str, mode: str, src):
+    if not isinstance(src, str) or not src.startswith(("http://", "https://")):
+        return src
+    with _lock:
+        _counts[src] = _counts.get(src, 0) + 1
+    path = snapshot_path(root, src)
+    if os.path.exists(path):
+        return path
+    if mode != "record":
+        raise FileNotFoundError(f"no nflverse snapshot for {src} (expected {path})")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    urllib.request.urlretrieve(src, tmp)
+    os.replace(tmp, path)
+    return path
+
+
+def install(root: str, mode: str = "replay", stats_path: str = "") -> None:
+    import pandas as pd
+
+    read_parquet, read_csv = pd.read_parquet, pd.read_csv
+
+    def snap_read_parquet(path, *args, **kwargs):
+        return read_parquet(_localize(root, mode, path), *args, **kwargs)
+
+    def snap_read_csv(path, *args, **kwargs):
+        return read_csv(_localize(root, mode, path), *args, **kwargs)
+
+    pd.read_parquet = snap_read_parquet
+    pd.read_csv     = snap_read_csv
+
+    if stats_path:
+        def dump():
+            with _lock:
+                counts = dict(_counts)
+            with open(stats_path, "w") as f:
+                json.dump({"requests": sum(counts.values()), "by_url": counts}, f)
+        atexit.register(dump)
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+run_bench.py — End-to-end benchmark harness for the data generators.
+
+Runs generators against recorded fixtures and records, per scenario:
+
+  - wall time, total and per stage (stages are delimited by the script's own
+    progress lines, e.g. "Step 2:" — see SCENARIOS)
+  - upstream calls (stand-in server requests for NBA, snapshot reads for NFL)
+  - peak RSS of the generator process
+  - size of every output file
+
+Nothing touches the network or the real scripts/data: each scenario runs in a
+scratch copy of scripts/ (with a copy of data/ for the incremental updaters and
+a cold nba_api cache), NBA calls go to nba_standin_server, and nflverse reads
+are served from parquet / CSV snapshots (nflverse_snapshot.py).
+
+Results go to bench/results/latest.json (plus a timestamped copy). If
+bench/baseline.json exists the run is compared against it and exits non-zero
+when any metric regresses by more than --threshold.
+
+Recording fixtures (needs network, once):
+    cd scripts
+    python bench/run_bench.py --record                 # all scenarios
+Benchmarking:
+    python bench/run_bench.py                          # all scenarios vs. baseline
+    python bench/run_bench.py nba-incremental nfl-full
+    python bench/run_bench.py --latency 80 --jitter 40 --errors 429:0.02
+    python bench/run_bench.py --save-baseline          # accept current numbers
+
+Fixtures: bench/fixtures/{nba,nfl}/  (override with --fixtures)
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR   = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, SCRIPTS_DIR)
+
+from nba_standin_server import FixtureStore, parse_errors, record_from_cache, serve
+
+FIXTURE_DIR   = os.path.join(BENCH_DIR, "fixtures")
+RESULTS_DIR   = os.path.join(BENCH_DIR, "results")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+
+THRESHOLD = 0.20     # allowed relative regression per metric
+# Absolute slack below which a change is noise, not a regression
+NOISE_FLOOR = {"wall_s": 0.5, "peak_rss_mb": 10.0, "api_calls": 0, "output_bytes": 1024}
+
+# ─── Scenarios ────────────────────────────────────────────────────────────────
+# stages: (name, regex matched against the script's stdout) in run order; time
+# before the first marker is reported as "startup".
+
+SCENARIOS = {
+    "nba-full": {
+        "sport":   "nba",
+        "cmd":     ["generate_nba_careers.py"],
+        "outputs": ["data/nba_careers.json"],
+        "stages":  [("scan", r"^Step 1:"), ("directory", r"^Step 1b:"),
+                    ("careers", r"^\s*Step 2:"), ("write", r"^\s*Done!")],
+    },
+    "nba-incremental": {
+        "sport":   "nba",
+        "cmd":     ["update_nba_careers.py", "--years", "2024"],
+        "outputs": ["data/nba_careers.json"],
+        "stages":  [("season", r"Fetching player stats"), ("write", r"^Done!")],
+    },
+    "nfl-full": {
+        "sport":   "nfl",
+        "cmd":     ["generate_nfl_careers.py"],
+        "outputs": ["data/nfl_careers.json"],
+        "stages":  [("rosters", r"^Loading roster data"), ("stats", r"^Loading seasonal stats"),
+                    ("build", r"^\s*Scanning"), ("write", r"^\s*Written:")],
+    },
+    "nfl-incremental": {
+        "sport":   "nfl",
+        "cmd":     ["update_nfl_careers.py", "--year", "2024"],
+        "outputs": ["data/nfl_careers.json", "data/nfl_lineup_pool.json"],
+        "stages":  [("stats", r"^\s*Fetching \d+ stats"), ("rosters", r"^Fetching \d+ rosters")],
+    },
+}
+
+
+# ─── Running ──────────────────────────────────────────────────────────────────
+
+def make_workspace() -> str:
+    """Scratch copy of scripts/*.py and scripts/data/."""
+    ws = tempfile.mkdtemp(prefix="bench_")
+    for name in os.listdir(SCRIPTS_DIR):
+        if name.endswith(".py"):
+            shutil.copy2(os.path.join(SCRIPTS_DIR, name), ws)
+    shutil.copytree(os.path.join(SCRIPTS_DIR, "data"), os.path.join(ws, "data"))
+    return ws
+
+
+def output_bytes(ws: str, rel: str) -> int:
+    path = os.path.join(ws, rel)
+    if os.path.isdir(path):
+        return sum(os.path.getsize(os.path.join(d, f)) for d, _, fs in os.walk(path) for f in fs)
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+
+def run_child(cmd: list, env: dict, stages: list, verbose: bool) -> dict:
+    """Run one generator; timestamps stage markers in its output, measures peak RSS."""
+    patterns = [(name, re.compile(rx)) for name, rx in stages]
+    marks: list[tuple[str, float]] = [("startup", time.monotonic())]
+    proc = subprocess.Popen([sys.executable, "-u", os.path.join(BENCH_DIR, "child.py"), *cmd],
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env, text=True)
+    tail: list[str] = []
+    for line in proc.stdout:
+        if verbose:
+            print("    | " + line, end="")
+        tail = (tail + [line])[-20:]
+        for name, rx in patterns:
+            if rx.search(line) and name not in (m[0] for m in marks):
+                marks.append((name, time.monotonic()))
+                break
+    _, status, usage = os.wait4(proc.pid, 0)
+    end = time.monotonic()
+    proc.returncode = os.waitstatus_to_exitcode(status)
+
+    stage_s = {}
+    for (name, t0), (_, t1) in zip(marks, marks[1:] + [("end", end)]):
+        stage_s[name] = round(t1 - t0, 3)
+    return {
+        "returncode":  proc.returncode,
+        "wall_s":      round(end - marks[0][1], 3),
+        "stages_s":    stage_s,
+        "peak_rss_mb": round(usage.ru_maxrss / 1024, 1),     # Linux reports KiB
+        "log_tail":    "".join(tail) if proc.returncode else "",
+    }
+
+
+def run_scenario(name: str, args) -> dict:
+    sc  = SCENARIOS[name]
+    ws  = make_workspace()
+    env = dict(os.environ)
+    env.update({
+        "NBA_API_CACHE_DIR":    os.path.join(ws, ".nba_api_cache"),
+        "NBA_CAREER_STORE_DIR": os.path.join(ws, ".nba_career_store"),
+        "PYTHONDONTWRITEBYTECODE": "1",
+    })
+    nba_fixtures = os.path.join(args.fixtures, "nba")
+    nfl_fixtures = os.path.join(args.fixtures, "nfl")
+    srv = None
+    try:
+        if sc["sport"] == "nba" and not args.record:
+            srv = serve(port=0, fixtures=FixtureStore(nba_fixtures), latency_ms=args.latency,
+                        jitter_ms=args.jitter, errors=parse_errors(args.errors), seed=0)
+            env["NBA_STATS_BASE_URL"] = f"http://127.0.0.1:{srv.server_address[1]}/stats"
+            if not args.paced:
+                env["NBA_API_START_RATE"] = env["NBA_API_MAX_RATE"] = "1000"
+        if sc["sport"] == "nfl":
+            env["BENCH_NFL_SNAPSHOTS"] = nfl_fixtures
+            env["BENCH_NFL_MODE"]      = "record" if args.record else "replay"
+            env["BENCH_NFL_STATS"]     = os.path.join(ws, "nfl_reads.json")
+            env["NFLVERSE_MIRROR"]     = "0"     # the snapshots above stand in for it
+
+        cmd = [os.path.join(ws, sc["cmd"][0]), *sc["cmd"][1:]]
+        result = run_child(cmd, env, sc["stages"], args.verbose)
+
+        if sc["sport"] == "nba":
+            if srv is not None:
+                result["api_calls"] = srv.stats()["requests"]
+            if args.record:
+                n = record_from_cache(env["NBA_API_CACHE_DIR"], nba_fixtures)
+                print(f"  recorded {n} nba_api responses → {nba_fixtures}")
+        else:
+            try:
+                with open(env["BENCH_NFL_STATS"]) as f:
+                    result["api_calls"] = json.load(f)["requests"]
+            except (OSError, ValueError, KeyError):
+                result["api_calls"] = 0
+
+        result["outputs"]      = {rel: output_bytes(ws, rel) for rel in sc["outputs"]}
+        result["output_bytes"] = sum(result["outputs"].values())
+        return result
+    finally:
+        if srv is not None:
+            srv.shutdown()
+            srv.server_close()
+        shutil.rmtree(ws, ignore_errors=True)
+
+
+# ─── Baseline comparison ──────────────────────────────────────────────────────
+
+def flatten(results: dict) -> dict:
+    flat = {}
+    for name, r in results.items():
+        for metric in ("wall_s", "peak_rss_mb", "api_calls", "output_bytes"):
+            if metric in r:
+                flat[(name, metric)] = r[metric]
+        for stage, secs in r.get("stages_s", {}).items():
+            flat[(name, f"stage.{stage}_s")] = secs
+    return flat
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Human-readable regressions (empty list = pass)."""
+    regressions = []
+    base = flatten(baseline)
+    for key, value in flatten(results).items():
+        if key not in base:
+            continue
+        old    = base[key]
+        metric = key[1] if not key[1].startswith("stage.") else "wall_s"
+        if value > old * (1 + threshold) and value - old > NOISE_FLOOR[metric]:
+            pct = (value / old - 1) * 100 if old else float("inf")
+            regressions.append(f"{key[0]} {key[1]}: {old} → {value} (+{pct:.0f}%)")
+    return regressions
+
+
+def print_table(results: dict) -> None:
+    print(f"\n{'scenario':<18} {'wall s':>8} {'calls':>7} {'rss MB':>8} {'out KB':>9}  stages")
+    for name, r in results.items():
+        stages = "  ".join(f"{k}={v:.1f}" for k, v in r.get("stages_s", {}).items())
+        status = "" if r.get("returncode", 0) == 0 else f"  FAILED (exit {r['returncode']})"
+        print(f"{name:<18} {r.get('wall_s', 0):>8.1f} {r.get('api_calls', 0):>7} "
+              f"{r.get('peak_rss_mb', 0):>8.1f} {r.get('output_bytes', 0) / 1024:>9.1f}  {stages}{status}")
+
+
+# ─── Main ─────────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the data generators against fixtures.")
+    parser.add_argument("scenarios", nargs="*", help=f"Subset of: {', '.join(SCENARIOS)}")
+    parser.add_argument("--fixtures", default=FIXTURE_DIR)
+    parser.add_argument("--record", action="store_true",
+                        help="Run against the live sources and save fixtures instead of benchmarking")
+    parser.add_argument("--latency", type=float, default=0, help="Stand-in latency per request (ms)")
+    parser.add_argument("--jitter", type=float, default=0, help="Stand-in latency jitter (ms)")
+    parser.add_argument("--errors", default="", help="Stand-in error injection, e.g. 429:0.02")
+    parser.add_argument("--paced", action="store_true",
+                        help="Keep the real rate limiter pacing (default: unthrottled against the stand-in)")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Echo generator output")
+    args = parser.parse_args()
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    results: dict = {}
+    for name in names:
+        sport_fixtures = os.path.join(args.fixtures, SCENARIOS[name]["sport"])
+        if not args.record and not os.path.isdir(sport_fixtures):
+            print(f"{name}: no fixtures in {sport_fixtures} — run with --record first, skipping")
+            continue
+        print(f"{name}: {'recording' if args.record else 'running'} {' '.join(SCENARIOS[name]['cmd'])}")
+        results[name] = run_scenario(name, args)
+        if results[name]["returncode"]:
+            print(results[name]["log_tail"])
+
+    if args.record or not results:
+        return
+
+    print_table(results)
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    doc = {"created_at": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": sys.version.split()[0],
+           "options": {"latency_ms": args.latency, "jitter_ms": args.jitter,
+                       "errors": args.errors, "paced": args.paced},
+           "scenarios": results}
+    for path in (os.path.join(RESULTS_DIR, "latest.json"),
+                 os.path.join(RESULTS_DIR, time.strftime("%Y%m%d-%H%M%S") + ".json")):
+        with open(path, "w") as f:
+            json.dump(doc, f, indent=2)
+    print(f"\nResults → {os.path.join(RESULTS_DIR, 'latest.json')}")
+
+    failed = [n for n, r in results.items() if r["returncode"]]
+    if args.save_baseline:
+        if failed:
+            sys.exit(f"Not saving baseline: {', '.join(failed)} failed")
+        with open(args.baseline, "w") as f:
+            json.dump(doc, f, indent=2)
+        print(f"Baseline saved → {args.baseline}")
+        return
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)["scenarios"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nREGRESSIONS (> {args.threshold:.0%} vs {args.baseline}):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions vs baseline (threshold {args.threshold:.0%}).")
+    if failed:
+        sys.exit(f"Failed scenarios: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+career_shards.py — Sharded, lazily loadable layout of the career / lineup-pool files.
+
+The frontend downloads the whole of nba_careers.json (2.4 MB) and
+nba_lineup_pool.json (3.4 MB), or the NFL pair, before a game can start, even
+though a round only needs a handful of players. This writes each of those
+files a second time as a slim manifest plus id-range shards:
+
+    public/data/shards/nba_careers/manifest.json
+    public/data/shards/nba_careers/000.3f9c2a1b7d04.json
+    public/data/shards/nba_careers/001.a81e55c0f2d9.json
+    ...
+
+manifest.json
+    {"source": "nba_careers.json", "count": 748, "shard_size": 100,
+     "shards":  [{"file", "sha256", "bytes", "count", "first_id", "last_id"}, ...],
+     "players": [{"player_id", "player_name", "position", "first_season",
+                  "last_season", "shard"}, ...]}
+
+Players are sorted by player_id and cut into shards of SHARD_SIZE, so each
+shard covers a contiguous id range. A shard is the same player objects as
+the monolithic file (seasons, bio, ...), and its file name carries the first
+12 hex digits of its sha256. Unchanged shards keep their URL across rebuilds
+and can be cached forever. Only the manifest has to be revalidated.
+
+The monolithic files are unchanged. Run after copying fresh files into
+public/data (shards whose content changed get new names; old ones are removed):
+
+    cd scripts
+    python career_shards.py                     # all four files in ../public/data
+    python career_shards.py --data-dir data     # or the scripts/data copies
+
+From Python:
+    from career_shards import write_shards
+    manifest = write_shards(careers, out_dir, source="nfl_careers.json")
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+
+# ─── Config ───────────────────────────────────────────────────────────────────
+
+DATA_DIR   = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "public", "data")
+SHARD_SIZE = 100   # players per shard (~200–350 KB for NBA careers)
+HASH_LEN   = 12
+
+SOURCES = ["nba_careers", "nba_lineup_pool", "nfl_careers", "nfl_lineup_pool"]
+
+SHARD_FILE = re.compile(r"^\d{3}\.[0-9a-f]{%d}\.json$" % HASH_LEN)
+
+
+def shards_dir(data_dir: str, name: str) -> str:
+    return os.path.join(data_dir, "shards", name)
+
+
+def dumps(obj) -> bytes:
+    """Compact JSON, as the generators write it."""
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def id_key(player: dict):
+    """Sort key for player_id: NBA ids are ints, NFL ids strings (ints first if mixed)."""
+    pid = player["player_id"]
+    return (isinstance(pid, str), pid)
+
+
+# ─── Layout ───────────────────────────────────────────────────────────────────
+
+def summary(player: dict, shard: int) -> dict:
+    """The manifest's entry for one player."""
+    seasons = [str(s["season"]) for s in player.get("seasons", []) if s.get("season") is not None]
+    return {
+        "player_id":    player["player_id"],
+        "player_name":  player.get("player_name", ""),
+        "position":     player.get("position", ""),
+        "first_season": min(seasons) if seasons else None,
+        "last_season":  max(seasons) if seasons else None,
+        "shard":        shard,
+    }
+
+
+def build_shards(players: list, source: str, shard_size: int = SHARD_SIZE) -> tuple[dict, dict]:
+    """(manifest, {file name: bytes}) for a careers list."""
+    ordered = sorted(players, key=id_key)
+    manifest = {
+        "source":     source,
+        "count":      len(ordered),
+        "shard_size": shard_size,
+        "shards":     [],
+        "players":    [],
+    }
+    files = {}
+    for shard, start in enumerate(range(0, len(ordered), shard_size)):
+        chunk = ordered[start:start + shard_size]
+        data  = dumps(chunk)
+        sha   = hashlib.sha256(data).hexdigest()
+        name  = f"{shard:03d}.{sha[:HASH_LEN]}.json"
+        files[name] = data
+        manifest["shards"].append({
+            "file":     name,
+            "sha256":   sha,
+            "bytes":    len(data),
+            "count":    len(chunk),
+            "first_id": chunk[0]["player_id"],
+            "last_id":  chunk[-1]["player_id"],
+        })
+        manifest["players"].extend(summary(p, shard) for p in chunk)
+    return manifest, files
+
+
+def _write(path: str, data: bytes) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def write_shards(players: list, out_dir: str, source: str, shard_size: int = SHARD_SIZE) -> dict:
+    """Write the manifest and shards for players into out_dir; returns the manifest.
+
+    Shards already on disk under the same (content-hashed) name are left
+    alone; shard files no longer referenced are deleted after the new
+    manifest is in place.
+    """
+    manifest, files = build_shards(players, source, shard_size)
+    os.makedirs(out_dir, exist_ok=True)
+    for name, data in files.items():
+        path = os.path.join(out_dir, name)
+        if not os.path.exists(path):
+            _write(path, data)
+    _write(os.path.join(out_dir, "manifest.json"), dumps(manifest))
+    for name in os.listdir(out_dir):
+        if SHARD_FILE.match(name) and name not in files:
+            os.remove(os.path.join(out_dir, name))
+    return manifest
+
+
+# ─── Main ─────────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="Write id-range shards + manifest for the career files.")
+    parser.add_argument("--data-dir", default=DATA_DIR,
+                        help="Directory holding the monolithic JSON files (default: public/data)")
+    parser.add_argument("--shard-size", type=int, default=SHARD_SIZE,
+                        help=f"Players per shard (default: {SHARD_SIZE})")
+    parser.add_argument("names", nargs="*", default=SOURCES,
+                        help=f"Files to shard, without .json (default: {' '.join(SOURCES)})")
+    args = parser.parse_args()
+
+    for name in args.names:
+        src = os.path.join(args.data_dir, f"{name}.json")
+        if not os.path.exists(src):
+            print(f"  {name}: {src} not found — skipping")
+            continue
+        with open(src) as f:
+            players = json.load(f)
+        out_dir  = shards_dir(args.data_dir, name)
+        manifest = write_shards(players, out_dir, f"{name}.json", args.shard_size)
+        manifest_kb = os.path.getsize(os.path.join(out_dir, "manifest.json")) / 1024
+        print(f"  {name}: {manifest['count']} players → {len(manifest['shards'])} shards, "
+              f"manifest {manifest_kb:.0f} KB ({os.path.getsize(src) / 1024:.0f} KB monolithic)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+checkpoint_journal.py — Append-only JSONL write-ahead journal for resumable fetch loops.
+
+The NBA generators used to checkpoint by rewriting the whole partial output
+(json.dump(careers)) every 25–50 players: checkpoint cost grew with progress
+and a crash between checkpoints lost up to 49 finished fetches. Instead, each
+completed player is now one fsync'd line:
+
+    {"id": 2544, "result": {...player entry...}}
+    {"id": 1628, "result": null}                 # fetched, nothing usable
+    {"id": 1629, "error": "ReadTimeout(...)"}    # fetch failed
+
+--resume replays the journal (a torn last line from a crash is ignored), so at
+most the request that was in flight is lost. Failed fetches are journaled but
+not counted as done: a player who hit a timeout or 429 is fetched again on
+--resume, as before the journal.
+
+A fetch function tells the two "nothing to add" cases apart by returning
+FetchError(e) instead of None when the request itself failed. FetchError is
+falsy, so `if result:` keeps treating both as "skip". Once the final output file has
+been written the journal has served its purpose and is removed.
+
+Usage:
+    journal = CheckpointJournal(OUT_PATH + ".journal")
+    players, done_ids = journal.open(resume)      # replay, or start fresh
+    for (pid, name), result in SCHEDULER.map(...):
+        journal.record(pid, result)               # dict, None or FetchError
+        ...
+    write OUT_PATH from players
+    journal.close(remove=True)
+"""
+
+import json
+import os
+from typing import Union
+
+
+class FetchError:
+    """Result of a fetch that failed (retried on --resume), as opposed to None: no data."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return f"FetchError({self.error!r})"
+
+
+class CheckpointJournal:
+    """One JSON line per completed item, flushed and fsync'd as it is written."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._f = None
+
+    def replay(self) -> tuple[list[dict], set]:
+        """(results in completion order, every id done, including empty results).
+
+        Ids whose only entries are failures are not done, so they are retried.
+        """
+        results: list[dict] = []
+        done: set = set()
+        if not os.path.exists(self.path):
+            return results, done
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue            # torn write from an interrupted run
+                if entry["id"] in done or "error" in entry:
+                    continue
+                done.add(entry["id"])
+                if entry.get("result") is not None:
+                    results.append(entry["result"])
+        return results, done
+
+    def open(self, resume: bool) -> tuple[list[dict], set]:
+        """Open for appending. Replays the existing journal if resuming, else truncates it."""
+        results, done = self.replay() if resume else ([], set())
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        if resume and os.path.exists(self.path):
+            self._drop_torn_tail()
+        self._f = open(self.path, "a" if resume else "w", encoding="utf-8")
+        return results, done
+
+    def _drop_torn_tail(self) -> None:
+        """Cut a partial last line so new records don't get glued onto it."""
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+
+    def record(self, item_id, result: Union[dict, None, FetchError]) -> None:
+        if isinstance(result, FetchError):
+            entry = {"id": item_id, "error": repr(result.error)}
+        else:
+            entry = {"id": item_id, "result": result}
+        self._f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._f.flush()
+        os.fsync(self._f.fileno())
+
+    def close(self, remove: bool = False) -> None:
+        """Close the journal; remove=True once its contents are in the final output."""
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+        if remove and os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+compact_seasons.py — Opt-in columnar encoding of the seasons in the career files.
+
+Every season in nba_careers.json, the lineup pools and the merged player pools
+is an object repeating the same ~3–22 keys ("season", "team", "gp", "pts",
+"total_pts", ...), tens of thousands of times per file. The key strings are a
+large share of both the bytes and the parse time. The compact encoding stores
+them once per file:
+
+    {"format": "compact-seasons/1",
+     "shapes":  [["season", "team", "gp", "min", "pts", ...],
+                 ["season", "team", "gp"], ...],
+     "players": [{"player_id": 2544, "player_name": "LeBron James", "bio": {...},
+                  "seasons": [[0, "2003-04", "CLE", 79, 39.5, 20.9, ...], ...]}, ...]}
+
+A file does not have one season schema: NBA rows with and without the totals,
+NFL rows per position group, kicker rows whose "gp" / "team" order differs.
+So the key table is a list of shapes (key lists, in first-seen order), and
+each season is a row whose first element is its shape index, followed by the
+values in that shape's key order. decode() rebuilds the original objects
+exactly, key order included, so json.dumps of the decoded players is
+byte-identical to the source.
+
+Player-level fields are left as objects: there is one of each per player.
+
+Run:
+    cd scripts
+    python compact_seasons.py                   # size / parse-time benchmark, ../public/data
+    python compact_seasons.py --write           # also write {name}.compact.json next to each file
+    python compact_seasons.py nba_careers --repeat 10
+
+From Python:
+    from compact_seasons import encode, decode
+    doc = encode(players)
+    assert decode(doc) == players
+"""
+
+import argparse
+import gzip
+import json
+import os
+import time
+
+# ─── Config ───────────────────────────────────────────────────────────────────
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "public", "data")
+FORMAT   = "compact-seasons/1"
+SOURCES  = ["nba_careers", "nba_lineup_pool", "nba_player_pool",
+            "nfl_careers", "nfl_lineup_pool", "nfl_player_pool"]
+
+
+def dumps(obj) -> bytes:
+    """Compact JSON, as the generators write it."""
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def compact_path(data_dir: str, name: str) -> str:
+    return os.path.join(data_dir, f"{name}.compact.json")
+
+
+# ─── Encoding ─────────────────────────────────────────────────────────────────
+
+def encode(players: list) -> dict:
+    """Career players → compact document (shape table + season value rows)."""
+    shapes, shape_ids = [], {}
+    out = []
+    for player in players:
+        rows = []
+        for season in player.get("seasons", []):
+            keys = tuple(season)
+            shape = shape_ids.get(keys)
+            if shape is None:
+                shape = shape_ids[keys] = len(shapes)
+                shapes.append(list(keys))
+            rows.append([shape, *season.values()])
+        out.append({**player, "seasons": rows} if "seasons" in player else dict(player))
+    return {"format": FORMAT, "shapes": shapes, "players": out}
+
+
+def decode(doc: dict) -> list:
+    """Compact document → career players, identical to what encode() was given."""
+    if doc.get("format") != FORMAT:
+        raise ValueError(f"not a {FORMAT} document (format={doc.get('format')!r})")
+    shapes = doc["shapes"]
+    players = []
+    for player in doc["players"]:
+        if "seasons" in player:
+            seasons = [dict(zip(shapes[row[0]], row[1:])) for row in player["seasons"]]
+            player = {**player, "seasons": seasons}
+        players.append(player)
+    return players
+
+
+# ─── Benchmark ────────────────────────────────────────────────────────────────
+
+def best_of(fn, repeat: int) -> float:
+    """Fastest of `repeat` runs of fn(), in ms."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def benchmark(name: str, players: list, repeat: int) -> dict:
+    """Sizes and parse times of one file in both encodings."""
+    raw, packed = dumps(players), dumps(encode(players))
+    return {
+        "name":        name,
+        "raw_kb":      len(raw) / 1024,
+        "compact_kb":  len(packed) / 1024,
+        "raw_gz_kb":   len(gzip.compress(raw, 9)) / 1024,
+        "compact_gz_kb": len(gzip.compress(packed, 9)) / 1024,
+        "raw_ms":      best_of(lambda: json.loads(raw), repeat),
+        # the frontend would have to parse and then expand rows back to objects
+        "compact_ms":  best_of(lambda: decode(json.loads(packed)), repeat),
+        "parse_ms":    best_of(lambda: json.loads(packed), repeat),
+    }
+
+
+def print_table(rows: list) -> None:
+    print(f"  {'file':<18} {'raw KB':>8} {'compact':>8} {'gz raw':>8} {'gz cmp':>8}"
+          f" {'parse raw':>10} {'parse cmp':>10} {'+decode':>8}")
+    for r in rows:
+        print(f"  {r['name']:<18} {r['raw_kb']:8.0f} {r['compact_kb']:8.0f} "
+              f"{r['raw_gz_kb']:8.0f} {r['compact_gz_kb']:8.0f} "
+              f"{r['raw_ms']:8.1f}ms {r['parse_ms']:8.1f}ms {r['compact_ms']:6.1f}ms")
+
+
+# ─── Main ─────────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark / write the compact season encoding.")
+    parser.add_argument("names", nargs="*",
+                        help=f"Files without .json (default: {' '.join(SOURCES)})")
+    parser.add_argument("--data-dir", default=DATA_DIR,
+                        help="Directory holding the career JSON files (default: public/data)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per file (best is kept)")
+    parser.add_argument("--write", action="store_true",
+                        help="Write {name}.compact.json next to each file")
+    args = parser.parse_args()
+
+    rows = []
+    for name in args.names or SOURCES:
+        src = os.path.join(args.data_dir, f"{name}.json")
+        if not os.path.exists(src):
+            print(f"  {name}: {src} not found — skipping")
+            continue
+        with open(src) as f:
+            players = json.load(f)
+        doc = encode(players)
+        if decode(doc) != players:
+            raise SystemExit(f"  {name}: round trip mismatch")
+        if args.write:
+            with open(compact_path(args.data_dir, name), "wb") as f:
+                f.write(dumps(doc))
+        rows.append(benchmark(name, players, args.repeat))
+
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+fetch_scheduler.py — Shared adaptive rate limiter + worker pool for the nba_api scripts.
+
+stats.nba.com throttles per client. The scripts used to hard-code a sleep per
+call (0.3–1.5 s depending on who wrote them) and each had its own retry loop.
+Now every NBA script goes through one AdaptiveLimiter:
+
+  - each successful call nudges the request rate up (additive increase)
+  - a timeout or HTTP 429 halves it and pauses all workers for an
+    exponentially growing backoff (multiplicative decrease)
+  - a response without a resultSet is the player / request having no data,
+    not throttling: it is raised to the caller at once (is_no_data_error)
+  - the learned rate persists in .nba_api_cache/limiter_state.json, so the next
+    run starts where the last one left off instead of at the worst case
+
+FetchScheduler overlaps calls across a small thread pool; all of its calls share
+the process-wide limiter and are retried here on throttle errors, so callers no
+longer need their own retry loops.
+
+Usage:
+    from fetch_scheduler import FetchScheduler
+
+    SCHEDULER = FetchScheduler(workers=4, label="careers")
+
+    career = CACHE.fetch(PlayerCareerStats, SCHEDULER, player_id=pid, per_mode36="PerGame")
+
+    for player, result in SCHEDULER.map(fetch_one, players):   # input order
+        ...
+    SCHEDULER.report()
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+from nba_cache import CACHE_DIR
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# ─── Config ───────────────────────────────────────────────────────────────────
+
+# NBA_API_START_RATE / NBA_API_MAX_RATE override the pacing, e.g. for bench runs
+# against the local stand-in server (bench/run_bench.py).
+START_RATE     = float(os.environ.get("NBA_API_START_RATE", "1.0"))  # req/s with no (or stale) saved state
+MIN_RATE       = 0.2      # never slower than one call per 5 s
+MAX_RATE       = float(os.environ.get("NBA_API_MAX_RATE", "4.0"))
+RATE_STEP      = 0.02     # added per successful call
+BACKOFF_BASE   = 2.0      # seconds; doubles per consecutive throttle
+BACKOFF_MAX    = 60.0
+RETRIES        = 3        # per call, on throttle errors only
+STATE_MAX_AGE  = 6 * 3600 # older saved state is ignored
+
+STATE_PATH = os.path.join(CACHE_DIR, "limiter_state.json")
+
+
+class Throttled(Exception):
+    """The server answered with HTTP 429."""
+
+
+def is_throttle_error(exc: BaseException) -> bool:
+    """Errors that mean 'slow down' rather than 'this request is bad'."""
+    if isinstance(exc, (Throttled, TimeoutError, ConnectionError)):
+        return True
+    name = type(exc).__name__
+    if "Timeout" in name or name in ("ConnectionError", "ChunkedEncodingError", "JSONDecodeError"):
+        return True
+    return "429" in str(exc)
+
+
+def is_no_data_error(exc: BaseException) -> bool:
+    """A response with no resultSet: bad or missing data, no point retrying."""
+    return isinstance(exc, KeyError) and bool(exc.args) and exc.args[0] in ("resultSet", "resultSets")
+
+
+# ─── Adaptive limiter ─────────────────────────────────────────────────────────
+
+class AdaptiveLimiter:
+    """Thread-safe AIMD limiter: callers are handed evenly spaced start slots."""
+
+    def __init__(self, rate: float = START_RATE, state_path: Optional[str] = None):
+        self.rate        = min(MAX_RATE, max(MIN_RATE, rate))
+        self.state_path  = state_path
+        self.throttles   = 0
+        self._failures   = 0          # consecutive throttles
+        self._next_slot  = 0.0
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, state_path: str = STATE_PATH) -> "AdaptiveLimiter":
+        rate = START_RATE
+        try:
+            with open(state_path) as f:
+                state = json.load(f)
+            if time.time() - state.get("updated_at", 0) < STATE_MAX_AGE:
+                rate = float(state["rate"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        limiter = cls(rate, state_path)
+        atexit.register(limiter.save)
+        return limiter
+
+    def save(self) -> None:
+        if not self.state_path:
+            return
+        with self._lock:
+            state = {"rate": round(self.rate, 3), "updated_at": time.time()}
+        try:
+            os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+            tmp = self.state_path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp, self.state_path)
+        except OSError:
+            pass
+
+    def reserve(self) -> float:
+        """Claim the next start slot; return seconds to wait until it."""
+        with self._lock:
+            now   = time.monotonic()
+            start = max(now, self._next_slot, self._blocked_until)
+            self._next_slot = start + 1.0 / self.rate
+            return start - now
+
+    def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self.rate = min(MAX_RATE, self.rate + RATE_STEP)
+
+    def failure(self) -> float:
+        """Halve the rate and pause everyone; return the backoff in seconds."""
+        with self._lock:
+            self.throttles += 1
+            self._failures += 1
+            self.rate = max(MIN_RATE, self.rate / 2)
+            backoff = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (self._failures - 1))
+            self._blocked_until = max(self._blocked_until, time.monotonic() + backoff)
+        self.save()
+        return backoff
+
+
+LIMITER = AdaptiveLimiter.load()
+
+
+# ─── Scheduler ────────────────────────────────────────────────────────────────
+
+class FetchScheduler:
+    """Small worker pool whose upstream calls all share one AdaptiveLimiter."""
+
+    def __init__(self, workers: int = 4, label: str = "fetch",
+                 limiter: Optional[AdaptiveLimiter] = None, retries: int = RETRIES):
+        self.limiter = limiter or LIMITER
+        self.workers = max(1, workers)
+        self.label   = label
+        self.retries = retries
+        self.calls   = 0
+        self.items   = 0
+        self._lock    = threading.Lock()
+        self._started: Optional[float] = None
+
+    def call(self, fn: Callable[..., R], *args, **kwargs) -> R:
+        """Run one upstream request when the limiter allows it, retrying on throttle errors."""
+        for attempt in range(self.retries + 1):
+            self.limiter.acquire()
+            with self._lock:
+                if self._started is None:
+                    self._started = time.monotonic()
+                self.calls += 1
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if not is_throttle_error(e):
+                    raise
+                backoff = self.limiter.failure()
+                if attempt == self.retries:
+                    raise
+                print(f"    [{self.label}] throttled ({type(e).__name__}: {e}) — "
+                      f"rate now {self.limiter.rate:.2f}/s, backing off {backoff:.0f}s "
+                      f"(retry {attempt + 1}/{self.retries})")
+                continue
+            self.limiter.success()
+            return result
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> Iterator[tuple[T, R]]:
+        """Apply fn to every item on the pool, yielding (item, result) in input order.
+
+        At most 2 × workers items are submitted ahead of the consumer, so a
+        Ctrl-C abandons only that window and checkpoints taken by the caller
+        stay meaningful. Exceptions raised by fn propagate to the consumer.
+        """
+        window  = self.workers * 2
+        pending: deque = deque()
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=self.label)
+        try:
+            for item in items:
+                pending.append((item, pool.submit(fn, item)))
+                if len(pending) >= window:
+                    yield self._collect(pending.popleft())
+            while pending:
+                yield self._collect(pending.popleft())
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _collect(self, entry: tuple) -> tuple:
+        item, future = entry
+        result = future.result()
+        with self._lock:
+            self.items += 1
+        return item, result
+
+    def stats(self) -> dict:
+        elapsed = time.monotonic() - self._started if self._started is not None else 0.0
+        return {
+            "calls":        self.calls,
+            "items":        self.items,
+            "throttles":    self.limiter.throttles,
+            "rate":         round(self.limiter.rate, 2),
+            "elapsed_s":    round(elapsed, 1),
+            "calls_per_s":  round(self.calls / elapsed, 2) if elapsed else 0.0,
+            "items_per_s":  round(self.items / elapsed, 2) if elapsed else 0.0,
+        }
+
+    def report(self) -> None:
+        s = self.stats()
+        mins, secs = divmod(int(s["elapsed_s"]), 60)
+        print(f"  [{self.label}] {s['items']} items, {s['calls']} API calls in {mins}m{secs:02d}s "
+              f"— {s['calls_per_s']} calls/s, {s['items_per_s']} items/s "
+              f"({self.workers} workers, {s['throttles']} throttles, limiter at {s['rate']}/s)")
@@ -17,6 +17,7 @@ Output:
 Run:
     cd scripts && python generate_nba_box_scores.py
     cd scripts && python generate_nba_box_scores.py --year 2024  # single season
+    cd scripts && python generate_nba_box_scores.py --sync       # no aiohttp: one call at a time
     cp -r data/nba_box_scores ../public/data/nba/box_scores
 """
 
@@ -24,7 +25,6 @@ import argparse
 import json
 import os
 import sys
-import time
 
 try:
     from nba_api.stats.endpoints import (
@@ -43,13 +43,18 @@ except ImportError:
     print("ERROR: pandas not installed. Run: pip install pandas")
     sys.exit(1)
 
+from fetch_scheduler import FetchScheduler
+from nba_async_client import fetch_all_sync, open_client
+from nba_cache import CACHE
+
 # ── Config ────────────────────────────────────────────────────────────────────
 
 SEASONS        = list(range(2014, 2026))  # 2014 = 2014-15 season
 MAX_PER_SEASON = 120
 MIN_SCORE      = 100   # both teams must reach this for close-game qualification
 CLOSE_MARGIN   = 10    # final margin threshold
-SLEEP          = 0.65  # seconds between API calls
+SCHEDULER      = FetchScheduler(workers=1, label="nba box scores")
+ASYNC_CONCURRENCY = 8  # rosters / box scores in flight at once (pace set by fetch_scheduler)
 
 OUT_DIR = os.path.join(os.path.dirname(__file__), "data", "nba_box_scores")
 
@@ -118,20 +123,6 @@ def parse_min(val) -> int:
         return 0
 
 
-def api_call(fn, *args, retries: int = 3, **kwargs):
-    """Call an nba_api endpoint with rate-limit sleep and auto-retry."""
-    for attempt in range(retries):
-        try:
-            time.sleep(SLEEP)
-            return fn(*args, **kwargs)
-        except Exception as e:
-            if attempt == retries - 1:
-                raise
-            wait = SLEEP * (3 + attempt * 2)
-            print(f"    Retry {attempt + 1}/{retries} (wait {wait:.0f}s): {e}")
-            time.sleep(wait)
-
-
 MAX_PO_PER_SERIES = 2   # max games to keep from any single playoff series
 
 
@@ -144,8 +135,18 @@ def main():
         help="Only generate data for this season start year (e.g. 2024 = 2024-25). "
              "Merges into existing index.",
     )
+    parser.add_argument("--cache-stats", action="store_true",
+                        help="Print nba_api response cache hits/misses at the end")
+    parser.add_argument("--sync", action="store_true",
+                        help="Fetch rosters and box scores one at a time instead of via the async client")
     args = parser.parse_args()
 
+    client = open_client(args.sync, concurrency=ASYNC_CONCURRENCY, label="nba box scores")
+    if client:
+        fetch_all = client.fetch_all
+    else:
+        fetch_all = lambda endpoint_cls, calls: fetch_all_sync(endpoint_cls, calls, SCHEDULER)
+
     years = [args.year] if args.year else SEASONS
     os.makedirs(OUT_DIR, exist_ok=True)
 
@@ -169,8 +170,8 @@ def main():
         for season_type in ("Regular Season", "Playoffs"):
             print(f"  Fetching {season_type} game log...")
             try:
-                result = api_call(
-                    leaguegamelog.LeagueGameLog,
+                result = CACHE.fetch(
+                    leaguegamelog.LeagueGameLog, SCHEDULER,
                     season=season,
                     season_type_all_star=season_type,
                     player_or_team_abbreviation="T",
@@ -268,23 +269,19 @@ def main():
         print(f"  Building jersey map ({len(all_nba_teams)} teams)...")
         jersey_map: dict[str, str] = {}  # player_id (str) → jersey number
 
-        for team_info in all_nba_teams:
-            tid = str(team_info["id"])
-            try:
-                roster = api_call(
-                    commonteamroster.CommonTeamRoster,
-                    team_id=tid,
-                    season=season,
-                    timeout=30,
-                )
-                df_r = roster.get_data_frames()[0]
-                for _, r in df_r.iterrows():
-                    pid = safe_str(r.get("PLAYER_ID"))
-                    num = safe_str(r.get("NUM"))
-                    if pid and num:
-                        jersey_map[pid] = num
-            except Exception as e:
-                print(f"    WARNING: roster fetch failed for {team_info['abbreviation']}: {e}")
+        rosters = fetch_all(commonteamroster.CommonTeamRoster, [
+            {"team_id": str(t["id"]), "season": season, "timeout": 30} for t in all_nba_teams
+        ])
+        for team_info, roster in zip(all_nba_teams, rosters):
+            if isinstance(roster, Exception):
+                print(f"    WARNING: roster fetch failed for {team_info['abbreviation']}: {roster}")
+                continue
+            df_r = roster.get_data_frames()[0]
+            for _, r in df_r.iterrows():
+                pid = safe_str(r.get("PLAYER_ID"))
+                num = safe_str(r.get("NUM"))
+                if pid and num:
+                    jersey_map[pid] = num
 
         print(f"  Jersey entries: {len(jersey_map)}")
 
@@ -292,17 +289,14 @@ def main():
         print(f"  Fetching {len(selected)} box scores...")
         output_games = []
 
-        for i, game_meta in enumerate(selected):
+        box_scores = fetch_all(boxscoretraditionalv2.BoxScoreTraditionalV2, [
+            {"game_id": g["game_id"], "timeout": 30} for g in selected
+        ])
+        for game_meta, bx in zip(selected, box_scores):
             gid = game_meta["game_id"]
-            if (i + 1) % 20 == 0:
-                print(f"    {i + 1}/{len(selected)}...")
-
             try:
-                bx = api_call(
-                    boxscoretraditionalv2.BoxScoreTraditionalV2,
-                    game_id=gid,
-                    timeout=30,
-                )
+                if isinstance(bx, Exception):
+                    raise bx
                 player_df = bx.get_data_frames()[0]
             except Exception as e:
                 print(f"    WARNING: box score failed for {gid}: {e}")
@@ -383,6 +377,13 @@ def main():
     print(f"\nIndex → {index_path}")
     print(f"Seasons: {len(index)}  |  Total games: {total}")
     print(f"\nCopy to public/:\n  cp -r data/nba_box_scores ../public/data/nba/box_scores")
+    if client:
+        client.report()
+        client.close()
+    else:
+        SCHEDULER.report()
+    if args.cache_stats:
+        CACHE.report()
 
 
 if __name__ == "__main__":
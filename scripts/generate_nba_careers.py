@@ -5,36 +5,59 @@ generate_nba_careers.py — Build the static NBA career data pool.
 Run this once per season (or whenever you want fresh data):
     python scripts/generate_nba_careers.py
 
-This makes ~20 API calls to build the eligible player list, then 2 API calls
-per player for career stats + bio. Expect 20–40 minutes for ~500–800 players.
-
-Progress is saved incrementally so you can Ctrl-C and resume safely:
+This makes ~20 API calls to build the eligible player list, then 1 API call
+per player for career stats — bios come from the bulk index in nba_bio_index.py.
+Player fetches run on a small worker pool paced by the shared adaptive rate
+limiter (see fetch_scheduler.py), so expect roughly 5–10 minutes for ~500–800
+players on a cold cache.
+
+Every finished player is appended to a checkpoint journal, so you can Ctrl-C
+and resume safely (losing at most the requests in flight):
     python scripts/generate_nba_careers.py --resume
 
+Career responses are fetched concurrently over one keep-alive connection pool
+(nba_async_client.py) when aiohttp is installed; --sync uses the thread-pool
+scheduler instead.
+
+Raw career frames are kept in the local career store (nba_career_store.py), so
+after adding a stat the file can be re-derived in seconds with no API calls:
+    python scripts/generate_nba_careers.py --from-store
+
 Output: scripts/data/nba_careers.json
 """
 
 import json
-import math
 import os
 import sys
-import time
-from typing import Optional
+from typing import Optional, Union
 
 try:
     from nba_api.stats.endpoints import (
-        LeagueDashPlayerStats,
         CommonAllPlayers,
         PlayerCareerStats,
     )
-    from nba_api.stats.endpoints import commonplayerinfo as CommonPlayerInfoModule
 except ImportError:
     print("ERROR: nba_api not installed. Run: pip install nba_api")
     sys.exit(1)
 
+try:
+    import pandas as pd
+except ImportError:
+    print("ERROR: pandas not installed. Run: pip install pandas")
+    sys.exit(1)
+
+from checkpoint_journal import CheckpointJournal, FetchError
+from fetch_scheduler import FetchScheduler, is_no_data_error
+from nba_async_client import AsyncNBAClient, open_client
+from nba_cache import CACHE
+import nba_bio_index as bio_index
+import nba_career_store as store
+from nba_season_scan import qualifying_players, scan_seasons, season_str
+
 # ─── Config ──────────────────────────────────────────────────────────────────
 
-REQUEST_DELAY = 0.7          # seconds between nba_api calls (be conservative)
+WORKERS       = 4            # players fetched concurrently (pace set by fetch_scheduler)
+ASYNC_BATCH   = 25           # players per async batch (Ctrl-C abandons at most one)
 MIN_PPG       = 10.0         # at least one season averaging 10+ PPG
 MIN_SEASONS   = 5            # career must span 5+ years
 MIN_FROM_YEAR = 1980         # modern era only
@@ -43,93 +66,40 @@ MIN_FROM_YEAR = 1980         # modern era only
 SAMPLE_YEARS  = list(range(1985, 2026, 2))
 
 OUT_PATH      = os.path.join(os.path.dirname(__file__), "data", "nba_careers.json")
-PARTIAL_PATH  = OUT_PATH + ".partial"
-
-# ─── Helpers ─────────────────────────────────────────────────────────────────
-
-def safe_float(val, decimals=1):
-    try:
-        if val is None:
-            return 0.0
-        f = float(val)
-        if math.isnan(f) or math.isinf(f):
-            return 0.0
-        return round(f, decimals)
-    except (ValueError, TypeError):
-        return 0.0
-
-
-def safe_int(val):
-    try:
-        if val is None:
-            return 0
-        f = float(val)
-        if math.isnan(f) or math.isinf(f):
-            return 0
-        return int(f)
-    except (ValueError, TypeError):
-        return 0
+JOURNAL_PATH  = OUT_PATH + ".journal"
 
+SCHEDULER     = FetchScheduler(workers=WORKERS, label="nba careers")
 
 # ─── Step 1: Build eligible player list ──────────────────────────────────────
 
 def build_eligible() -> list[dict]:
     """Mirror of _build_nba_eligible() in api_server.py."""
-    productive_ids: dict[int, str] = {}
-
-    sample_seasons = [f"{y}-{str(y + 1)[-2:]}" for y in SAMPLE_YEARS]
+    sample_seasons = [season_str(y) for y in SAMPLE_YEARS]
     print(f"Step 1: scanning {len(sample_seasons)} seasons for players averaging {MIN_PPG}+ PPG...")
 
-    for i, season in enumerate(sample_seasons):
-        try:
-            stats = LeagueDashPlayerStats(
-                season=season,
-                per_mode_detailed="PerGame",
-                season_type_all_star="Regular Season",
-            )
-            time.sleep(REQUEST_DELAY)
-            sdf = stats.get_data_frames()[0]
-            name_col = "PLAYER_NAME" if "PLAYER_NAME" in sdf.columns else "PLAYER"
-            count = 0
-            for _, row in sdf.iterrows():
-                try:
-                    pts = float(row.get("PTS", 0) or 0)
-                    if pts >= MIN_PPG:
-                        pid = int(row["PLAYER_ID"])
-                        productive_ids[pid] = row.get(name_col, "")
-                        count += 1
-                except (ValueError, TypeError):
-                    continue
-            print(f"  [{i+1}/{len(sample_seasons)}] {season}: {count} productive players")
-        except Exception as e:
-            print(f"  [{i+1}/{len(sample_seasons)}] {season}: skipped ({e})")
-            time.sleep(REQUEST_DELAY)
-
+    scan = scan_seasons(sample_seasons, [{"PTS": MIN_PPG}], SCHEDULER)
+    productive_ids = qualifying_players(scan)
     print(f"  Total productive player IDs: {len(productive_ids)}")
 
     # Cross-reference with CommonAllPlayers for career-length filter
     print("Step 1b: fetching complete player directory...")
-    all_players = CommonAllPlayers(is_only_current_season=0)
-    time.sleep(REQUEST_DELAY)
+    all_players = CACHE.fetch(CommonAllPlayers, SCHEDULER, is_only_current_season=0)
     df = all_players.get_data_frames()[0]
 
+    from_year = pd.to_numeric(df["FROM_YEAR"], errors="coerce")
+    to_year   = pd.to_numeric(df["TO_YEAR"], errors="coerce")
+    pid       = pd.to_numeric(df["PERSON_ID"], errors="coerce")
+    keep = (
+        (to_year - from_year >= MIN_SEASONS - 1)
+        & (to_year >= MIN_FROM_YEAR)
+        & pid.isin(list(productive_ids))
+    )
+    rows = df[keep]
     eligible = []
-    for _, row in df.iterrows():
-        try:
-            from_year = int(row.get("FROM_YEAR", 0))
-            to_year   = int(row.get("TO_YEAR", 0))
-            if to_year - from_year < MIN_SEASONS - 1:
-                continue
-            if to_year < MIN_FROM_YEAR:
-                continue
-            player_id = int(row.get("PERSON_ID", 0))
-            if player_id not in productive_ids:
-                continue
-            player_name = row.get("DISPLAY_FIRST_LAST", "") or productive_ids.get(player_id, "")
-            if player_id and player_name:
-                eligible.append({"player_id": player_id, "player_name": player_name})
-        except (ValueError, TypeError):
-            continue
+    for player_id, name in zip(pid[keep].astype(int).tolist(), rows["DISPLAY_FIRST_LAST"].tolist()):
+        player_name = name or productive_ids.get(player_id, "")
+        if player_id and player_name:
+            eligible.append({"player_id": player_id, "player_name": player_name})
 
     print(f"  Eligible players: {len(eligible)}")
     return eligible
@@ -137,102 +107,88 @@ def build_eligible() -> list[dict]:
 
 # ─── Step 2: Fetch full career data for each player ──────────────────────────
 
-def fetch_career(player_id: int, player_name: str) -> Optional[dict]:
-    """Fetch career stats + bio for one player. Returns None on hard failure."""
-    try:
-        career = PlayerCareerStats(player_id=player_id, per_mode36="PerGame")
-        time.sleep(REQUEST_DELAY)
-        dfs = career.get_data_frames()
-        season_df = dfs[0]
-
-        if season_df.empty:
-            return None
-
-        # Build seasons (mirrors api_server.py get_career_stats logic)
-        seasons = []
-        for season_id, group in season_df.groupby("SEASON_ID", sort=False):
-            tot_rows  = group[group["TEAM_ABBREVIATION"] == "TOT"]
-            team_rows = group[group["TEAM_ABBREVIATION"] != "TOT"]
-
-            if len(team_rows) <= 1 and tot_rows.empty:
-                row = group.iloc[0]
-                seasons.append({
-                    "season":   row.get("SEASON_ID", ""),
-                    "team":     row.get("TEAM_ABBREVIATION", "???"),
-                    "gp":       safe_int(row.get("GP")),
-                    "min":      safe_float(row.get("MIN")),
-                    "pts":      safe_float(row.get("PTS")),
-                    "reb":      safe_float(row.get("REB")),
-                    "ast":      safe_float(row.get("AST")),
-                    "stl":      safe_float(row.get("STL")),
-                    "blk":      safe_float(row.get("BLK")),
-                    "fg_pct":   safe_float(row.get("FG_PCT"), 3),
-                    "fg3_pct":  safe_float(row.get("FG3_PCT"), 3),
-                })
-            else:
-                team_names = "/".join(team_rows["TEAM_ABBREVIATION"].tolist()) if not team_rows.empty else "???"
-                src = tot_rows.iloc[0] if not tot_rows.empty else team_rows.iloc[0]
-                seasons.append({
-                    "season":   str(season_id),
-                    "team":     team_names,
-                    "gp":       safe_int(src.get("GP")),
-                    "min":      safe_float(src.get("MIN")),
-                    "pts":      safe_float(src.get("PTS")),
-                    "reb":      safe_float(src.get("REB")),
-                    "ast":      safe_float(src.get("AST")),
-                    "stl":      safe_float(src.get("STL")),
-                    "blk":      safe_float(src.get("BLK")),
-                    "fg_pct":   safe_float(src.get("FG_PCT"), 3),
-                    "fg3_pct":  safe_float(src.get("FG3_PCT"), 3),
-                })
-
-        if len(seasons) < 2:
-            return None
-
-        # Bio
-        bio = {"height": "", "weight": 0, "school": "", "exp": 0, "draft_year": 0}
-        try:
-            player_info = CommonPlayerInfoModule.CommonPlayerInfo(player_id=player_id)
-            time.sleep(REQUEST_DELAY)
-            info_df = player_info.get_data_frames()[0]
-            if not info_df.empty:
-                irow = info_df.iloc[0]
-                bio["height"]     = irow.get("HEIGHT", "") or ""
-                bio["weight"]     = safe_int(irow.get("WEIGHT"))
-                bio["school"]     = irow.get("SCHOOL", "") or ""
-                bio["exp"]        = safe_int(irow.get("SEASON_EXP"))
-                dy = irow.get("DRAFT_YEAR")
-                bio["draft_year"] = int(dy) if dy and str(dy).isdigit() else 0
-        except Exception as e:
-            print(f"    Warning: bio fetch failed for {player_name}: {e}")
+def career_record(player_id: int, player_name: str, career) -> Optional[dict]:
+    """Turn a loaded PlayerCareerStats response into an output entry (None if too short).
 
-        return {
-            "player_id":   player_id,
-            "player_name": player_name,
-            "seasons":     seasons,
-            "bio":         bio,
-        }
+    Raw frames are saved to the career store first, so later stat additions can
+    be rebuilt with --from-store instead of re-fetching.
+    """
+    season_df = career.get_data_frames()[0]
 
+    if season_df.empty:
+        return None
+    store.save_career(player_id, season_df)
+
+    seasons = store.build_seasons(season_df)
+    if len(seasons) < 2:
+        return None
+
+    return {
+        "player_id":   player_id,
+        "player_name": player_name,
+        "seasons":     seasons,
+        "bio":         bio_index.player_bio(player_id, player_name, SCHEDULER),
+    }
+
+
+def fetch_career(player_id: int, player_name: str) -> Union[dict, None, FetchError]:
+    """Fetch career stats + bio for one player. None if no usable data, FetchError on failure."""
+    try:
+        career = CACHE.fetch(PlayerCareerStats, SCHEDULER, player_id=player_id, per_mode36="PerGame")
+        return career_record(player_id, player_name, career)
     except Exception as e:
         print(f"    ERROR fetching {player_name} ({player_id}): {e}")
-        return None
+        return None if is_no_data_error(e) else FetchError(e)
+
+
+def fetch_careers_async(client: AsyncNBAClient, players: list[dict]):
+    """Same (player, result) stream as SCHEDULER.map(fetch_career), fetched via the async client."""
+    responses = client.fetch_iter(
+        PlayerCareerStats, players,
+        lambda p: {"player_id": p["player_id"], "per_mode36": "PerGame"},
+        batch=ASYNC_BATCH,
+    )
+    for player, career in responses:
+        pid, pname = player["player_id"], player["player_name"]
+        try:
+            if isinstance(career, Exception):
+                raise career
+            yield player, career_record(pid, pname, career)
+        except Exception as e:
+            print(f"    ERROR fetching {pname} ({pid}): {e}")
+            yield player, None if is_no_data_error(e) else FetchError(e)
 
 
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
+def rebuild_from_store():
+    """Re-derive every player in OUT_PATH from the career store (no API calls)."""
+    if not os.path.exists(OUT_PATH):
+        print(f"ERROR: {OUT_PATH} not found — run a full fetch first.")
+        sys.exit(1)
+    with open(OUT_PATH) as f:
+        players = json.load(f)
+    careers, counts = store.rebuild_players(players, min_seasons=2)
+    with open(OUT_PATH, "w") as f:
+        json.dump(careers, f, separators=(",", ":"))
+    size_kb = os.path.getsize(OUT_PATH) / 1024
+    print(f"Rebuilt from store: {counts['rebuilt']} rebuilt, {counts['kept']} not in store (kept), "
+          f"{counts['dropped']} dropped  →  {OUT_PATH} ({size_kb:.1f} KB)")
+
+
 def main():
+    if "--from-store" in sys.argv:
+        rebuild_from_store()
+        return
+
     resume = "--resume" in sys.argv
     os.makedirs(os.path.dirname(OUT_PATH), exist_ok=True)
 
-    # Load partial progress if resuming
-    done_ids: set[int] = set()
-    careers: list[dict] = []
-
-    if resume and os.path.exists(PARTIAL_PATH):
-        with open(PARTIAL_PATH) as f:
-            careers = json.load(f)
-        done_ids = {c["player_id"] for c in careers}
-        print(f"Resuming from partial save: {len(careers)} players already done")
+    # Replay the checkpoint journal if resuming (otherwise start a fresh one)
+    journal = CheckpointJournal(JOURNAL_PATH)
+    careers, done_ids = journal.open(resume)
+    if resume:
+        print(f"Resuming from journal: {len(done_ids)} players already done")
 
     # Step 1 — eligible list (always rebuild; it's fast enough)
     eligible = build_eligible()
@@ -244,36 +200,40 @@ def main():
           f"({len(done_ids)} already done, {total} total)...")
     print("This will take a while. Ctrl-C is safe — run with --resume to continue.\n")
 
-    for i, player in enumerate(remaining):
-        pid   = player["player_id"]
+    client = open_client("--sync" in sys.argv, concurrency=WORKERS * 2, label="nba careers")
+    if client:
+        results = fetch_careers_async(client, remaining)
+    else:
+        results = SCHEDULER.map(lambda p: fetch_career(p["player_id"], p["player_name"]), remaining)
+    for i, (player, result) in enumerate(results):
         pname = player["player_name"]
-        result = fetch_career(pid, pname)
 
         if result:
             careers.append(result)
             status = "OK"
+        elif isinstance(result, FetchError):
+            status = "ERROR (retried on --resume)"
         else:
             status = "SKIP (no data)"
 
+        journal.record(player["player_id"], result)
         done = len(done_ids) + i + 1
         print(f"  [{done}/{total}] {pname}: {status}")
 
-        # Save partial progress every 25 players
-        if (i + 1) % 25 == 0:
-            with open(PARTIAL_PATH, "w") as f:
-                json.dump(careers, f, separators=(",", ":"))
-            print(f"  (checkpoint saved — {len(careers)} players)")
-
-    # Final write
+    # Final write — the journal is folded into the output and removed
     with open(OUT_PATH, "w") as f:
         json.dump(careers, f, separators=(",", ":"))
-
-    # Clean up partial file
-    if os.path.exists(PARTIAL_PATH):
-        os.remove(PARTIAL_PATH)
+    journal.close(remove=True)
 
     size_kb = os.path.getsize(OUT_PATH) / 1024
     print(f"\nDone! {len(careers)} players written to {OUT_PATH} ({size_kb:.1f} KB)")
+    if client:
+        client.report()
+        client.close()
+    SCHEDULER.report()
+    bio_index.INDEX.report()
+    if "--cache-stats" in sys.argv:
+        CACHE.report()
 
 
 if __name__ == "__main__":
@@ -23,18 +23,20 @@ Usage:
 """
 
 import json
-import time
 import argparse
 from pathlib import Path
 
 from nba_api.stats.endpoints import CommonTeamRoster
 from tqdm import tqdm
 
+from fetch_scheduler import FetchScheduler
+from nba_cache import CACHE
+
 # ---------------------------------------------------------------------------
 # Config
 # ---------------------------------------------------------------------------
 
-REQUEST_DELAY = 0.3   # seconds between API calls (only for cache misses)
+SCHEDULER = FetchScheduler(workers=1, label="nba rosters")   # paces cache misses only
 
 PROJECT_ROOT = Path(__file__).parent.parent
 CACHE_DIR    = Path(__file__).parent / ".cache"        # api_server's existing cache
@@ -101,8 +103,7 @@ def read_api_cache(hist: str, current: str, season: str):
 def fetch_roster_api(team_id: int, season: str) -> list[dict]:
     """Fetch roster from NBA API. Returns only name/position/number — no PPG call."""
     try:
-        roster = CommonTeamRoster(team_id=team_id, season=season)
-        time.sleep(REQUEST_DELAY)
+        roster = CACHE.fetch(CommonTeamRoster, SCHEDULER, team_id=team_id, season=season)
         df = roster.get_data_frames()[0]
         return [
             {
@@ -139,6 +140,8 @@ def main() -> None:
     parser.add_argument("--end-year",   type=int, default=2024)
     parser.add_argument("--teams",      type=str, default=None)
     parser.add_argument("--force",      action="store_true")
+    parser.add_argument("--cache-stats", action="store_true",
+                        help="Print nba_api response cache hits/misses at the end")
     args = parser.parse_args()
 
     if args.teams:
@@ -229,6 +232,8 @@ def main() -> None:
     print(f"  Roster files skipped : {skipped}")
     print(f"  Season player files  : {players_written}")
     print("=" * 60)
+    if args.cache_stats:
+        CACHE.report()
 
 
 if __name__ == "__main__":
@@ -14,7 +14,6 @@ Run:
 import json
 import os
 import sys
-import time
 from pathlib import Path
 
 from nba_api.stats.endpoints import (
@@ -23,8 +22,11 @@ from nba_api.stats.endpoints import (
     DraftHistory,
 )
 
+from fetch_scheduler import FetchScheduler
+from nba_cache import CACHE
+
 SEASON = '2025-26'
-REQUEST_DELAY = 0.6  # seconds between API calls
+SCHEDULER = FetchScheduler(workers=1, label='nba starters')
 
 PROJECT_ROOT = Path(__file__).parent.parent
 OUT_DIR  = PROJECT_ROOT / 'public' / 'data' / 'nba'
@@ -95,8 +97,8 @@ def canonical_slot(players: list[dict]) -> list[dict]:
 def fetch_league_stats() -> list[dict]:
     """Fetch all player stats for the season, return list of dicts with GS."""
     print('Fetching LeagueDashPlayerStats...')
-    time.sleep(REQUEST_DELAY)
-    resp = LeagueDashPlayerStats(
+    resp = CACHE.fetch(
+        LeagueDashPlayerStats, SCHEDULER,
         season=SEASON,
         per_mode_detailed='PerGame',
         season_type_all_star='Regular Season',
@@ -115,9 +117,8 @@ def fetch_league_stats() -> list[dict]:
 
 def fetch_roster(abbr: str, team_id: int) -> dict[str, dict]:
     """Returns {player_id_str: {number, raw_pos}} for a team."""
-    time.sleep(REQUEST_DELAY)
     try:
-        resp = CommonTeamRoster(team_id=team_id, season=SEASON)
+        resp = CACHE.fetch(CommonTeamRoster, SCHEDULER, team_id=team_id, season=SEASON)
         df = resp.get_data_frames()[0]
         result = {}
         for _, row in df.iterrows():
@@ -163,8 +164,7 @@ def load_bio_lookup() -> dict[str, dict]:
 def fetch_draft_lookup() -> dict:
     """Single DraftHistory call → player_id → overall pick number."""
     print('Fetching DraftHistory (single call)...')
-    time.sleep(REQUEST_DELAY)
-    resp = DraftHistory(league_id='00')
+    resp = CACHE.fetch(DraftHistory, SCHEDULER, league_id='00')
     df = resp.get_data_frames()[0]
     result: dict[str, int | None] = {}
     for _, row in df.iterrows():
@@ -276,6 +276,8 @@ def main() -> None:
         json.dump(result, f, indent=2)
     print(f'\nWrote {OUT_FILE}')
     print('Done.')
+    if '--cache-stats' in sys.argv:
+        CACHE.report()
 
 
 if __name__ == '__main__':
@@ -11,8 +11,13 @@ Output:
   scripts/data/nfl_box_scores/{year}.json   per-season array of game objects
   scripts/data/nfl_box_scores/index.json    { "2015": 142, ..., "2025": 151 }
 
+Seasons are built one at a time (load, join, write {year}.json, update the
+index), so memory is bounded by one season; --workers N builds N seasons at
+once in separate processes.
+
 Run:
     cd scripts && python generate_nfl_box_scores.py
+    cd scripts && python generate_nfl_box_scores.py --workers 4
     cp -r data/nfl_box_scores ../public/data/nfl/box_scores
 """
 
@@ -21,6 +26,8 @@ import json
 import os
 import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional
 
 try:
     import nfl_data_py as nfl
@@ -28,6 +35,16 @@ except ImportError:
     print("ERROR: nfl_data_py not installed. Run: pip install nfl-data-py")
     sys.exit(1)
 
+try:
+    import pandas as pd
+except ImportError:
+    print("ERROR: pandas not installed. Run: pip install pandas pyarrow")
+    sys.exit(1)
+
+import nfl_schema
+import nflverse_loader
+import nflverse_mirror
+
 # ─── Config ───────────────────────────────────────────────────────────────────
 
 YEARS     = list(range(2015, 2026))
@@ -35,6 +52,15 @@ MIN_SCORE = 17   # both teams must reach this to qualify
 
 OUT_DIR = os.path.join(os.path.dirname(__file__), "data", "nfl_box_scores")
 
+# Columns read from the weekly stats / roster files (everything else is skipped)
+WEEKLY_COLUMNS = [
+    "season", "week", "recent_team", "player_id", "player_display_name", "player_name",
+    "completions", "attempts", "passing_yards", "passing_tds", "interceptions",
+    "carries", "rushing_yards", "rushing_tds",
+    "targets", "receptions", "receiving_yards", "receiving_tds",
+]
+JERSEY_COLUMNS = ["player_id", "season", "week", "jersey_number"]
+
 # nfl_data_py sometimes returns older abbreviations — normalise to current
 ALIAS_TO_CURRENT = {
     "LA":  "LAR", "SL": "LAR", "STL": "LAR",
@@ -96,19 +122,289 @@ def safe_bool(val) -> bool:
         return False
 
 
+# Column versions of the helpers above, for whole weekly / schedule frames
+
+def int_col(col):
+    """safe_int over a Series."""
+    return pd.to_numeric(col, errors="coerce").fillna(0).astype("int64")
+
+
+def str_col(col):
+    """safe_str over a Series."""
+    s = col.astype(str).str.strip()
+    return s.where(~s.str.lower().isin(("nan", "none", "")), "")
+
+
+def team_col(col):
+    """normalize_team over a Series."""
+    s = col.astype(str).str.strip().str.upper()
+    s = s.where(~s.isin(("NAN", "NONE", "")), "")
+    return s.replace(ALIAS_TO_CURRENT)
+
+
+# ─── Box score sections ───────────────────────────────────────────────────────
+
+# section → (qualifying count column, {output field: weekly column}); each
+# section lists players with ≥ 1 of its count column, sorted by yards descending
+SECTIONS = {
+    "passing": ("attempts", {
+        "completions": "completions", "attempts": "attempts", "yards": "passing_yards",
+        "tds": "passing_tds", "ints": "interceptions",
+    }),
+    "rushing": ("carries", {
+        "carries": "carries", "yards": "rushing_yards", "tds": "rushing_tds",
+    }),
+    "receiving": ("targets", {
+        "targets": "targets", "receptions": "receptions", "yards": "receiving_yards",
+        "tds": "receiving_tds",
+    }),
+}
+
+
+def schedule_team_index(sched_df):
+    """(season, week, team) → game_id, one row per team per game.
+
+    Where two games share a key the later schedule row wins (its away team
+    after its home team), as the dict this replaces did.
+    """
+    games = pd.DataFrame({
+        "game_id": str_col(sched_df["game_id"]),
+        "season":  int_col(sched_df["season"]),
+        "week":    int_col(sched_df["week"]),
+        "home":    team_col(sched_df["home_team"]),
+        "away":    team_col(sched_df["away_team"]),
+    }).reset_index(drop=True)
+    games = games[games["game_id"] != ""]
+    order = games.index.to_series() * 2
+    long = pd.concat([
+        games[["season", "week", "game_id"]].assign(team=games["home"], order=order),
+        games[["season", "week", "game_id"]].assign(team=games["away"], order=order + 1),
+    ])
+    long = long[long["team"] != ""].sort_values("order", kind="stable")
+    long = long.drop_duplicates(["season", "week", "team"], keep="last")
+    return long[["season", "week", "team", "game_id"]]
+
+
+def jersey_tables(roster_df):
+    """Roster rows → (by week, by season) jersey tables.
+
+    By week keeps the last row per (player_id, season, week); by season the
+    first row per (player_id, season), any week. Rows without an id, season
+    or jersey are dropped. Seasonal rosters have no week column and only
+    fill the season table.
+    """
+    week = int_col(roster_df["week"]) if "week" in roster_df.columns else 0
+    jerseys = pd.DataFrame({
+        "id":     str_col(roster_df["player_id"]),
+        "season": int_col(roster_df["season"]),
+        "week":   week,
+        "number": str_col(roster_df["jersey_number"]),
+    }, index=roster_df.index)
+    jerseys = jerseys[(jerseys["id"] != "") & (jerseys["season"] != 0) & (jerseys["number"] != "")]
+    by_week = jerseys[jerseys["week"] != 0].drop_duplicates(["id", "season", "week"], keep="last")
+    by_season = jerseys.drop_duplicates(["id", "season"], keep="first")
+    return by_week, by_season[["id", "season", "number"]]
+
+
+def resolve_jerseys(players, by_week, by_season):
+    """Jersey per player row: that week's roster entry, else the season's, else ""."""
+    keys = players[["id", "season", "week"]]
+    exact = keys.merge(by_week, on=["id", "season", "week"], how="left")["number"]
+    season = keys.merge(by_season, on=["id", "season"], how="left")["number"]
+    return exact.fillna(season).fillna("").to_numpy()
+
+
+def section_lists(players) -> dict:
+    """{(game_id, side, section): [player dict, ...]} for every qualifying player row."""
+    out: dict = defaultdict(list)
+    for section, (count_col, fields) in SECTIONS.items():
+        rows = players[players[count_col] >= 1]
+        rows = rows.sort_values(fields["yards"], ascending=False, kind="stable")
+        records = rows[["id", "name", "number", *fields.values()]] \
+            .rename(columns={src: dst for dst, src in fields.items()}) \
+            .to_dict("records")
+        for gid, side, rec in zip(rows["game_id"], rows["side"], records):
+            out[(gid, side, section)].append(rec)
+    return out
+
+
+# ─── Per-season build ─────────────────────────────────────────────────────────
+
+def load_weekly(year: int, weeks) -> pd.DataFrame:
+    """One season's weekly player stats, only the weeks that have a qualifying game.
+
+    nflverse moved to a new release layout for 2025+: the old player_stats_{year}.parquet
+    no longer exists, so stats_player_week_{year}.parquet is read instead (the loader
+    normalises its column names: team → recent_team, ...).
+    """
+    where = {"week": [int(w) for w in weeks]}
+    try:
+        df = nflverse_loader.read("player_stats", year, columns=WEEKLY_COLUMNS, where=where)
+    except Exception:
+        df = nflverse_loader.read("stats_player_week", year, columns=WEEKLY_COLUMNS, where=where)
+    return nfl_schema.normalize(df, "weekly_stats")
+
+
+def load_jerseys(year: int):
+    """(by week, by season) jersey tables: weekly rosters (more precise), else seasonal rosters."""
+    try:
+        roster_df = nflverse_loader.read("weekly_rosters", year, columns=JERSEY_COLUMNS)
+    except Exception as e:
+        print(f"  {year}: weekly rosters failed ({e}), trying seasonal rosters...")
+        try:
+            roster_df = nflverse_loader.read("rosters", year, columns=JERSEY_COLUMNS)
+        except Exception as e2:
+            print(f"  {year}: WARNING: Could not load roster data ({e2}). Jersey numbers will be blank.")
+            roster_df = pd.DataFrame(columns=JERSEY_COLUMNS)
+    return jersey_tables(roster_df)
+
+
+def build_season(year: int, sched_df: pd.DataFrame) -> Optional[int]:
+    """Load, join and write {year}.json for one season's qualifying games.
+
+    Returns the number of games written, or None if the season had no player data.
+    Everything loaded for the season is released when this returns.
+    """
+    # Index by game_id for O(1) lookups later
+    sched_by_gid = {safe_str(row.get("game_id")): row for row in sched_df.to_dict("records")}
+    sched_by_gid.pop("", None)
+    # Also (season, week, team) → game_id so we can join weekly_data
+    # (import_weekly_data has no game_id column — join via team+week+season)
+    team_week_gid = schedule_team_index(sched_df)
+
+    # ── Weekly player stats + jersey numbers ──────────────────────────────────
+    weekly_df = load_weekly(year, sched_df["week"].unique())
+    jerseys_by_week, jerseys_by_season = load_jerseys(year)
+
+    # ── Join player rows to game_id via (season, week, recent_team) ───────────
+    keys = pd.DataFrame({
+        "season": int_col(weekly_df["season"]),
+        "week":   int_col(weekly_df["week"]),
+        "team":   team_col(weekly_df["recent_team"]),
+    })
+    matched = keys.merge(team_week_gid, on=["season", "week", "team"], how="left")
+    matched.index = weekly_df.index
+    matched = matched[matched["game_id"].notna()]
+
+    rows = weekly_df.loc[matched.index]
+    display = str_col(rows["player_display_name"])
+    players = matched.assign(
+        id=str_col(rows["player_id"]),
+        name=display.where(display != "", str_col(rows["player_name"])),
+        **{col: int_col(rows[col])
+           for _, fields in SECTIONS.values() for col in fields.values()},
+    )
+    players = players[(players["id"] != "") & (players["name"] != "")]
+
+    # Side from the game's home / away team; a traded / released player with a
+    # stale team matches neither and is skipped
+    home_away = pd.DataFrame(
+        [(gid, normalize_team(r.get("home_team")), normalize_team(r.get("away_team")))
+         for gid, r in sched_by_gid.items()],
+        columns=["game_id", "home_team", "away_team"])
+    players = players.merge(home_away, on="game_id", how="inner")
+    players["side"] = ""
+    players.loc[players["team"] == players["away_team"], "side"] = "away"
+    players.loc[players["team"] == players["home_team"], "side"] = "home"
+    players = players[players["side"] != ""]
+
+    players["number"] = resolve_jerseys(players, jerseys_by_week, jerseys_by_season)
+
+    sections = section_lists(players)
+    # Games in order of their first player row
+    season_games = list(players.groupby("game_id", sort=False)["season"].first().index)
+    if not season_games:
+        print(f"  {year}: no data — skipping")
+        return None
+
+    # ── Build JSON ────────────────────────────────────────────────────────────
+    output_games = []
+
+    for gid in season_games:
+        sched_row = sched_by_gid.get(gid)
+        if sched_row is None:
+            continue
+
+        home_team = normalize_team(sched_row.get("home_team"))
+        away_team = normalize_team(sched_row.get("away_team"))
+        week      = safe_int(sched_row.get("week"))
+
+        # Sections already filtered (≥ 1 attempt / carry / target) and sorted by yards
+        box: dict = {
+            side: {section: sections.get((gid, side, section), []) for section in SECTIONS}
+            for side in ("home", "away")
+        }
+
+        # Skip games where we got zero player rows (data gap)
+        total_players = sum(
+            len(box[s][cat])
+            for s in ("home", "away")
+            for cat in ("passing", "rushing", "receiving")
+        )
+        if total_players == 0:
+            continue
+
+        game_obj = {
+            "game_id":    gid,
+            "season":     year,
+            "week":       week,
+            "game_type":  safe_str(sched_row.get("game_type"), "REG"),
+            "gameday":    safe_str(sched_row.get("gameday")),
+            "home_team":  home_team,
+            "away_team":  away_team,
+            "home_score": safe_int(sched_row.get("home_score")),
+            "away_score": safe_int(sched_row.get("away_score")),
+            "stadium":    safe_str(sched_row.get("stadium")),
+            "roof":       safe_str(sched_row.get("roof")),
+            "surface":    safe_str(sched_row.get("surface")),
+            "temp":       safe_int(sched_row.get("temp")) if safe_str(sched_row.get("temp")) else None,
+            "wind":       safe_int(sched_row.get("wind")) if safe_str(sched_row.get("wind")) else None,
+            "overtime":   safe_bool(sched_row.get("overtime")),
+            "spread_line": safe_float(sched_row.get("spread_line")),
+            "home_coach": safe_str(sched_row.get("home_coach")),
+            "away_coach": safe_str(sched_row.get("away_coach")),
+            "referee":    safe_str(sched_row.get("referee")),
+            "box_score":  box,
+        }
+        output_games.append(game_obj)
+
+    # Sort by week, then gameday
+    output_games.sort(key=lambda g: (g["week"], g["gameday"]))
+
+    out_path = os.path.join(OUT_DIR, f"{year}.json")
+    with open(out_path, "w") as f:
+        json.dump(output_games, f, separators=(",", ":"))
+
+    size_kb = os.path.getsize(out_path) / 1024
+    print(f"  {year}: {len(weekly_df)} player-week rows, {len(matched)} matched to qualifying games, "
+          f"{len(jerseys_by_week)} jerseys → {len(output_games)} games, {size_kb:.0f} KB")
+    return len(output_games)
+
+
+def write_index(index_path: str, index: dict) -> None:
+    tmp = index_path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(dict(sorted(index.items())), f, separators=(",", ":"))
+    os.replace(tmp, index_path)
+
+
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--year", type=int, default=None,
                         help="Only generate data for this single year (merges into existing index)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Build this many seasons at once in worker processes (default: 1)")
+    nflverse_mirror.add_arguments(parser)
     args = parser.parse_args()
+    nflverse_mirror.install()
 
     years = [args.year] if args.year else YEARS
 
     os.makedirs(OUT_DIR, exist_ok=True)
 
-    # ── 1. Schedules ──────────────────────────────────────────────────────────
+    # ── 1. Schedules (one small file for every season) ────────────────────────
     print(f"Loading schedules ({years[0]}–{years[-1]})...")
     sched_df = nfl.import_schedules(years)
     print(f"  Total rows: {len(sched_df)}")
@@ -119,118 +415,7 @@ def main():
         (sched_df["away_score"] >= MIN_SCORE)
     ].copy()
     print(f"  Qualifying games (both ≥ {MIN_SCORE} pts): {len(sched_df)}")
-
-    qualifying_ids = set(sched_df["game_id"].astype(str))
-
-    # Index by game_id for O(1) lookups later
-    sched_by_gid: dict = {}
-    # Also build (season, week, team) → game_id so we can join weekly_data
-    # (import_weekly_data has no game_id column — join via team+week+season)
-    team_week_to_gid: dict[tuple, str] = {}
-    for _, row in sched_df.iterrows():
-        gid  = safe_str(row.get("game_id"))
-        if not gid:
-            continue
-        sched_by_gid[gid] = row
-        season = safe_int(row.get("season"))
-        week   = safe_int(row.get("week"))
-        home   = normalize_team(row.get("home_team"))
-        away   = normalize_team(row.get("away_team"))
-        if home:
-            team_week_to_gid[(season, week, home)] = gid
-        if away:
-            team_week_to_gid[(season, week, away)] = gid
-
-    # ── 2. Weekly player stats ─────────────────────────────────────────────────
-    # nflverse moved to a new release layout for 2025+: the old player_stats_{year}.parquet
-    # no longer exists; use stats_player_week_{year}.parquet and normalise column names.
-    print(f"\nLoading weekly player stats ({years[0]}–{years[-1]})...")
-    import pandas as pd
-    OLD_URL = r'https://github.com/nflverse/nflverse-data/releases/download/player_stats/player_stats_{0}.parquet'
-    NEW_URL = r'https://github.com/nflverse/nflverse-data/releases/download/stats_player/stats_player_week_{0}.parquet'
-
-    def load_weekly_for_year(yr):
-        try:
-            df = pd.read_parquet(OLD_URL.format(yr))
-        except Exception:
-            df = pd.read_parquet(NEW_URL.format(yr))
-            # Normalise new column names to match what the rest of the script expects
-            renames = {}
-            if "team" in df.columns and "recent_team" not in df.columns:
-                renames["team"] = "recent_team"
-            if "passing_interceptions" in df.columns and "interceptions" not in df.columns:
-                renames["passing_interceptions"] = "interceptions"
-            if renames:
-                df = df.rename(columns=renames)
-        return df
-
-    weekly_df = pd.concat([load_weekly_for_year(yr) for yr in years], ignore_index=True)
-    print(f"  Total player-week rows: {len(weekly_df)}")
-
-    # ── 3. Jersey numbers ─────────────────────────────────────────────────────
-    # Try weekly rosters first (more precise), fall back to seasonal rosters.
-    # jersey_map_precise: (player_id, season, week) → "15"
-    # jersey_map_season:  (player_id, season)       → "15"   (any week)
-    jersey_map_precise: dict[tuple, str] = {}
-    jersey_map_season:  dict[tuple, str] = {}
-
-    def ingest_roster_df(df):
-        for _, row in df.iterrows():
-            pid     = safe_str(row.get("player_id") or row.get("gsis_id"))
-            season  = safe_int(row.get("season"))
-            jersey  = safe_str(row.get("jersey_number"))
-            if not pid or not season or not jersey:
-                continue
-            week = safe_int(row.get("week"), default=0)
-            if week:
-                jersey_map_precise[(pid, season, week)] = jersey
-            # Always populate the seasonal fallback
-            if (pid, season) not in jersey_map_season:
-                jersey_map_season[(pid, season)] = jersey
-
-    print(f"\nLoading roster / jersey data ({years[0]}–{years[-1]})...")
-    try:
-        roster_df = nfl.import_weekly_rosters(years)
-        print(f"  Weekly rosters loaded: {len(roster_df)} rows")
-        ingest_roster_df(roster_df)
-    except Exception as e:
-        print(f"  import_weekly_rosters failed ({e}), trying import_seasonal_rosters...")
-        try:
-            roster_df = nfl.import_seasonal_rosters(years)
-            print(f"  Seasonal rosters loaded: {len(roster_df)} rows")
-            ingest_roster_df(roster_df)
-        except Exception as e2:
-            print(f"  WARNING: Could not load roster data ({e2}). Jersey numbers will be blank.")
-
-    print(f"  Jersey entries (precise): {len(jersey_map_precise)}")
-    print(f"  Jersey entries (season):  {len(jersey_map_season)}")
-
-    def get_jersey(pid: str, season: int, week: int) -> str:
-        return (
-            jersey_map_precise.get((pid, season, week)) or
-            jersey_map_season.get((pid, season)) or
-            ""
-        )
-
-    # ── 4. Group player rows by (season, game_id) ─────────────────────────────
-    # weekly_data has no game_id — resolve via (season, week, recent_team)
-    games_by_season: dict[int, dict[str, list]] = defaultdict(lambda: defaultdict(list))
-    skipped_no_game = 0
-    for _, row in weekly_df.iterrows():
-        season = safe_int(row.get("season"))
-        week   = safe_int(row.get("week"))
-        team   = normalize_team(row.get("recent_team"))
-        gid    = team_week_to_gid.get((season, week, team))
-        if not gid:
-            skipped_no_game += 1
-            continue
-        games_by_season[season][gid].append(row)
-    print(f"  Player rows matched to qualifying games: "
-          f"{sum(len(v) for s in games_by_season.values() for v in s.values())}"
-          f"  (skipped {skipped_no_game} — no qualifying game match)")
-
-    # ── 5. Build JSON per season ───────────────────────────────────────────────
-    print("\nBuilding box score files...")
+    sched_by_year = {int(y): g for y, g in sched_df.groupby(sched_df["season"].astype(int))}
 
     # When running for a single year, load the existing index so we don't wipe other years
     index_path = os.path.join(OUT_DIR, "index.json")
@@ -240,144 +425,39 @@ def main():
     else:
         index = {}
 
+    # ── 2. One season at a time: load → join → write {year}.json → index ─────
+    # Only one season's weekly stats and rosters are held per process.
+    print("\nBuilding box score files...")
+
+    def done(year, n_games):
+        if n_games is not None:
+            index[str(year)] = n_games
+            write_index(index_path, index)
+
+    todo = []
     for year in years:
-        season_games = games_by_season.get(year, {})
-        if not season_games:
+        if year not in sched_by_year:
             print(f"  {year}: no data — skipping")
-            continue
+        else:
+            todo.append(year)
+
+    workers = max(1, min(args.workers, len(todo)))
+    if workers == 1:
+        for year in todo:
+            done(year, build_season(year, sched_by_year[year]))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=nflverse_mirror.install) as pool:
+            futures = {pool.submit(build_season, year, sched_by_year[year]): year for year in todo}
+            for future in as_completed(futures):
+                done(futures[future], future.result())
 
-        output_games = []
-
-        for gid, player_rows in season_games.items():
-            sched_row = sched_by_gid.get(gid)
-            if sched_row is None:
-                continue
-
-            home_team = normalize_team(sched_row.get("home_team"))
-            away_team = normalize_team(sched_row.get("away_team"))
-            week      = safe_int(sched_row.get("week"))
-
-            # Initialise empty box score
-            box: dict = {
-                "home": {"passing": [], "rushing": [], "receiving": []},
-                "away": {"passing": [], "rushing": [], "receiving": []},
-            }
-
-            for row in player_rows:
-                pid  = safe_str(row.get("player_id"))
-                name = safe_str(
-                    row.get("player_display_name") or row.get("player_name")
-                )
-                if not pid or not name:
-                    continue
-
-                player_team = normalize_team(row.get("recent_team"))
-                if player_team == home_team:
-                    side = "home"
-                elif player_team == away_team:
-                    side = "away"
-                else:
-                    # Traded / released player with stale team — skip
-                    continue
-
-                jersey = get_jersey(pid, year, week)
-
-                # Passing — ≥ 1 attempt
-                attempts = safe_int(row.get("attempts"))
-                if attempts >= 1:
-                    box[side]["passing"].append({
-                        "id":          pid,
-                        "name":        name,
-                        "number":      jersey,
-                        "completions": safe_int(row.get("completions")),
-                        "attempts":    attempts,
-                        "yards":       safe_int(row.get("passing_yards")),
-                        "tds":         safe_int(row.get("passing_tds")),
-                        "ints":        safe_int(row.get("interceptions")),
-                    })
-
-                # Rushing — ≥ 1 carry
-                carries = safe_int(row.get("carries"))
-                if carries >= 1:
-                    box[side]["rushing"].append({
-                        "id":     pid,
-                        "name":   name,
-                        "number": jersey,
-                        "carries": carries,
-                        "yards":  safe_int(row.get("rushing_yards")),
-                        "tds":    safe_int(row.get("rushing_tds")),
-                    })
-
-                # Receiving — ≥ 1 target
-                targets = safe_int(row.get("targets"))
-                if targets >= 1:
-                    box[side]["receiving"].append({
-                        "id":         pid,
-                        "name":       name,
-                        "number":     jersey,
-                        "targets":    targets,
-                        "receptions": safe_int(row.get("receptions")),
-                        "yards":      safe_int(row.get("receiving_yards")),
-                        "tds":        safe_int(row.get("receiving_tds")),
-                    })
-
-            # Sort each section by yards descending
-            for side in ("home", "away"):
-                box[side]["passing"].sort(key=lambda p: p["yards"], reverse=True)
-                box[side]["rushing"].sort(key=lambda p: p["yards"], reverse=True)
-                box[side]["receiving"].sort(key=lambda p: p["yards"], reverse=True)
-
-            # Skip games where we got zero player rows (data gap)
-            total_players = sum(
-                len(box[s][cat])
-                for s in ("home", "away")
-                for cat in ("passing", "rushing", "receiving")
-            )
-            if total_players == 0:
-                continue
-
-            game_obj = {
-                "game_id":    gid,
-                "season":     year,
-                "week":       week,
-                "game_type":  safe_str(sched_row.get("game_type"), "REG"),
-                "gameday":    safe_str(sched_row.get("gameday")),
-                "home_team":  home_team,
-                "away_team":  away_team,
-                "home_score": safe_int(sched_row.get("home_score")),
-                "away_score": safe_int(sched_row.get("away_score")),
-                "stadium":    safe_str(sched_row.get("stadium")),
-                "roof":       safe_str(sched_row.get("roof")),
-                "surface":    safe_str(sched_row.get("surface")),
-                "temp":       safe_int(sched_row.get("temp")) if safe_str(sched_row.get("temp")) else None,
-                "wind":       safe_int(sched_row.get("wind")) if safe_str(sched_row.get("wind")) else None,
-                "overtime":   safe_bool(sched_row.get("overtime")),
-                "spread_line": safe_float(sched_row.get("spread_line")),
-                "home_coach": safe_str(sched_row.get("home_coach")),
-                "away_coach": safe_str(sched_row.get("away_coach")),
-                "referee":    safe_str(sched_row.get("referee")),
-                "box_score":  box,
-            }
-            output_games.append(game_obj)
-
-        # Sort by week, then gameday
-        output_games.sort(key=lambda g: (g["week"], g["gameday"]))
-
-        out_path = os.path.join(OUT_DIR, f"{year}.json")
-        with open(out_path, "w") as f:
-            json.dump(output_games, f, separators=(",", ":"))
-
-        size_kb = os.path.getsize(out_path) / 1024
-        print(f"  {year}: {len(output_games)} games → {size_kb:.0f} KB")
-        index[str(year)] = len(output_games)
-
-    # ── 6. Index file ─────────────────────────────────────────────────────────
-    with open(index_path, "w") as f:
-        json.dump(index, f, separators=(",", ":"))
+    write_index(index_path, index)
 
     total = sum(index.values())
     print(f"\nIndex → {index_path}")
     print(f"Seasons generated: {len(index)}  |  Total qualifying games: {total}")
+    if workers == 1:
+        nfl_schema.report()
     print(f"\nCopy to public/:\n  cp -r data/nfl_box_scores ../public/data/nfl/box_scores")
 
 
@@ -15,18 +15,16 @@ import json
 import os
 import sys
 
-try:
-    import nfl_data_py as nfl
-except ImportError:
-    print("ERROR: nfl_data_py not installed. Run: pip install nfl-data-py")
-    sys.exit(1)
-
 try:
     import pandas as pd
 except ImportError:
     print("ERROR: pandas not installed. Run: pip install pandas pyarrow")
     sys.exit(1)
 
+import nflverse_mirror
+from nflverse_loader import CAREER_ROSTER_COLUMNS
+from nfl_session import NFLBuildSession
+
 # ─── Config ──────────────────────────────────────────────────────────────────
 
 YEARS = list(range(1999, 2025))
@@ -107,65 +105,15 @@ def safe_str(val, default=""):
     return default if s in ("nan", "None", "") else s
 
 
-def col_sum(df, col):
-    if col not in df.columns:
-        return 0
-    total = df[col].fillna(0).sum()
-    return int(total) if total == total else 0
-
-
-# ─── Stats loader (handles 2025 via nflverse-data direct parquet) ─────────────
-
-NFLVERSE_STATS_URL = (
-    "https://github.com/nflverse/nflverse-data/releases/download/"
-    "stats_player/stats_player_reg_{year}.parquet"
-)
-
-def load_seasonal_stats(years):
-    """Load seasonal stats for all years.
-    - Years ≤ 2024: via nfl_data_py (works reliably)
-    - Years ≥ 2025: direct parquet fetch from nflverse-data releases
-    Normalises column names so both sources share 'interceptions' for QB ints.
-    """
-    legacy_years = [y for y in years if y <= 2024]
-    new_years    = [y for y in years if y >= 2025]
-
-    frames = []
-
-    if legacy_years:
-        df = nfl.import_seasonal_data(legacy_years)
-        if df is not None and not df.empty:
-            frames.append(df)
-
-    for year in new_years:
-        url = NFLVERSE_STATS_URL.format(year=year)
-        print(f"  Fetching {year} stats from nflverse-data ({url})...")
-        try:
-            df = pd.read_parquet(url)
-            # Normalise column: new format uses 'passing_interceptions', old used 'interceptions'
-            if "passing_interceptions" in df.columns and "interceptions" not in df.columns:
-                df = df.rename(columns={"passing_interceptions": "interceptions"})
-            # 'games' is the GP column in both formats — no rename needed
-            frames.append(df)
-            print(f"    → {len(df)} rows loaded for {year}")
-        except Exception as e:
-            print(f"  WARNING: Could not fetch {year} stats: {e}")
-
-    if not frames:
-        return None
-
-    combined = pd.concat(frames, ignore_index=True)
-    return combined
-
-
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
-def main():
+def build(session: NFLBuildSession) -> list:
+    """Build nfl_careers.json from the session's rosters and stats; returns the careers list."""
     os.makedirs(os.path.dirname(OUT_PATH), exist_ok=True)
 
     # ── Load data ──────────────────────────────────────────────────────────────
     print(f"Loading roster data ({YEARS[0]}–{YEARS[-1]})...")
-    roster_df = nfl.import_seasonal_rosters(YEARS)
+    roster_df = session.load("rosters", YEARS, columns=CAREER_ROSTER_COLUMNS)
     if roster_df is None or roster_df.empty:
         print("ERROR: Failed to load roster data")
         sys.exit(1)
@@ -173,7 +121,7 @@ def main():
     print(f"  Roster rows: {len(roster_df)}")
 
     print(f"Loading seasonal stats ({YEARS[0]}–{YEARS[-1]})...")
-    stats_df = load_seasonal_stats(YEARS)
+    stats_df = session.seasonal_stats(YEARS)
     if stats_df is None or stats_df.empty:
         print("ERROR: Failed to load stats data")
         sys.exit(1)
@@ -189,40 +137,55 @@ def main():
     all_pids = roster_df["player_id"].unique()
     print(f"\nScanning {len(all_pids)} unique player IDs...")
 
+    # One stable sort + groupby per frame instead of a full-column mask per
+    # player. Positional indexes point each player at their season-ordered rows.
+    roster_sorted  = roster_df.sort_values(["player_id", "season"], kind="mergesort")
+    roster_rows    = roster_sorted.to_dict("records")
+    roster_index   = roster_sorted.groupby("player_id", sort=False).indices
+
+    # Position: first career position in season order
+    skill_rows     = roster_sorted[roster_sorted["position"].isin(CAREER_POSITIONS)]
+    first_position = skill_rows.groupby("player_id", sort=False)["position"].first().to_dict()
+
+    stats_sorted   = stats_df.sort_values(["player_id", "season"], kind="mergesort")
+    stats_rows     = stats_sorted.to_dict("records")
+    stats_index    = stats_sorted.groupby("player_id", sort=False).indices
+
+    # Production: career yardage totals per player
+    yard_cols  = ["rushing_yards", "receiving_yards", "passing_yards"]
+    production = pd.DataFrame({
+        col: stats_sorted[col].fillna(0) if col in stats_sorted.columns else 0
+        for col in yard_cols
+    }).groupby(stats_sorted["player_id"]).sum()
+    meets_production = (
+        (production["rushing_yards"] >= MIN_RUSH_YDS)
+        | (production["receiving_yards"] >= MIN_REC_YDS)
+        | (production["passing_yards"] >= MIN_PASS_YDS)
+    ).to_dict()
+
     for pid in all_pids:
-        roster_group = roster_df[roster_df["player_id"] == pid].sort_values("season")
+        roster_pos = roster_index.get(pid, ())
 
         # Need 5+ seasons in roster
-        if len(roster_group) < MIN_SEASONS:
+        if len(roster_pos) < MIN_SEASONS:
             skipped_seasons += 1
             continue
 
         # Determine position (first match in priority order)
-        positions = roster_group["position"].dropna().unique()
-        player_pos = None
-        for p in positions:
-            if p in CAREER_POSITIONS:
-                player_pos = p
-                break
+        player_pos = first_position.get(pid)
         if not player_pos:
             skipped_position += 1
             continue
 
         # Production filter — requires real stats
-        player_stats = stats_df[stats_df["player_id"] == pid].sort_values("season")
-        if player_stats.empty:
-            skipped_production += 1
-            continue
-
-        rush_yds = col_sum(player_stats, "rushing_yards")
-        rec_yds  = col_sum(player_stats, "receiving_yards")
-        pass_yds = col_sum(player_stats, "passing_yards")
-        if rush_yds < MIN_RUSH_YDS and rec_yds < MIN_REC_YDS and pass_yds < MIN_PASS_YDS:
+        stats_pos = stats_index.get(pid, ())
+        if len(stats_pos) == 0 or not meets_production.get(pid, False):
             skipped_production += 1
             continue
 
         # Player name from most recent roster row
-        latest_roster = roster_group.iloc[-1]
+        roster_group  = [roster_rows[i] for i in roster_pos]
+        latest_roster = roster_group[-1]
         name = safe_str(latest_roster.get("player_name"))
         if not name:
             skipped_name += 1
@@ -230,7 +193,7 @@ def main():
 
         # Build season-by-season lookup from roster
         roster_by_season = {}
-        for _, rrow in roster_group.iterrows():
+        for rrow in roster_group:
             s = rrow.get("season")
             try:
                 roster_by_season[int(float(s))] = rrow
@@ -239,7 +202,7 @@ def main():
 
         # Build seasons array
         seasons = []
-        for _, row in player_stats.iterrows():
+        for row in (stats_rows[i] for i in stats_pos):
             season_year = safe_int(row.get("season"))
             rrow = roster_by_season.get(season_year)
             if rrow is not None:
@@ -335,6 +298,16 @@ def main():
     size_kb = os.path.getsize(OUT_PATH) / 1024
     print(f"\nWritten: {OUT_PATH}  ({size_kb:.1f} KB)")
 
+    session.outputs["nfl_careers"] = careers
+    return careers
+
+
+def main():
+    nflverse_mirror.install()
+    session = NFLBuildSession()
+    build(session)
+    session.report()
+
 
 if __name__ == "__main__":
     main()
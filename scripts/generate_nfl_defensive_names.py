@@ -27,11 +27,15 @@ except ImportError:
     print("ERROR: nfl_data_py not installed. Run: pip install nfl-data-py pandas")
     sys.exit(1)
 
+import nflverse_mirror
+from nfl_session import NFLBuildSession
+
 # ─── Config ───────────────────────────────────────────────────────────────────
 
 ROSTER_YEARS       = list(range(2002, 2025))
 DEFENSIVE_POSITIONS = {"DB", "DL", "LB"}   # broad position groups in roster data
 MIN_SEASONS         = 5
+ROSTER_COLUMNS      = ["player_id", "player_name", "season", "position", "pfr_id"]
 
 # PFR position normalisation
 PASS_RUSHER_POS = {"DE", "RDE", "LDE", "LOLB", "ROLB", "OLB"}
@@ -90,12 +94,13 @@ def is_pfr_notable(row) -> bool:
 
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
-def main():
+def build(session: NFLBuildSession) -> list:
+    """Build nfl_defensive_names.json; returns the sorted name list."""
     os.makedirs(os.path.dirname(OUT_PATH), exist_ok=True)
 
     # ── Roster: 5+ seasons + defensive position ───────────────────────────────
     print(f"Loading roster data ({ROSTER_YEARS[0]}–{ROSTER_YEARS[-1]})...")
-    roster_df = nfl.import_seasonal_rosters(ROSTER_YEARS)
+    roster_df = session.load("rosters", ROSTER_YEARS, columns=ROSTER_COLUMNS)
     if roster_df is None or roster_df.empty:
         print("ERROR: Failed to load roster data")
         sys.exit(1)
@@ -192,6 +197,16 @@ def main():
     for n in names_list[:20]:
         print(f"  {n}")
 
+    session.outputs["nfl_defensive_names"] = names_list
+    return names_list
+
+
+def main():
+    nflverse_mirror.install()
+    session = NFLBuildSession()
+    build(session)
+    session.report()
+
 
 if __name__ == "__main__":
     main()
@@ -23,6 +23,8 @@ import io
 import requests
 from pathlib import Path
 
+import nflverse_mirror
+
 ROOT = Path(__file__).parent.parent
 PUBLIC_DATA = ROOT / "public" / "data"
 
@@ -58,12 +60,19 @@ def fetch_headshot_map(our_ids: set[str]) -> dict[str, str]:
     Prefers ESPN CDN URL when espn_id is available — more stable for retired players.
     Falls back to the nflverse Cloudinary URL when no espn_id exists.
     """
-    print(f"\nFetching nflverse players.csv from GitHub...")
-    resp = requests.get(NFLVERSE_PLAYERS_URL, timeout=60)
-    resp.raise_for_status()
-    print(f"  Downloaded {len(resp.content) / 1024:.0f} KB")
-
-    reader = csv.DictReader(io.StringIO(resp.text))
+    mirror = nflverse_mirror.open_mirror()
+    if mirror is not None:
+        print(f"\nReading nflverse players.csv (local mirror)...")
+        with open(mirror.local_path(NFLVERSE_PLAYERS_URL), encoding="utf-8") as f:
+            text = f.read()
+    else:
+        print(f"\nFetching nflverse players.csv from GitHub...")
+        resp = requests.get(NFLVERSE_PLAYERS_URL, timeout=60)
+        resp.raise_for_status()
+        text = resp.text
+    print(f"  {len(text) / 1024:.0f} KB")
+
+    reader = csv.DictReader(io.StringIO(text))
     mapping: dict[str, str] = {}
     total_rows = 0
     espn_count = 0
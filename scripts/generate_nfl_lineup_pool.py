@@ -29,18 +29,17 @@ import json
 import os
 import sys
 
-try:
-    import nfl_data_py as nfl
-except ImportError:
-    print("ERROR: nfl_data_py not installed. Run: pip install nfl-data-py")
-    sys.exit(1)
-
 try:
     import pandas as pd
 except ImportError:
     print("ERROR: pandas not installed. Run: pip install pandas pyarrow")
     sys.exit(1)
 
+import nflverse_mirror
+from nflverse_loader import CAREER_ROSTER_COLUMNS
+from nfl_session import NFLBuildSession
+from nfl_snap_counts import normalize_name
+
 # ─── Config ──────────────────────────────────────────────────────────────────
 
 YEARS = list(range(2010, 2026))   # 2010–2025; covers recent career histories
@@ -126,114 +125,158 @@ def safe_str(val, default=""):
     return default if s in ("nan", "None", "") else s
 
 
-def col_sum(df, col):
-    if col not in df.columns:
-        return 0
-    total = df[col].fillna(0).sum()
-    return int(total) if total == total else 0
+def season_flags(stats_df, skill_pos):
+    """Per-stats-row booleans: single-season threshold met, and recent (2024/2025) appearance.
 
-
-# ─── Stats loader (handles 2025 via nflverse-data direct parquet) ─────────────
-
-NFLVERSE_STATS_URL = (
-    "https://github.com/nflverse/nflverse-data/releases/download/"
-    "stats_player/stats_player_reg_{year}.parquet"
-)
-
-def load_seasonal_stats(years):
-    """Load seasonal stats for all years.
-    - Years ≤ 2024: via nfl_data_py
-    - Years ≥ 2025: direct parquet from nflverse-data releases
-    Normalises 'passing_interceptions' → 'interceptions' for consistency.
+    skill_pos maps player_id → career position. Recent seasons get lower
+    thresholds to capture emerging players:
+      RB 2023–2025: 200 rush yds (down from 400)
+      WR/TE 2024–2025: 250 rec yds (down from 400/300)
     """
-    legacy_years = [y for y in years if y <= 2024]
-    new_years    = [y for y in years if y >= 2025]
+    season = pd.to_numeric(stats_df["season"], errors="coerce").fillna(0)
+    pos    = stats_df["player_id"].map(skill_pos)
+    zero   = pd.Series(0.0, index=stats_df.index)
 
-    frames = []
+    def col(name):
+        return stats_df[name] if name in stats_df.columns else zero
 
-    if legacy_years:
-        df = nfl.import_seasonal_data(legacy_years)
-        if df is not None and not df.empty:
-            frames.append(df)
+    single = pd.Series(False, index=stats_df.index)
+    for position, thresholds in MIN_SINGLE_SEASON.items():
+        for stat, min_val in thresholds.items():
+            if stat not in stats_df.columns:
+                continue
+            effective_min = pd.Series(float(min_val), index=stats_df.index)
+            if position == "RB" and stat == "rushing_yards":
+                effective_min[season.isin((2023, 2024, 2025))] = 200
+            elif position in ("WR", "TE") and stat == "receiving_yards":
+                effective_min[season.isin((2024, 2025))] = 250
+            single |= (pos == position) & (col(stat) >= effective_min)
 
-    for year in new_years:
-        url = NFLVERSE_STATS_URL.format(year=year)
-        print(f"  Fetching {year} stats from nflverse-data ({url})...")
-        try:
-            df = pd.read_parquet(url)
-            if "passing_interceptions" in df.columns and "interceptions" not in df.columns:
-                df = df.rename(columns={"passing_interceptions": "interceptions"})
-            frames.append(df)
-            print(f"    → {len(df)} rows loaded for {year}")
-        except Exception as e:
-            print(f"  WARNING: Could not fetch {year} stats: {e}")
+    recent = season.isin((2024, 2025)) & (col("games") >= 1)
+    return single, recent
 
-    if not frames:
-        return None
 
-    return pd.concat(frames, ignore_index=True)
+def career_totals(stats_df):
+    """Career passing and rushing+receiving yards per player (truncated like the per-season ints)."""
+    def total(name):
+        if name not in stats_df.columns:
+            return pd.Series(0, index=stats_df["player_id"].unique())
+        return stats_df[name].fillna(0).groupby(stats_df["player_id"]).sum().astype("int64")
 
+    return total("passing_yards"), total("rushing_yards") + total("receiving_yards")
 
-def meets_career_total_threshold(player_stats, position):
-    """Return True if the player meets minimum career production thresholds.
-    QB: career passing_yards >= 1000
-    RB/WR/TE: career (rushing_yards + receiving_yards) >= 300
-    """
-    if position == "QB":
-        return col_sum(player_stats, "passing_yards") >= 1000
-    elif position in ("RB", "WR", "TE"):
-        return col_sum(player_stats, "rushing_yards") + col_sum(player_stats, "receiving_yards") >= 300
-    return False
 
+def first_position_in(roster_sorted, positions):
+    """player_id → first position (in season order) belonging to the given set."""
+    rows = roster_sorted[roster_sorted["position"].isin(positions)]
+    return rows.groupby("player_id", sort=False)["position"].first().to_dict()
 
-def has_recent_season(player_stats):
-    """Return True if the player appeared in any 2024 or 2025 game."""
-    for _, row in player_stats.iterrows():
-        if safe_int(row.get("season", 0)) in (2024, 2025) and safe_int(row.get("games", 0)) >= 1:
-            return True
-    return False
 
+def build_bio(latest_roster):
+    height_str = ""
+    height_val = latest_roster.get("height")
+    if height_val and safe_str(height_val):
+        try:
+            inches = int(float(height_val))
+            height_str = f"{inches // 12}-{inches % 12}"
+        except (ValueError, TypeError):
+            height_str = safe_str(height_val)
+
+    return {
+        "height":       height_str,
+        "weight":       safe_int(latest_roster.get("weight")),
+        "college":      safe_str(latest_roster.get("college")),
+        "years_exp":    safe_int(latest_roster.get("years_exp")),
+        "draft_club":   safe_str(latest_roster.get("draft_club")),
+        "draft_number": safe_int(latest_roster.get("draft_number")),
+    }
+
+
+def roster_seasons(roster_group):
+    """season → roster row (later rows win, as before)."""
+    roster_by_season = {}
+    for rrow in roster_group:
+        s = rrow.get("season")
+        try:
+            roster_by_season[int(float(s))] = rrow
+        except (ValueError, TypeError):
+            pass
+    return roster_by_season
+
+
+def skill_seasons(stat_rows, roster_by_season, player_pos):
+    """Seasons array for a skill player — same shape as nfl_careers.json."""
+    seasons = []
+    for row in stat_rows:
+        season_year = safe_int(row.get("season"))
+        rrow = roster_by_season.get(season_year)
+        team = safe_str(rrow.get("team"), "???") if rrow is not None else safe_str(row.get("recent_team"), "???")
+
+        base = {
+            "season": str(season_year),
+            "team": team,
+            "gp": safe_int(row.get("games")),
+        }
 
-def meets_single_season_threshold(player_stats, position):
-    """Return True if the player hit the per-season minimum in any one season.
-    Recent seasons get lower thresholds to capture emerging players:
-      RB 2023–2025: 200 rush yds (down from 400)
-      WR/TE 2024–2025: 250 rec yds (down from 400/300)
-    """
-    thresholds = MIN_SINGLE_SEASON.get(position, {})
-    if not thresholds:
-        return False
-
-    for _, row in player_stats.iterrows():
-        season_year = safe_int(row.get("season", 0))
-        for col, min_val in thresholds.items():
-            if col in player_stats.columns:
-                effective_min = min_val
-                if position == "RB" and col == "rushing_yards" and season_year in (2023, 2024, 2025):
-                    effective_min = 200
-                elif position in ("WR", "TE") and col == "receiving_yards" and season_year in (2024, 2025):
-                    effective_min = 250
-                val = safe_int(row.get(col, 0))
-                if val >= effective_min:
-                    return True
-    return False
+        if player_pos == "QB":
+            base.update({
+                "completions":     safe_int(row.get("completions")),
+                "attempts":        safe_int(row.get("attempts")),
+                "passing_yards":   safe_int(row.get("passing_yards")),
+                "passing_tds":     safe_int(row.get("passing_tds")),
+                "interceptions":   safe_int(row.get("interceptions")),
+                "rushing_yards":   safe_int(row.get("rushing_yards")),
+                "rushing_tds":     safe_int(row.get("rushing_tds")),
+                "receptions":      safe_int(row.get("receptions")),
+                "receiving_yards": safe_int(row.get("receiving_yards")),
+                "receiving_tds":   safe_int(row.get("receiving_tds")),
+            })
+        elif player_pos == "RB":
+            base.update({
+                "carries":         safe_int(row.get("carries")),
+                "rushing_yards":   safe_int(row.get("rushing_yards")),
+                "rushing_tds":     safe_int(row.get("rushing_tds")),
+                "receptions":      safe_int(row.get("receptions")),
+                "receiving_yards": safe_int(row.get("receiving_yards")),
+                "receiving_tds":   safe_int(row.get("receiving_tds")),
+                "passing_yards":   safe_int(row.get("passing_yards")),
+                "passing_tds":     safe_int(row.get("passing_tds")),
+            })
+        else:  # WR / TE
+            base.update({
+                "targets":         safe_int(row.get("targets")),
+                "receptions":      safe_int(row.get("receptions")),
+                "receiving_yards": safe_int(row.get("receiving_yards")),
+                "receiving_tds":   safe_int(row.get("receiving_tds")),
+                "rushing_yards":   safe_int(row.get("rushing_yards")),
+                "rushing_tds":     safe_int(row.get("rushing_tds")),
+                "passing_yards":   safe_int(row.get("passing_yards")),
+                "passing_tds":     safe_int(row.get("passing_tds")),
+            })
+
+        seasons.append(base)
+    return seasons
 
 
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
-def main():
+def build(session: NFLBuildSession) -> list:
+    """Build nfl_lineup_pool.json; uses the careers stage's output when it ran in this session."""
     os.makedirs(os.path.dirname(OUT_PATH), exist_ok=True)
 
     CAREERS_PATH = os.path.join(os.path.dirname(__file__), "data", "nfl_careers.json")
     careers_ids = set()
-    if os.path.exists(CAREERS_PATH):
+    if "nfl_careers" in session.outputs:
+        careers_ids = {str(p["player_id"]) for p in session.outputs["nfl_careers"]}
+        print(f"  {len(careers_ids)} player IDs from this build's nfl_careers (will skip for career-total fallback)")
+    elif os.path.exists(CAREERS_PATH):
         with open(CAREERS_PATH) as f:
             existing = json.load(f)
         careers_ids = {str(p["player_id"]) for p in existing}
         print(f"  Loaded {len(careers_ids)} existing player IDs from nfl_careers.json (will skip for career-total fallback)")
 
     print(f"Loading roster data ({YEARS[0]}–{YEARS[-1]})...")
-    roster_df = nfl.import_seasonal_rosters(YEARS)
+    roster_df = session.load("rosters", YEARS, columns=CAREER_ROSTER_COLUMNS)
     if roster_df is None or roster_df.empty:
         print("ERROR: Failed to load roster data")
         sys.exit(1)
@@ -241,7 +284,7 @@ def main():
     print(f"  Roster rows: {len(roster_df)}")
 
     print(f"Loading seasonal stats ({YEARS[0]}–{YEARS[-1]})...")
-    stats_df = load_seasonal_stats(YEARS)
+    stats_df = session.seasonal_stats(YEARS)
     if stats_df is None or stats_df.empty:
         print("ERROR: Failed to load stats data")
         sys.exit(1)
@@ -252,251 +295,123 @@ def main():
     # by counting distinct weeks per (pfr_player_id, season, team).
     SNAP_YEARS = [y for y in YEARS if y >= 2013]
     print(f"Loading snap counts ({SNAP_YEARS[0]}–{SNAP_YEARS[-1]}) for defensive/kicker GP...")
-    snaps_df = nfl.import_snap_counts(SNAP_YEARS)
-    # Build two lookups from snap counts:
-    #   snap_gp_pfr:  pfr_player_id → {(season, team): games_played}
-    #   snap_gp_name: normalized_name → {(season, team): games_played}
+    # Lookups by pfr_player_id and by normalised name → {(season, team): games_played}.
     # The name lookup is a fallback for players whose pfr_id is missing in rosters.
-    snap_gp_pfr:  dict = {}
-    snap_gp_name: dict = {}
-    if snaps_df is not None and not snaps_df.empty:
-        for _, row in snaps_df.iterrows():
-            season = safe_int(row.get("season"))
-            team   = safe_str(row.get("team"), "???")
-            if not season or team == "???":
-                continue
-            key = (season, team)
-
-            pfr_id = safe_str(row.get("pfr_player_id"))
-            if pfr_id:
-                if pfr_id not in snap_gp_pfr:
-                    snap_gp_pfr[pfr_id] = {}
-                snap_gp_pfr[pfr_id][key] = snap_gp_pfr[pfr_id].get(key, 0) + 1
-
-            # Also index by normalised name (strip accents, lowercase) for fallback
-            raw_name = safe_str(row.get("player"))
-            if raw_name:
-                norm = raw_name.lower().encode("ascii", "ignore").decode()
-                if norm not in snap_gp_name:
-                    snap_gp_name[norm] = {}
-                snap_gp_name[norm][key] = snap_gp_name[norm].get(key, 0) + 1
-
-    print(f"  Snap GP lookup built for {len(snap_gp_pfr)} players (pfr), {len(snap_gp_name)} (name)")
-
-    # ── Pass 1: Skill positions (QB/RB/WR/TE) ────────────────────────────────
-    careers = []
-    skill_pids = set()
-    skipped_position = 0
-    skipped_production = 0
-    skipped_name = 0
+    snap_gp = session.snap_gp(SNAP_YEARS, refresh="--refresh" in sys.argv)
+    print(f"  Snap GP lookup built for {snap_gp}")
+
+    # ── Classify every player in one grouped pass ─────────────────────────────
+    # Skill positions (QB/RB/WR/TE) get full stat seasons; anyone not added as a
+    # skill player is then tried as defense / kicker / OL with gp-only seasons.
+    # Per-player lookups are positional indexes into frames sorted once by
+    # (player_id, season); thresholds are precomputed as boolean columns.
+    NON_SKILL_POSITIONS = DEFENSIVE_POSITIONS | KICKER_POSITIONS | OL_POSITIONS
 
     all_pids = roster_df["player_id"].unique()
-    print(f"\nPass 1 — skill positions ({len(all_pids)} player IDs)...")
+    print(f"\nClassifying {len(all_pids)} player IDs (skill, then defensive/kicker/OL)...")
+
+    roster_sorted = roster_df.sort_values(["player_id", "season"], kind="mergesort")
+    roster_rows   = roster_sorted.to_dict("records")
+    roster_index  = roster_sorted.groupby("player_id", sort=False).indices
+    roster_years  = roster_sorted.groupby("player_id", sort=False)["season"].nunique().to_dict()
+    skill_pos     = first_position_in(roster_sorted, CAREER_POSITIONS)
+    non_skill_pos = first_position_in(roster_sorted, NON_SKILL_POSITIONS)
+
+    stats_sorted  = stats_df.sort_values(["player_id", "season"], kind="mergesort")
+    stats_rows    = stats_sorted.to_dict("records")
+    stats_index   = stats_sorted.groupby("player_id", sort=False).indices
+
+    single, recent = season_flags(stats_sorted, skill_pos)
+    by_player      = stats_sorted["player_id"]
+    notable_pids   = set(by_player[single].unique())
+    recent_pids    = set(by_player[recent].unique())
+    pass_total, rush_rec_total = career_totals(stats_sorted)
+
+    def meets_career_total(pid, position):
+        if position == "QB":
+            return pass_total.get(pid, 0) >= 1000
+        return rush_rec_total.get(pid, 0) >= 300
+
+    skill_careers: list = []
+    other_careers: list = []
+    skipped_position = skipped_production = skipped_name = 0
+    def_skipped_position = def_skipped_seasons = def_skipped_name = 0
 
     for pid in all_pids:
-        roster_group = roster_df[roster_df["player_id"] == pid].sort_values("season")
-
-        # Determine position (first match in priority order)
-        positions = roster_group["position"].dropna().unique()
-        player_pos = None
-        for p in positions:
-            if p in CAREER_POSITIONS:
-                player_pos = p
-                break
+        roster_group = [roster_rows[i] for i in roster_index.get(pid, ())]
+
+        # ── Skill positions ───────────────────────────────────────────────────
+        player_pos = skill_pos.get(pid)
         if not player_pos:
             skipped_position += 1
-            continue
-
-        # Must have at least one notable season OR meet career total threshold
-        player_stats = stats_df[stats_df["player_id"] == pid].sort_values("season")
-        if player_stats.empty:
-            skipped_production += 1
-            continue
-        if not meets_single_season_threshold(player_stats, player_pos):
-            # Recent-season bypass — include any skill player who appeared in 2024 or 2025
-            if has_recent_season(player_stats):
-                pass
-            # Career total fallback — skip if already in nfl_careers.json
-            elif str(pid) in careers_ids:
-                skipped_production += 1
-                continue
-            elif not meets_career_total_threshold(player_stats, player_pos):
+        else:
+            # Must have at least one notable season OR meet career total threshold
+            stats_pos = stats_index.get(pid, ())
+            qualifies = len(stats_pos) > 0
+            if not qualifies:
                 skipped_production += 1
-                continue
-
-        latest_roster = roster_group.iloc[-1]
-        name = safe_str(latest_roster.get("player_name"))
-        if not name:
-            skipped_name += 1
-            continue
-
-        # Build roster lookup by season
-        roster_by_season = {}
-        for _, rrow in roster_group.iterrows():
-            s = rrow.get("season")
-            try:
-                roster_by_season[int(float(s))] = rrow
-            except (ValueError, TypeError):
-                pass
-
-        # Build seasons array — same shape as nfl_careers.json
-        seasons = []
-        for _, row in player_stats.iterrows():
-            season_year = safe_int(row.get("season"))
-            rrow = roster_by_season.get(season_year)
-            team = safe_str(rrow.get("team"), "???") if rrow is not None else safe_str(row.get("recent_team"), "???")
-
-            base = {
-                "season": str(season_year),
-                "team": team,
-                "gp": safe_int(row.get("games")),
-            }
-
-            if player_pos == "QB":
-                base.update({
-                    "completions":     safe_int(row.get("completions")),
-                    "attempts":        safe_int(row.get("attempts")),
-                    "passing_yards":   safe_int(row.get("passing_yards")),
-                    "passing_tds":     safe_int(row.get("passing_tds")),
-                    "interceptions":   safe_int(row.get("interceptions")),
-                    "rushing_yards":   safe_int(row.get("rushing_yards")),
-                    "rushing_tds":     safe_int(row.get("rushing_tds")),
-                    "receptions":      safe_int(row.get("receptions")),
-                    "receiving_yards": safe_int(row.get("receiving_yards")),
-                    "receiving_tds":   safe_int(row.get("receiving_tds")),
-                })
-            elif player_pos == "RB":
-                base.update({
-                    "carries":         safe_int(row.get("carries")),
-                    "rushing_yards":   safe_int(row.get("rushing_yards")),
-                    "rushing_tds":     safe_int(row.get("rushing_tds")),
-                    "receptions":      safe_int(row.get("receptions")),
-                    "receiving_yards": safe_int(row.get("receiving_yards")),
-                    "receiving_tds":   safe_int(row.get("receiving_tds")),
-                    "passing_yards":   safe_int(row.get("passing_yards")),
-                    "passing_tds":     safe_int(row.get("passing_tds")),
-                })
-            else:  # WR / TE
-                base.update({
-                    "targets":         safe_int(row.get("targets")),
-                    "receptions":      safe_int(row.get("receptions")),
-                    "receiving_yards": safe_int(row.get("receiving_yards")),
-                    "receiving_tds":   safe_int(row.get("receiving_tds")),
-                    "rushing_yards":   safe_int(row.get("rushing_yards")),
-                    "rushing_tds":     safe_int(row.get("rushing_tds")),
-                    "passing_yards":   safe_int(row.get("passing_yards")),
-                    "passing_tds":     safe_int(row.get("passing_tds")),
-                })
-
-            seasons.append(base)
-
-        if not seasons:
-            skipped_production += 1
-            continue
-
-        # Bio
-        height_str = ""
-        height_val = latest_roster.get("height")
-        if height_val and safe_str(height_val):
-            try:
-                inches = int(float(height_val))
-                height_str = f"{inches // 12}-{inches % 12}"
-            except (ValueError, TypeError):
-                height_str = safe_str(height_val)
-
-        bio = {
-            "height":       height_str,
-            "weight":       safe_int(latest_roster.get("weight")),
-            "college":      safe_str(latest_roster.get("college")),
-            "years_exp":    safe_int(latest_roster.get("years_exp")),
-            "draft_club":   safe_str(latest_roster.get("draft_club")),
-            "draft_number": safe_int(latest_roster.get("draft_number")),
-        }
-
-        careers.append({
-            "player_id":   str(pid),
-            "player_name": name,
-            "position":    player_pos,
-            "seasons":     seasons,
-            "bio":         bio,
-        })
-        skill_pids.add(str(pid))
-
-    print(f"  Skill players added:  {len(careers)}")
-    print(f"  Skipped (position):   {skipped_position}")
-    print(f"  Skipped (production): {skipped_production}")
-    print(f"  Skipped (no name):    {skipped_name}")
-
-    # ── Pass 2: Defensive players, kickers, and OL (gp-only seasons) ─────────
-    NON_SKILL_POSITIONS = DEFENSIVE_POSITIONS | KICKER_POSITIONS | OL_POSITIONS
-    def_skipped_position = 0
-    def_skipped_seasons  = 0
-    def_skipped_name     = 0
-    def_added            = 0
-
-    print(f"\nPass 2 — defensive/kicker/OL positions ({len(all_pids)} player IDs)...")
-
-    for pid in all_pids:
-        # Skip any player already captured as a skill position
-        if str(pid) in skill_pids:
-            continue
-
-        roster_group = roster_df[roster_df["player_id"] == pid].sort_values("season")
-
-        # Must have a recognised non-skill position
-        positions = roster_group["position"].dropna().unique()
-        player_pos = None
-        for p in positions:
-            if p in NON_SKILL_POSITIONS:
-                player_pos = p
-                break
+            elif pid not in notable_pids:
+                # Recent-season bypass — include any skill player who appeared in 2024 or 2025
+                if pid in recent_pids:
+                    pass
+                # Career total fallback — skip if already in nfl_careers.json
+                elif str(pid) in careers_ids:
+                    skipped_production += 1
+                    qualifies = False
+                elif not meets_career_total(pid, player_pos):
+                    skipped_production += 1
+                    qualifies = False
+
+            if qualifies:
+                latest_roster = roster_group[-1]
+                name = safe_str(latest_roster.get("player_name"))
+                if not name:
+                    skipped_name += 1
+                else:
+                    seasons = skill_seasons((stats_rows[i] for i in stats_pos),
+                                            roster_seasons(roster_group), player_pos)
+                    skill_careers.append({
+                        "player_id":   str(pid),
+                        "player_name": name,
+                        "position":    player_pos,
+                        "seasons":     seasons,
+                        "bio":         build_bio(latest_roster),
+                    })
+                    continue
+
+        # ── Defensive players, kickers, and OL (gp-only seasons) ──────────────
+        player_pos = non_skill_pos.get(pid)
         if not player_pos:
             def_skipped_position += 1
             continue
 
         # Need at least MIN_SEASONS_NON_SKILL seasons on any roster
         # (we check snap coverage later; this just filters truly short careers)
-        unique_seasons = roster_group["season"].dropna().nunique()
-        if unique_seasons < MIN_SEASONS_NON_SKILL:
+        if roster_years.get(pid, 0) < MIN_SEASONS_NON_SKILL:
             def_skipped_seasons += 1
             continue
 
-        latest_roster = roster_group.iloc[-1]
+        latest_roster = roster_group[-1]
         name = safe_str(latest_roster.get("player_name"))
         if not name:
             def_skipped_name += 1
             continue
 
         pfr_id    = safe_str(latest_roster.get("pfr_id"))
-        norm_name = name.lower().encode("ascii", "ignore").decode()
+        norm_name = normalize_name(name)
 
-        # Build per-player GP lookup: pfr_id is primary, name is fallback
+        # Per-player GP lookup: pfr_id is primary, name is fallback
         # (some players — e.g. recent kickers — have pfr_id=None in roster data).
-        player_snap_gp_pfr  = snap_gp_pfr.get(pfr_id, {}) if pfr_id else {}
-        player_snap_gp_name = snap_gp_name.get(norm_name, {})
-
         # Must have at least 1 season with real snap-count GP data; otherwise
         # the player would show up in searches but always give 0 total_gp.
-        if not player_snap_gp_pfr and not player_snap_gp_name:
+        player_snap_gp = snap_gp.games(pfr_id, norm_name)
+        if not player_snap_gp:
             def_skipped_seasons += 1
             continue
 
-        # Merge: pfr beats name for the same (season, team) key
-        player_snap_gp = {**player_snap_gp_name, **player_snap_gp_pfr}
-
-        # Build gp-only seasons from the roster data.
-        roster_by_season = {}
-        for _, rrow in roster_group.iterrows():
-            s = rrow.get("season")
-            try:
-                roster_by_season[int(float(s))] = rrow
-            except (ValueError, TypeError):
-                pass
-
         # Snap counts cover 2013–2024; seasons before that are skipped (gp=0).
-
         seasons = []
-        for season_year, rrow in sorted(roster_by_season.items()):
+        for season_year, rrow in sorted(roster_seasons(roster_group).items()):
             team = safe_str(rrow.get("team"), "???")
             gp = player_snap_gp.get((season_year, team), 0)
             # Only include seasons where we have a real GP count (skip 0s —
@@ -512,35 +427,21 @@ def main():
             def_skipped_seasons += 1
             continue
 
-        # Bio
-        height_str = ""
-        height_val = latest_roster.get("height")
-        if height_val and safe_str(height_val):
-            try:
-                inches = int(float(height_val))
-                height_str = f"{inches // 12}-{inches % 12}"
-            except (ValueError, TypeError):
-                height_str = safe_str(height_val)
-
-        bio = {
-            "height":       height_str,
-            "weight":       safe_int(latest_roster.get("weight")),
-            "college":      safe_str(latest_roster.get("college")),
-            "years_exp":    safe_int(latest_roster.get("years_exp")),
-            "draft_club":   safe_str(latest_roster.get("draft_club")),
-            "draft_number": safe_int(latest_roster.get("draft_number")),
-        }
-
-        careers.append({
+        other_careers.append({
             "player_id":   str(pid),
             "player_name": name,
             "position":    player_pos,
             "seasons":     seasons,
-            "bio":         bio,
+            "bio":         build_bio(latest_roster),
         })
-        def_added += 1
 
-    print(f"  Defensive/kicker/OL players added: {def_added}")
+    careers = skill_careers + other_careers
+
+    print(f"  Skill players added:  {len(skill_careers)}")
+    print(f"  Skipped (position):   {skipped_position}")
+    print(f"  Skipped (production): {skipped_production}")
+    print(f"  Skipped (no name):    {skipped_name}")
+    print(f"  Defensive/kicker/OL players added: {len(other_careers)}")
     print(f"  Skipped (position):   {def_skipped_position}")
     print(f"  Skipped (seasons):    {def_skipped_seasons}")
     print(f"  Skipped (no name):    {def_skipped_name}")
@@ -557,6 +458,16 @@ def main():
     print(f"\nNext step:")
     print(f"  cp data/nfl_lineup_pool.json ../public/data/nfl_lineup_pool.json")
 
+    session.outputs["nfl_lineup_pool"] = careers
+    return careers
+
+
+def main():
+    nflverse_mirror.install()
+    session = NFLBuildSession()
+    build(session)
+    session.report()
+
 
 if __name__ == "__main__":
     main()
@@ -27,13 +27,19 @@ import json
 import argparse
 from pathlib import Path
 
-import nfl_data_py as nfl
+import nflverse_mirror
+from nfl_session import NFLBuildSession
 
 PROJECT_ROOT = Path(__file__).parent.parent
 NFL_CACHE_DIR = Path(__file__).parent / ".nfl_cache"
+
 ROSTERS_DIR  = PROJECT_ROOT / "public" / "data" / "nfl" / "rosters"
 PLAYERS_DIR  = PROJECT_ROOT / "public" / "data" / "nfl" / "players"
 
+# Roster columns read for the team-season files
+ROSTER_COLUMNS = ["player_id", "espn_id", "player_name", "season", "team", "status",
+                  "position", "depth_chart_position", "jersey_number"]
+
 # All 32 current NFL teams (current abbreviations)
 NFL_TEAMS = [
     "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE",
@@ -99,14 +105,17 @@ def build_players_from_row(row, year: int) -> dict:
     }
 
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
     parser = argparse.ArgumentParser()
     parser.add_argument("--start-year", type=int, default=2000)
     parser.add_argument("--end-year",   type=int, default=2024)
     parser.add_argument("--teams",      type=str, default=None)
     parser.add_argument("--force",      action="store_true")
-    args = parser.parse_args()
+    nflverse_mirror.add_arguments(parser)
+    return parser.parse_args(argv)
+
 
+def build(session: NFLBuildSession, args: argparse.Namespace) -> None:
     teams = [t for t in NFL_TEAMS if t in args.teams.upper().split(",")] if args.teams else NFL_TEAMS
     years = list(range(args.start_year, args.end_year + 1))
 
@@ -155,11 +164,11 @@ def main():
         print("(This downloads from GitHub releases — may take a minute on first run...)\n")
 
         try:
-            df = nfl.import_seasonal_rosters(fetch_years)
+            df = session.load("rosters", fetch_years, columns=ROSTER_COLUMNS)
         except Exception as e:
             print(f"  seasonal_rosters failed ({e}), trying weekly_rosters...")
             try:
-                df = nfl.import_weekly_rosters(fetch_years)
+                df = session.load("weekly_rosters", fetch_years, columns=ROSTER_COLUMNS)
                 if df is not None and not df.empty:
                     df = df.drop_duplicates(subset=["player_id"], keep="first")
             except Exception as e2:
@@ -271,5 +280,13 @@ def main():
     print("=" * 60)
 
 
+def main():
+    args = parse_args()
+    nflverse_mirror.install()
+    session = NFLBuildSession()
+    build(session, args)
+    session.report()
+
+
 if __name__ == "__main__":
     main()
@@ -23,6 +23,8 @@ import sys
 import pandas as pd
 import nfl_data_py as nfl
 
+import nflverse_mirror
+
 OUT_DIR = os.path.join(os.path.dirname(__file__), '..', 'public', 'data', 'nfl')
 OUT_FILE = os.path.join(OUT_DIR, 'starters_2025.json')
 
@@ -218,6 +220,7 @@ def build_side(starters: pd.DataFrame, side: str) -> list[dict]:
 
 
 def main() -> None:
+    nflverse_mirror.install()
     print("Loading 2025 depth charts...")
     try:
         dc_raw = nfl.import_depth_charts([2025])
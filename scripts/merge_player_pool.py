@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+merge_player_pool.py — Prebuilt, deduplicated player pool per sport.
+
+loadNBALineupPool() / loadNFLLineupPool() in src/services/careerData.ts fetch
+both {sport}_careers.json and {sport}_lineup_pool.json and merge them by
+player_id on every page load. The two files overlap heavily, so that is ~40%
+redundant bytes plus the merge itself on every client. This does the same
+merge once, offline:
+
+    public/data/nba_player_pool.json
+    public/data/nfl_player_pool.json
+
+The precedence rules are the frontend's (mergeNBAPlayer / mergeNFLPlayer):
+  - a player in only one file is kept as is; order is careers first, then
+    pool-only players in pool order
+  - a player in both takes every field (name, position, bio) from the pool,
+    and the union of both files' seasons, the pool's row winning for a season
+    present in both; seasons sorted by their season string
+
+The legend injections are applied to the inputs first, as the patch scripts do,
+so the merged file has them even if a patch was not re-run after regenerating:
+  - NBA: patch_nba_legends.NBA_LEGENDS replace / append in both files
+  - NFL: patch_legends pre-1999 seasons and new players in careers, bio fixes
+    in both
+
+Every conflict (player in both files) is reported with which source won;
+--verbose lists them all.
+
+Run:
+    cd scripts
+    python merge_player_pool.py                  # both sports, ../public/data
+    python merge_player_pool.py nfl --verbose
+    python merge_player_pool.py --data-dir data  # the scripts/data copies
+"""
+
+import argparse
+import json
+import os
+from collections import Counter
+
+import patch_legends
+import patch_nba_legends
+
+# ─── Config ───────────────────────────────────────────────────────────────────
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "public", "data")
+SPORTS   = ["nba", "nfl"]
+
+
+def out_path(data_dir: str, sport: str) -> str:
+    return os.path.join(data_dir, f"{sport}_player_pool.json")
+
+
+# ─── Legends ──────────────────────────────────────────────────────────────────
+
+def inject_legends(sport: str, careers: list, pool: list) -> tuple[list, list]:
+    """careers / pool with the sport's legend patches applied (as the patch scripts do)."""
+    if sport == "nba":
+        careers, _ = patch_nba_legends.apply_legends(careers)
+        pool, _    = patch_nba_legends.apply_legends(pool)
+    else:
+        patch_legends.prepend_pre1999(careers)
+        patch_legends.add_new_players(careers)
+        patch_legends.apply_bio_fixes(careers)
+        patch_legends.apply_bio_fixes(pool)
+    return careers, pool
+
+
+# ─── Merge ────────────────────────────────────────────────────────────────────
+
+def merge_player(base: dict, incoming: dict) -> tuple[dict, dict]:
+    """mergeNBAPlayer / mergeNFLPlayer: incoming's fields, seasons unioned (incoming wins).
+
+    Also returns the conflict record: what each source supplied to the result.
+    """
+    base_seasons = {s["season"]: s for s in base["seasons"]}
+    seasons = dict(base_seasons)
+    seasons.update((s["season"], s) for s in incoming["seasons"])
+    merged = {**incoming, "seasons": sorted(seasons.values(), key=lambda s: s["season"])}
+
+    shared = [s for s in incoming["seasons"] if s["season"] in base_seasons]
+    conflict = {
+        "player_id":     incoming["player_id"],
+        "player_name":   incoming.get("player_name", ""),
+        # pool wins every field and every shared season; careers only adds seasons
+        "fields_differ": sorted(k for k in base.keys() | incoming.keys()
+                                if k != "seasons" and base.get(k) != incoming.get(k)),
+        "seasons_differ": [s["season"] for s in shared if base_seasons[s["season"]] != s],
+        "careers_only":  sorted(base_seasons.keys() - {s["season"] for s in incoming["seasons"]}),
+    }
+    return merged, conflict
+
+
+def merge_pools(careers: list, pool: list) -> tuple[list, list]:
+    """(merged players, conflicts) — careers first, pool entries merged over them by player_id."""
+    by_id = {p["player_id"]: p for p in careers}
+    conflicts = []
+    for player in pool:
+        existing = by_id.get(player["player_id"])
+        if existing is None:
+            by_id[player["player_id"]] = player
+        else:
+            by_id[player["player_id"]], conflict = merge_player(existing, player)
+            conflicts.append(conflict)
+    return list(by_id.values()), conflicts
+
+
+# ─── Report ───────────────────────────────────────────────────────────────────
+
+def report(sport: str, careers: list, pool: list, merged: list, conflicts: list,
+           verbose: bool = False) -> None:
+    tally = Counter()
+    for c in conflicts:
+        if c["fields_differ"]:
+            tally["pool fields won (" + ", ".join(c["fields_differ"]) + ")"] += 1
+        if c["seasons_differ"]:
+            tally["pool won differing seasons"] += 1
+        if c["careers_only"]:
+            tally["careers added seasons missing from the pool"] += 1
+        if not (c["fields_differ"] or c["seasons_differ"] or c["careers_only"]):
+            tally["identical in both files"] += 1
+
+    print(f"  {sport}: {len(careers)} careers + {len(pool)} pool → {len(merged)} players "
+          f"({len(conflicts)} in both files)")
+    for label, n in tally.most_common():
+        print(f"    {n:>5}  {label}")
+    if verbose:
+        for c in conflicts:
+            won = []
+            if c["fields_differ"]:
+                won.append(f"pool: {', '.join(c['fields_differ'])}")
+            if c["seasons_differ"]:
+                won.append(f"pool seasons: {', '.join(c['seasons_differ'])}")
+            if c["careers_only"]:
+                won.append(f"careers seasons: {', '.join(c['careers_only'])}")
+            print(f"      {c['player_id']}  {c['player_name']}: {'; '.join(won) or 'identical'}")
+
+
+# ─── Main ─────────────────────────────────────────────────────────────────────
+
+def build(sport: str, data_dir: str, verbose: bool = False) -> list:
+    """Merge {sport}_careers.json + {sport}_lineup_pool.json into {sport}_player_pool.json."""
+    with open(os.path.join(data_dir, f"{sport}_careers.json")) as f:
+        careers = json.load(f)
+    pool_path = os.path.join(data_dir, f"{sport}_lineup_pool.json")
+    pool = []
+    if os.path.exists(pool_path):          # optional, as in careerData.ts
+        with open(pool_path) as f:
+            pool = json.load(f)
+
+    careers, pool = inject_legends(sport, careers, pool)
+    merged, conflicts = merge_pools(careers, pool)
+    report(sport, careers, pool, merged, conflicts, verbose)
+
+    path = out_path(data_dir, sport)
+    with open(path, "w") as f:
+        json.dump(merged, f, separators=(",", ":"))
+    inputs = [os.path.join(data_dir, f"{sport}_careers.json"), pool_path]
+    in_kb  = sum(os.path.getsize(p) for p in inputs if os.path.exists(p)) / 1024
+    print(f"    → {path} ({os.path.getsize(path) / 1024:.0f} KB, was {in_kb:.0f} KB in two files)")
+    return merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge careers + lineup pool into one player pool per sport.")
+    parser.add_argument("sports", nargs="*", help="nba and/or nfl (default: both)")
+    parser.add_argument("--data-dir", default=DATA_DIR,
+                        help="Directory holding the careers / lineup-pool JSON (default: public/data)")
+    parser.add_argument("--verbose", action="store_true", help="List every conflict")
+    args = parser.parse_args()
+    unknown = set(args.sports) - set(SPORTS)
+    if unknown:
+        parser.error(f"unknown sport(s): {', '.join(sorted(unknown))}")
+
+    for sport in args.sports or SPORTS:
+        build(sport, args.data_dir, args.verbose)
+
+
+if __name__ == "__main__":
+    main()
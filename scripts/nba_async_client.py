@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+nba_async_client.py — asyncio nba_api client with a pooled keep-alive session.
+
+nba_api endpoint classes fetch synchronously, one blocking request at a time.
+For scripts that fire off hundreds of independent calls (BoxScoreTraditionalV2
+per game, PlayerCareerStats per player) AsyncNBAClient issues them concurrently
+instead:
+
+  - one aiohttp session with a keep-alive connection pool, reused for every
+    call the script makes
+  - at most `concurrency` requests in flight (semaphore), started no faster
+    than the shared AdaptiveLimiter allows, with the same throttle retries and
+    backoff as FetchScheduler
+  - nba_cache in front of it: hits never touch the network
+  - cache reads/writes and JSON → result-set parsing run on a thread pool, off
+    the event loop
+
+The event loop lives on a background thread, so callers stay ordinary
+synchronous code and get back the same endpoint objects CACHE.fetch returns:
+
+    with AsyncNBAClient(concurrency=8, label="box scores") as client:
+        for game, bx in client.fetch_iter(BoxScoreTraditionalV2, games,
+                                          lambda g: {"game_id": g["game_id"]}):
+            if isinstance(bx, Exception):
+                ...
+            player_df = bx.get_data_frames()[0]
+
+aiohttp is optional: AVAILABLE is False without it, and the ported scripts fall
+back to their synchronous path (also selectable with --sync).
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+try:
+    import aiohttp
+    AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AVAILABLE = False
+
+from fetch_scheduler import LIMITER, RETRIES, AdaptiveLimiter, Throttled, is_throttle_error
+from nba_cache import CACHE, ttl_for
+
+T = TypeVar("T")
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_TIMEOUT     = 30    # seconds per request, as in the sync scripts
+
+
+def _hydrate(ep, body: str, url: str):
+    """Load a raw response body into an nba_api endpoint object (runs off-loop)."""
+    from nba_api.stats.library.http import NBAStatsResponse
+
+    ep.nba_response = NBAStatsResponse(response=body, status_code=200, url=url)
+    ep.load_response()
+    return ep
+
+
+class AsyncNBAClient:
+    """Concurrent, cached nba_api fetches on a background event loop."""
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY, label: str = "nba async",
+                 limiter: Optional[AdaptiveLimiter] = None, retries: int = RETRIES,
+                 timeout: float = DEFAULT_TIMEOUT):
+        if not AVAILABLE:
+            raise RuntimeError("aiohttp not installed. Run: pip install aiohttp")
+        self.concurrency = max(1, concurrency)
+        self.label   = label
+        self.limiter = limiter or LIMITER
+        self.retries = retries
+        self.timeout = timeout
+        self.calls   = 0
+        self.items   = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._session = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._pool = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix=label)
+        self._started: Optional[float] = None
+
+    # ── Lifecycle ─────────────────────────────────────────────────────────────
+
+    def start(self) -> "AsyncNBAClient":
+        if self._loop is not None:
+            return self
+        self._loop   = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name=self.label, daemon=True)
+        self._thread.start()
+        self._run(self._open())
+        return self
+
+    async def _open(self) -> None:
+        from nba_api.stats.library.http import NBAStatsHTTP
+
+        self._sem = asyncio.Semaphore(self.concurrency)
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.concurrency, keepalive_timeout=60),
+            headers=dict(NBAStatsHTTP.headers or {}),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+
+    def close(self) -> None:
+        if self._loop is None:
+            return
+        self._run(self._session.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._pool.shutdown(wait=False)
+
+    def __enter__(self) -> "AsyncNBAClient":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    # ── Fetching ──────────────────────────────────────────────────────────────
+
+    async def _off_loop(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+
+    async def _get(self, url: str, params: list) -> str:
+        async with self._sem:
+            wait = self.limiter.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            if self._started is None:
+                self._started = time.monotonic()
+            self.calls += 1
+            try:
+                async with self._session.get(url, params=params) as resp:
+                    if resp.status == 429:
+                        raise Throttled(f"HTTP 429 from {url}")
+                    resp.raise_for_status()
+                    return await resp.text()
+            except aiohttp.ClientConnectionError as e:
+                raise ConnectionError(str(e)) from e
+
+    async def fetch(self, endpoint_cls, **kwargs):
+        """Async equivalent of CACHE.fetch(endpoint_cls, scheduler, **kwargs)."""
+        from nba_api.stats.library.http import NBAStatsHTTP
+
+        ep   = endpoint_cls(get_request=False, **kwargs)
+        body = await self._off_loop(CACHE.get, ep.endpoint, ep.parameters)
+        if body is not None:
+            try:
+                return await self._off_loop(_hydrate, ep, body, ep.endpoint)
+            except Exception:
+                CACHE.invalidate(ep.endpoint, ep.parameters)
+
+        url    = NBAStatsHTTP.base_url.format(endpoint=ep.endpoint)
+        params = [(k, str(v)) for k, v in sorted(ep.parameters.items()) if v is not None]
+        for attempt in range(self.retries + 1):
+            try:
+                body = await self._get(url, params)
+                await self._off_loop(_hydrate, ep, body, url)
+            except Exception as e:
+                if not is_throttle_error(e):
+                    raise
+                backoff = self.limiter.failure()
+                if attempt == self.retries:
+                    raise
+                print(f"    [{self.label}] throttled ({type(e).__name__}: {e}) — "
+                      f"rate now {self.limiter.rate:.2f}/s, backing off {backoff:.0f}s "
+                      f"(retry {attempt + 1}/{self.retries})")
+                continue
+            self.limiter.success()
+            await self._off_loop(CACHE.put, ep.endpoint, ep.parameters, body,
+                                 ttl_for(ep.endpoint, ep.parameters, body))
+            return ep
+
+    async def _gather(self, endpoint_cls, kwargs_list: list) -> list:
+        return await asyncio.gather(*(self.fetch(endpoint_cls, **kw) for kw in kwargs_list),
+                                    return_exceptions=True)
+
+    def fetch_all(self, endpoint_cls, kwargs_list: list) -> list:
+        """Fetch every kwargs set concurrently; results (endpoint or Exception) in input order."""
+        self.start()
+        results = self._run(self._gather(endpoint_cls, kwargs_list))
+        self.items += len(results)
+        return results
+
+    def fetch_iter(self, endpoint_cls, items: Iterable[T], kwargs_for: Callable[[T], dict],
+                   batch: int = 50) -> Iterator[tuple]:
+        """Yield (item, endpoint or Exception) in input order, `batch` items at a time.
+
+        Batching keeps the caller's checkpoints meaningful: a Ctrl-C abandons
+        at most one batch.
+        """
+        chunk: list = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= batch:
+                yield from zip(chunk, self.fetch_all(endpoint_cls, [kwargs_for(i) for i in chunk]))
+                chunk = []
+        if chunk:
+            yield from zip(chunk, self.fetch_all(endpoint_cls, [kwargs_for(i) for i in chunk]))
+
+    # ── Reporting ─────────────────────────────────────────────────────────────
+
+    def report(self) -> None:
+        elapsed = time.monotonic() - self._started if self._started is not None else 0.0
+        rate = round(self.calls / elapsed, 2) if elapsed else 0.0
+        mins, secs = divmod(int(elapsed), 60)
+        print(f"  [{self.label}] {self.items} items, {self.calls} API calls in {mins}m{secs:02d}s "
+              f"— {rate} calls/s (async, {self.concurrency} in flight, "
+              f"{self.limiter.throttles} throttles, limiter at {round(self.limiter.rate, 2)}/s)")
+
+
+def open_client(sync: bool = False, **kwargs) -> Optional[AsyncNBAClient]:
+    """A started AsyncNBAClient, or None when --sync was given or aiohttp is missing."""
+    if sync:
+        return None
+    if not AVAILABLE:
+        print("NOTE: aiohttp not installed — using the synchronous client. Run: pip install aiohttp")
+        return None
+    return AsyncNBAClient(**kwargs).start()
+
+
+def fetch_all_sync(endpoint_cls, kwargs_list: list, scheduler=None) -> list:
+    """Sequential fallback with the same contract as AsyncNBAClient.fetch_all."""
+    results = []
+    for kw in kwargs_list:
+        try:
+            results.append(CACHE.fetch(endpoint_cls, scheduler, **kw))
+        except Exception as e:
+            results.append(e)
+    return results
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+nba_bio_index.py — League-wide player bio index built from bulk endpoints.
+
+Every career fetch used to make a second round-trip to CommonPlayerInfo just
+for height, weight, school, experience and draft year — doubling the API calls
+of the career generators and updaters. The same fields are available in bulk:
+
+  - PlayerIndex (historical)   height, weight, college, draft year, from/to year
+  - DraftHistory               draft year for anyone PlayerIndex leaves blank
+                               (same single call as generate_nba_starters)
+
+Both are fetched once (through nba_cache), joined into one frame with
+CommonPlayerInfo's column names, saved as bio_index.parquet in the career store
+and looked up in memory. player_bio() falls back to a per-player
+CommonPlayerInfo call only for players the index misses.
+
+SEASON_EXP is not in either bulk response; it is approximated from FROM_YEAR /
+TO_YEAR the way CommonPlayerInfo counts it (the season in progress is not yet
+a year of experience for active players).
+
+Usage:
+    from nba_bio_index import player_bio
+
+    "bio": player_bio(player_id, player_name, SCHEDULER),
+"""
+
+import os
+import sys
+import threading
+import time
+from typing import Optional
+
+try:
+    import pandas as pd
+except ImportError:
+    print("ERROR: pandas not installed. Run: pip install pandas pyarrow")
+    sys.exit(1)
+
+try:
+    from nba_api.stats.endpoints import DraftHistory, PlayerIndex
+    from nba_api.stats.endpoints import commonplayerinfo as CommonPlayerInfoModule
+except ImportError:
+    print("ERROR: nba_api not installed. Run: pip install nba_api")
+    sys.exit(1)
+
+from nba_cache import CACHE, current_season_start
+import nba_career_store as store
+
+# ─── Config ───────────────────────────────────────────────────────────────────
+
+INDEX_PATH = os.path.join(store.STORE_DIR, "bio_index.parquet")
+INDEX_TTL  = 24 * 3600      # rebuilt at most daily (the bulk responses are cached too)
+
+BIO_COLS = ["PERSON_ID", "HEIGHT", "WEIGHT", "SCHOOL", "SEASON_EXP", "DRAFT_YEAR"]
+
+
+# ─── Build ────────────────────────────────────────────────────────────────────
+
+def _year(col: pd.Series) -> pd.Series:
+    return pd.to_numeric(col, errors="coerce").fillna(0).astype("int64")
+
+
+def build_index(scheduler=None) -> pd.DataFrame:
+    """Two bulk calls → one row per player with CommonPlayerInfo-style bio columns."""
+    start  = current_season_start()
+    season = f"{start}-{str(start + 1)[-2:]}"
+    print("Building bio index (PlayerIndex + DraftHistory)...")
+
+    idx = CACHE.fetch(PlayerIndex, scheduler, season=season,
+                      historical_nullable="1").get_data_frames()[0]
+    drafts = CACHE.fetch(DraftHistory, scheduler, league_id="00").get_data_frames()[0]
+
+    from_year = _year(idx["FROM_YEAR"])
+    to_year   = _year(idx["TO_YEAR"])
+    active    = pd.to_numeric(idx["ROSTER_STATUS"], errors="coerce").fillna(0) > 0
+    exp       = (to_year - from_year + (~active).astype("int64")).clip(lower=0)
+
+    out = pd.DataFrame({
+        "PERSON_ID":  _year(idx["PERSON_ID"]),
+        "HEIGHT":     idx["HEIGHT"].fillna("").astype(str),
+        "WEIGHT":     idx["WEIGHT"].fillna("").astype(str),
+        "SCHOOL":     idx["COLLEGE"].fillna("").astype(str),
+        "SEASON_EXP": exp.where(from_year > 0, 0).astype(str),
+        "DRAFT_YEAR": _year(idx["DRAFT_YEAR"]),
+    })
+
+    draft_year = (drafts.assign(PERSON_ID=_year(drafts["PERSON_ID"]), SEASON=_year(drafts["SEASON"]))
+                        .drop_duplicates("PERSON_ID")
+                        .set_index("PERSON_ID")["SEASON"])
+    missing = out["DRAFT_YEAR"] == 0
+    out.loc[missing, "DRAFT_YEAR"] = out.loc[missing, "PERSON_ID"].map(draft_year).fillna(0).astype("int64")
+    out["DRAFT_YEAR"] = out["DRAFT_YEAR"].map(lambda y: str(y) if y else "Undrafted")
+
+    out = out[out["PERSON_ID"] > 0].drop_duplicates("PERSON_ID", keep="last")
+    print(f"  {len(out)} players indexed")
+    return out[BIO_COLS].reset_index(drop=True)
+
+
+def load_index(scheduler=None, refresh: bool = False) -> pd.DataFrame:
+    """The saved index if it is fresh, otherwise a rebuilt (and re-saved) one."""
+    if not refresh and os.path.exists(INDEX_PATH) \
+            and time.time() - os.path.getmtime(INDEX_PATH) < INDEX_TTL:
+        return pd.read_parquet(INDEX_PATH)
+    df = build_index(scheduler)
+    os.makedirs(os.path.dirname(INDEX_PATH), exist_ok=True)
+    tmp = INDEX_PATH + ".tmp"
+    df.to_parquet(tmp, index=False)
+    os.replace(tmp, INDEX_PATH)
+    return df
+
+
+# ─── Lookup ───────────────────────────────────────────────────────────────────
+
+class BioIndex:
+    """In-memory {player_id: one-row bio frame}, loaded on first lookup."""
+
+    def __init__(self):
+        self._rows: Optional[dict] = None
+        self._lock = threading.Lock()
+        self.hits = self.fallbacks = 0
+
+    def _ensure(self, scheduler) -> dict:
+        with self._lock:
+            if self._rows is None:
+                try:
+                    df = load_index(scheduler)
+                    self._rows = {int(pid): grp for pid, grp in df.groupby("PERSON_ID", sort=False)}
+                except Exception as e:
+                    print(f"  [warn] bio index unavailable, using per-player bio calls: {e}")
+                    self._rows = {}
+            return self._rows
+
+    def frame(self, player_id: int, scheduler=None) -> Optional[pd.DataFrame]:
+        """One-row CommonPlayerInfo-shaped frame, or None if the index misses."""
+        rows = self._ensure(scheduler)
+        found = rows.get(int(player_id))
+        with self._lock:
+            if found is None:
+                self.fallbacks += 1
+            else:
+                self.hits += 1
+        return found
+
+    def report(self) -> None:
+        print(f"  [bio index] {self.hits} bios from the bulk index, "
+              f"{self.fallbacks} per-player CommonPlayerInfo fallbacks")
+
+
+INDEX = BioIndex()
+
+
+def player_bio(player_id: int, player_name: str, scheduler=None) -> dict:
+    """Bio dict from the bulk index; CommonPlayerInfo only for players it misses."""
+    info_df = INDEX.frame(player_id, scheduler)
+    if info_df is not None:
+        return store.build_bio(info_df)
+
+    try:
+        info = CACHE.fetch(CommonPlayerInfoModule.CommonPlayerInfo, scheduler, player_id=player_id)
+        info_df = info.get_data_frames()[0]
+        store.save_bio(player_id, info_df)
+    except Exception as e:
+        print(f"    [warn] bio fetch failed for {player_name}: {e}")
+    return store.build_bio(info_df)
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+nba_cache.py — Persistent on-disk response cache shared by every nba_api script.
+
+The same PlayerCareerStats / LeagueDashPlayerStats responses used to be fetched
+again by every generator, updater and patcher. CACHE.fetch() sits in front of
+the nba_api endpoint classes: responses are stored under a key derived from the
+endpoint name plus its normalized request parameters, so any script asking the
+same question reads the answer from disk instead of stats.nba.com.
+
+Expiry policy (see ttl_for):
+  - Box-score style endpoints (GameID param)     never expire
+  - Season-scoped endpoints, finished season     never expire
+  - Season-scoped endpoints, current season      CURRENT_SEASON_TTL (hours)
+  - Player endpoints (career, bio)               CURRENT_SEASON_TTL while the
+                                                 response shows a current season,
+                                                 INACTIVE_PLAYER_TTL otherwise
+  - Everything else (directories, draft)         DEFAULT_TTL
+
+The cache is capped at NBA_API_CACHE_MAX_MB; least-recently-used entries are
+evicted first. Pass --cache-stats to any NBA script for a hit/miss report.
+
+Usage:
+    from nba_cache import CACHE
+
+    career = CACHE.fetch(PlayerCareerStats, SCHEDULER, player_id=pid, per_mode36="PerGame")
+    season_df = career.get_data_frames()[0]       # same object nba_api returns
+
+Location: scripts/.nba_api_cache/  (override with NBA_API_CACHE_DIR)
+
+Set NBA_STATS_BASE_URL to send every request somewhere other than
+stats.nba.com (see nba_standin_server.py).
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import date
+from typing import Optional
+
+# ─── Config ───────────────────────────────────────────────────────────────────
+
+CACHE_DIR = os.environ.get("NBA_API_CACHE_DIR") or \
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".nba_api_cache")
+MAX_BYTES = int(os.environ.get("NBA_API_CACHE_MAX_MB", "512")) * 1024 * 1024
+
+CURRENT_SEASON_TTL  = 6 * 3600          # in-progress season data changes nightly
+INACTIVE_PLAYER_TTL = 30 * 86400        # retired players rarely change (but can un-retire)
+DEFAULT_TTL         = 24 * 3600
+
+PLAYER_ENDPOINTS = {"playercareerstats", "commonplayerinfo"}
+
+# Base-URL switch: point nba_api (sync and async paths) somewhere other than
+# stats.nba.com, e.g. the local stand-in in nba_standin_server.py.
+STATS_BASE_URL = os.environ.get("NBA_STATS_BASE_URL")
+
+
+def set_base_url(url: str) -> None:
+    """Send every nba_api stats request to url (e.g. http://127.0.0.1:8765/stats)."""
+    from nba_api.stats.library.http import NBAStatsHTTP
+
+    NBAStatsHTTP.base_url = url.rstrip("/") + "/{endpoint}"
+
+# ─── Expiry policy ────────────────────────────────────────────────────────────
+
+def current_season_start(today: Optional[date] = None) -> int:
+    """Start year of the current NBA season (the season rolls over in October)."""
+    today = today or date.today()
+    return today.year if today.month >= 10 else today.year - 1
+
+
+def season_start(val) -> Optional[int]:
+    """'2019-20' → 2019, 2019 → 2019, anything else → None."""
+    s = str(val or "")[:4]
+    return int(s) if s.isdigit() else None
+
+
+def latest_season_in(body: str) -> Optional[int]:
+    """Newest season start year mentioned in a response (SEASON_ID / TO_YEAR columns)."""
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return None
+    sets = data.get("resultSets") or data.get("resultSet") or []
+    if isinstance(sets, dict):
+        sets = [sets]
+    latest = None
+    for rs in sets:
+        headers = rs.get("headers") or []
+        for col in ("SEASON_ID", "TO_YEAR"):
+            if col not in headers:
+                continue
+            idx = headers.index(col)
+            for row in rs.get("rowSet") or []:
+                y = season_start(row[idx])
+                if y is not None and (latest is None or y > latest):
+                    latest = y
+    return latest
+
+
+def ttl_for(endpoint: str, params: dict, body: str) -> Optional[float]:
+    """Seconds until a response goes stale, or None for never."""
+    if params.get("GameID"):
+        return None
+    season = params.get("Season") or params.get("SeasonYear")
+    if season:
+        start = season_start(season)
+        return None if start is not None and start < current_season_start() else CURRENT_SEASON_TTL
+    if endpoint in PLAYER_ENDPOINTS:
+        latest = latest_season_in(body)
+        if latest is not None and latest < current_season_start():
+            return INACTIVE_PLAYER_TTL
+        return CURRENT_SEASON_TTL
+    return DEFAULT_TTL
+
+
+def normalize_params(params: dict) -> dict:
+    """Stringify values and drop empty ones, so '' and an omitted default share a key."""
+    return {k: str(v) for k, v in sorted(params.items()) if v is not None and str(v) != ""}
+
+
+def cache_key(endpoint: str, params: dict) -> str:
+    raw = endpoint.lower() + "?" + json.dumps(normalize_params(params), sort_keys=True)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+# ─── Cache ────────────────────────────────────────────────────────────────────
+
+class ResponseCache:
+    """Gzipped JSON entries under root/<key[:2]>/<key>.json.gz; mtime tracks recency."""
+
+    def __init__(self, root: str = CACHE_DIR, max_bytes: int = MAX_BYTES):
+        self.root      = root
+        self.max_bytes = max_bytes
+        self._lock     = threading.Lock()
+        self._size: Optional[int] = None     # bytes on disk, computed lazily
+        self.hits = self.misses = self.stale = self.stores = self.evictions = 0
+        self.bytes_saved = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key + ".json.gz")
+
+    def get(self, endpoint: str, params: dict) -> Optional[str]:
+        """Return the cached response body, or None if absent or expired."""
+        path = self._path(cache_key(endpoint, params))
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except (OSError, ValueError):
+            self._discard(path)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        expires = entry.get("expires_at")
+        if expires is not None and expires < time.time():
+            with self._lock:
+                self.misses += 1
+                self.stale += 1
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        body = entry["body"]
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += len(body.encode())
+        return body
+
+    def put(self, endpoint: str, params: dict, body: str, ttl: Optional[float]) -> None:
+        key  = cache_key(endpoint, params)
+        path = self._path(key)
+        now  = time.time()
+        entry = {
+            "endpoint":   endpoint,
+            "params":     normalize_params(params),
+            "fetched_at": now,
+            "expires_at": None if ttl is None else now + ttl,
+            "body":       body,
+        }
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump(entry, f, separators=(",", ":"))
+        old = os.path.getsize(path) if os.path.exists(path) else 0
+        os.replace(tmp, path)
+        new = os.path.getsize(path)
+
+        with self._lock:
+            self.stores += 1
+            if self._size is None:
+                self._size = self._disk_usage()
+            else:
+                self._size += new - old
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def fetch(self, endpoint_cls, scheduler=None, **kwargs):
+        """Build an nba_api endpoint, serving its response from disk when fresh.
+
+        Returns the same object endpoint_cls(**kwargs) would, with the response
+        loaded, so get_data_frames()/get_dict() work unchanged. Only cache misses
+        go through scheduler.call, and so through the rate limiter and its
+        throttle retries.
+        """
+        from nba_api.stats.library.http import NBAStatsResponse
+
+        ep   = endpoint_cls(get_request=False, **kwargs)
+        body = self.get(ep.endpoint, ep.parameters)
+        if body is not None:
+            try:
+                ep.nba_response = NBAStatsResponse(response=body, status_code=200, url=ep.endpoint)
+                ep.load_response()
+                return ep
+            except Exception:
+                self.invalidate(ep.endpoint, ep.parameters)
+
+        def request():
+            try:
+                ep.get_request()
+            except Exception as e:
+                if getattr(ep.nba_response, "_status_code", None) == 429:
+                    from fetch_scheduler import Throttled
+                    raise Throttled(f"HTTP 429 from {ep.endpoint}") from e
+                raise
+
+        if scheduler is not None:
+            scheduler.call(request)
+        else:
+            request()
+        body = ep.nba_response.get_json()
+        self.put(ep.endpoint, ep.parameters, body, ttl_for(ep.endpoint, ep.parameters, body))
+        return ep
+
+    # ── Housekeeping ──────────────────────────────────────────────────────────
+
+    def _entries(self) -> list:
+        out = []
+        if not os.path.isdir(self.root):
+            return out
+        for shard in os.scandir(self.root):
+            if not shard.is_dir():
+                continue
+            for f in os.scandir(shard.path):
+                if f.name.endswith(".json.gz"):
+                    st = f.stat()
+                    out.append((st.st_mtime, st.st_size, f.path))
+        return out
+
+    def _disk_usage(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until 90% of the cap. Caller holds the lock."""
+        target = int(self.max_bytes * 0.9)
+        for _, size, path in sorted(self._entries()):
+            if self._size <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._size -= size
+            self.evictions += 1
+
+    def invalidate(self, endpoint: str, params: dict) -> None:
+        """Drop one entry (e.g. a cached body nba_api can no longer parse)."""
+        self._discard(self._path(cache_key(endpoint, params)))
+
+    def _discard(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            if self._size is None:
+                self._size = self._disk_usage()
+            lookups = self.hits + self.misses
+            return {
+                "hits":        self.hits,
+                "misses":      self.misses,
+                "stale":       self.stale,
+                "stores":      self.stores,
+                "evictions":   self.evictions,
+                "hit_rate":    round(self.hits / lookups, 3) if lookups else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "disk_bytes":  self._size,
+            }
+
+    def report(self) -> None:
+        s = self.stats()
+        print(f"\nnba_api cache ({self.root}):")
+        print(f"  hits {s['hits']}  misses {s['misses']} ({s['stale']} stale)  "
+              f"hit rate {s['hit_rate']:.1%}")
+        print(f"  saved {s['bytes_saved'] / 1024 / 1024:.1f} MB of downloads  |  "
+              f"{s['stores']} stored, {s['evictions']} evicted  |  "
+              f"{s['disk_bytes'] / 1024 / 1024:.1f} / {self.max_bytes / 1024 / 1024:.0f} MB on disk")
+
+
+CACHE = ResponseCache()
+
+if STATS_BASE_URL:
+    try:
+        set_base_url(STATS_BASE_URL)
+    except ImportError:
+        pass
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+nba_career_store.py — Local "bronze" store of raw NBA career frames.
+
+fetch_career() used to keep eleven PlayerCareerStats columns and throw the rest
+away, so adding a stat meant re-crawling every player (see patch_nba_fg3m.py).
+Every career fetcher now saves the complete per-season frame and the
+CommonPlayerInfo row here before deriving anything, and the JSON outputs can be
+re-derived from the store with no network calls:
+
+    python generate_nba_careers.py --from-store
+    python generate_nba_lineup_pool.py --from-store
+
+To add a stat: extend season_row() below and rerun both commands.
+
+Layout (parquet, partitioned by player-id range, one file per player):
+    scripts/.nba_career_store/career/pid_range=1600000/1628369.parquet
+    scripts/.nba_career_store/bio/pid_range=1600000/1628369.parquet
+"""
+
+import math
+import os
+import sys
+from typing import Optional
+
+try:
+    import pandas as pd
+    import pyarrow.dataset as ds
+except ImportError:
+    print("ERROR: pandas/pyarrow not installed. Run: pip install pandas pyarrow")
+    sys.exit(1)
+
+# ─── Config ───────────────────────────────────────────────────────────────────
+
+STORE_DIR = os.environ.get("NBA_CAREER_STORE_DIR") or \
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".nba_career_store")
+PARTITION_SIZE = 50_000
+
+STRING_COLS = {"SEASON_ID", "LEAGUE_ID", "TEAM_ABBREVIATION"}
+ID_COLS     = {"PLAYER_ID", "TEAM_ID"}
+
+# ─── Helpers ──────────────────────────────────────────────────────────────────
+
+def safe_float(val, decimals=1):
+    try:
+        if val is None:
+            return 0.0
+        f = float(val)
+        if math.isnan(f) or math.isinf(f):
+            return 0.0
+        return round(f, decimals)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def safe_int(val):
+    try:
+        if val is None:
+            return 0
+        f = float(val)
+        if math.isnan(f) or math.isinf(f):
+            return 0
+        return int(f)
+    except (ValueError, TypeError):
+        return 0
+
+
+def _path(kind: str, player_id: int) -> str:
+    lo = (int(player_id) // PARTITION_SIZE) * PARTITION_SIZE
+    return os.path.join(STORE_DIR, kind, f"pid_range={lo}", f"{int(player_id)}.parquet")
+
+
+def _write(df: pd.DataFrame, path: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    df.to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+
+
+def _normalize_career(df: pd.DataFrame) -> pd.DataFrame:
+    """Fixed dtypes per column so every player's file shares one schema."""
+    out = df.copy()
+    for col in out.columns:
+        if col in STRING_COLS:
+            out[col] = out[col].fillna("").astype(str)
+        elif col in ID_COLS:
+            out[col] = pd.to_numeric(out[col], errors="coerce").fillna(0).astype("int64")
+        else:
+            out[col] = pd.to_numeric(out[col], errors="coerce").astype("float64")
+    return out
+
+
+def _normalize_bio(df: pd.DataFrame) -> pd.DataFrame:
+    """CommonPlayerInfo is mostly text; store every column as a string."""
+    return df.astype(object).where(df.notna(), "").astype(str)
+
+
+# ─── Read / write ─────────────────────────────────────────────────────────────
+
+def save_career(player_id: int, season_df: pd.DataFrame) -> None:
+    """Persist the full PlayerCareerStats SeasonTotalsRegularSeason frame."""
+    _write(_normalize_career(season_df), _path("career", player_id))
+
+
+def save_bio(player_id: int, info_df: pd.DataFrame) -> None:
+    """Persist the CommonPlayerInfo frame."""
+    _write(_normalize_bio(info_df), _path("bio", player_id))
+
+
+def load_career(player_id: int) -> Optional[pd.DataFrame]:
+    path = _path("career", player_id)
+    return pd.read_parquet(path) if os.path.exists(path) else None
+
+
+def load_bio(player_id: int) -> Optional[pd.DataFrame]:
+    path = _path("bio", player_id)
+    return pd.read_parquet(path) if os.path.exists(path) else None
+
+
+def load_all(kind: str) -> pd.DataFrame:
+    """Every stored frame of one kind ("career" or "bio") as a single DataFrame."""
+    root = os.path.join(STORE_DIR, kind)
+    if not os.path.isdir(root):
+        return pd.DataFrame()
+    table = ds.dataset(root, format="parquet", partitioning="hive").to_table()
+    return table.to_pandas().drop(columns=["pid_range"], errors="ignore")
+
+
+# ─── Derivation ───────────────────────────────────────────────────────────────
+
+def season_row(src, season: str, team: str) -> dict:
+    """One season entry in the nba_careers.json / nba_lineup_pool.json format."""
+    row = {
+        "season":  season,
+        "team":    team,
+        "gp":      safe_int(src.get("GP")),
+        "min":     safe_float(src.get("MIN")),
+        "pts":     safe_float(src.get("PTS")),
+        "reb":     safe_float(src.get("REB")),
+        "ast":     safe_float(src.get("AST")),
+        "stl":     safe_float(src.get("STL")),
+        "blk":     safe_float(src.get("BLK")),
+        "fg_pct":  safe_float(src.get("FG_PCT"), 3),
+        "fg3_pct": safe_float(src.get("FG3_PCT"), 3),
+    }
+    gp = row["gp"]
+    row["total_pts"] = round(row["pts"] * gp)
+    row["total_reb"] = round(row["reb"] * gp)
+    row["total_ast"] = round(row["ast"] * gp)
+    row["total_blk"] = round(row["blk"] * gp)
+    row["total_stl"] = round(row["stl"] * gp)
+    row["fg3m"]      = safe_float(src.get("FG3M"))
+    row["ftm"]       = safe_float(src.get("FTM"))
+    row["pf"]        = safe_float(src.get("PF"))
+    row["total_3pm"] = round(row["fg3m"] * gp)
+    row["total_ftm"] = round(row["ftm"] * gp)
+    row["total_pf"]  = round(row["pf"] * gp)
+    return row
+
+
+def build_seasons(season_df: pd.DataFrame) -> list[dict]:
+    """Collapse per-team rows into one entry per season (TOT row for traded players)."""
+    seasons = []
+    for season_id, group in season_df.groupby("SEASON_ID", sort=False):
+        tot_rows  = group[group["TEAM_ABBREVIATION"] == "TOT"]
+        team_rows = group[group["TEAM_ABBREVIATION"] != "TOT"]
+
+        if len(team_rows) <= 1 and tot_rows.empty:
+            src  = group.iloc[0]
+            team = src.get("TEAM_ABBREVIATION", "???")
+        else:
+            team = "/".join(team_rows["TEAM_ABBREVIATION"].tolist()) if not team_rows.empty else "???"
+            src  = tot_rows.iloc[0] if not tot_rows.empty else team_rows.iloc[0]
+        seasons.append(season_row(src, str(season_id), str(team)))
+    return seasons
+
+
+def build_bio(info_df: Optional[pd.DataFrame]) -> dict:
+    bio = {"height": "", "weight": 0, "school": "", "exp": 0, "draft_year": 0}
+    if info_df is None or info_df.empty:
+        return bio
+    irow = info_df.iloc[0]
+    bio["height"]     = str(irow.get("HEIGHT", "") or "")
+    bio["weight"]     = safe_int(irow.get("WEIGHT"))
+    bio["school"]     = str(irow.get("SCHOOL", "") or "")
+    bio["exp"]        = safe_int(irow.get("SEASON_EXP"))
+    dy = irow.get("DRAFT_YEAR")
+    bio["draft_year"] = int(dy) if dy and str(dy).isdigit() else 0
+    return bio
+
+
+# ─── Rebuild ──────────────────────────────────────────────────────────────────
+
+def rebuild_players(players: list[dict], min_seasons: int = 1) -> tuple[list[dict], dict]:
+    """Re-derive seasons and bio for every entry of an existing output file.
+
+    Players missing from the store (hand-patched legends, or anyone fetched
+    before the store existed) are kept unchanged.
+    """
+    careers = load_all("career")
+    bios    = load_all("bio")
+    career_groups = dict(tuple(careers.groupby("PLAYER_ID"))) if not careers.empty else {}
+    bio_groups    = {}
+    if not bios.empty:
+        bios["PERSON_ID"] = pd.to_numeric(bios["PERSON_ID"], errors="coerce")
+        bio_groups = dict(tuple(bios.groupby("PERSON_ID")))
+
+    out: list[dict] = []
+    counts = {"rebuilt": 0, "kept": 0, "dropped": 0}
+    for player in players:
+        pid = player["player_id"]
+        frame = career_groups.get(pid)
+        if frame is None:
+            out.append(player)
+            counts["kept"] += 1
+            continue
+        seasons = build_seasons(frame)
+        if len(seasons) < min_seasons:
+            counts["dropped"] += 1
+            continue
+        info = bio_groups.get(pid)
+        out.append({
+            "player_id":   pid,
+            "player_name": player["player_name"],
+            "seasons":     seasons,
+            "bio":         build_bio(info) if info is not None else player.get("bio", build_bio(None)),
+        })
+        counts["rebuilt"] += 1
+    return out, counts
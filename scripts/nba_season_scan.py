@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+nba_season_scan.py — Concurrent, cached league-wide season scan.
+
+build_eligible() / scan_seasons() in the NBA career generators and pool patchers
+all do the same thing: pull LeagueDashPlayerStats (per game, regular season) for
+a range of seasons and keep players who cleared some bar in at least one of
+them. This module does that once for everyone:
+
+  - seasons are fetched concurrently through the caller's FetchScheduler
+  - responses go through nba_cache, where finished seasons never expire, so a
+    warm re-run makes no API calls at all
+  - qualification rules are applied as vectorized DataFrame masks
+
+A rule is a dict of per-game minimums that must ALL hold; a player-season
+qualifies if ANY rule holds:
+
+    rules = [{"PTS": 10, "GP": 40}, {"REB": 7, "GP": 40}, {"AST": 7, "GP": 40}]
+    scan  = scan_seasons(["2003-04", "2004-05"], rules, SCHEDULER)
+    ids   = qualifying_players(scan)          # {player_id: player_name}
+"""
+
+import sys
+
+try:
+    import pandas as pd
+except ImportError:
+    print("ERROR: pandas not installed. Run: pip install pandas")
+    sys.exit(1)
+
+try:
+    from nba_api.stats.endpoints import LeagueDashPlayerStats
+except ImportError:
+    print("ERROR: nba_api not installed. Run: pip install nba_api")
+    sys.exit(1)
+
+from nba_cache import CACHE
+
+STAT_COLS = ["GP", "PTS", "REB", "AST"]
+
+
+def season_str(year: int) -> str:
+    return f"{year}-{str(year + 1)[-2:]}"
+
+
+def fetch_season(season: str, scheduler) -> pd.DataFrame:
+    stats = CACHE.fetch(
+        LeagueDashPlayerStats, scheduler,
+        season=season,
+        per_mode_detailed="PerGame",
+        season_type_all_star="Regular Season",
+    )
+    return stats.get_data_frames()[0]
+
+
+def normalize(df: pd.DataFrame, season: str) -> pd.DataFrame:
+    """PLAYER_ID, PLAYER_NAME, SEASON and numeric GP/PTS/REB/AST; unusable rows dropped."""
+    name_col = "PLAYER_NAME" if "PLAYER_NAME" in df.columns else "PLAYER"
+    out = pd.DataFrame({
+        "PLAYER_ID":   pd.to_numeric(df["PLAYER_ID"], errors="coerce"),
+        "PLAYER_NAME": df[name_col].fillna("").astype(str) if name_col in df.columns else "",
+        "SEASON":      season,
+    })
+    for col in STAT_COLS:
+        out[col] = pd.to_numeric(df[col], errors="coerce").fillna(0) if col in df.columns else 0.0
+    out = out.dropna(subset=["PLAYER_ID"])
+    out["PLAYER_ID"] = out["PLAYER_ID"].astype("int64")
+    return out
+
+
+def qualify_mask(df: pd.DataFrame, rules: list[dict]) -> pd.Series:
+    """True where any rule has all of its minimums met."""
+    mask = pd.Series(False, index=df.index)
+    for rule in rules:
+        rule_mask = pd.Series(True, index=df.index)
+        for col, minimum in rule.items():
+            rule_mask &= df[col] >= minimum
+        mask |= rule_mask
+    return mask
+
+
+def scan_seasons(seasons: list[str], rules: list[dict], scheduler) -> pd.DataFrame:
+    """One row per player-season across all seasons, with a boolean QUALIFIES column.
+
+    Seasons that fail to load are reported and skipped, as before.
+    """
+    def load(season):
+        try:
+            return fetch_season(season, scheduler)
+        except Exception as e:
+            return e
+
+    frames = []
+    for i, (season, result) in enumerate(scheduler.map(load, seasons)):
+        if isinstance(result, Exception):
+            print(f"  [{i+1}/{len(seasons)}] {season}: skipped ({result})")
+            continue
+        df = normalize(result, season)
+        df["QUALIFIES"] = qualify_mask(df, rules)
+        print(f"  [{i+1}/{len(seasons)}] {season}: {int(df['QUALIFIES'].sum())} qualifying players")
+        frames.append(df)
+
+    if not frames:
+        empty = pd.DataFrame(columns=["PLAYER_ID", "PLAYER_NAME", "SEASON", *STAT_COLS, "QUALIFIES"])
+        return empty.astype({"PLAYER_ID": "int64", "QUALIFIES": bool})
+    return pd.concat(frames, ignore_index=True)
+
+
+def qualifying_players(scan: pd.DataFrame) -> dict[int, str]:
+    """{player_id: name} for anyone with a qualifying season.
+
+    Ordered by first qualifying season; the name comes from the latest one.
+    """
+    names = scan[scan["QUALIFIES"]].groupby("PLAYER_ID", sort=False)["PLAYER_NAME"].last()
+    return dict(zip(names.index.tolist(), names.tolist()))
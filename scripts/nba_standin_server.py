@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+nba_standin_server.py — Local stand-in for stats.nba.com that replays recorded responses.
+
+None of the NBA generators could be run or timed without the live API, which
+throttles hard and changes shape now and then. This server answers
+/stats/<endpoint>?<params> from recorded fixtures, so the scheduler, cache,
+retry logic and generators can be exercised end to end on an offline box.
+
+Fixtures are keyed exactly like nba_cache entries (endpoint + normalized
+params), so recording is just exporting from a warm cache:
+
+    python nba_standin_server.py --record            # cache → fixtures, then exit
+    python nba_standin_server.py --port 8765 --latency 80 --jitter 40 \\
+        --errors 429:0.05,timeout:0.01,empty:0.02
+
+Point any NBA script at it with the base-URL switch (and a scratch cache, so
+the real one is neither used nor polluted):
+
+    NBA_STATS_BASE_URL=http://127.0.0.1:8765/stats \\
+    NBA_API_CACHE_DIR=/tmp/nba_bench_cache python generate_nba_box_scores.py --year 2024
+
+Recorded endpoints: LeagueDashPlayerStats, PlayerCareerStats, CommonPlayerInfo,
+CommonTeamRoster, LeagueGameLog, BoxScoreTraditionalV2 (plus PlayerIndex and
+DraftHistory, which nba_bio_index needs). --loose answers an unrecorded request
+with any fixture of the same endpoint, for load tests on synthetic ids.
+
+Error kinds for --errors (each with a probability):
+  429      HTTP 429 Too Many Requests
+  500      HTTP 500
+  empty    HTTP 200 with a body that has no resultSets
+  timeout  sleep --hang seconds before answering (trips client timeouts)
+
+GET /__stats returns request / miss / injected-error counts as JSON.
+
+Fixtures: scripts/.nba_fixtures/  (override with NBA_FIXTURE_DIR or --fixtures)
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import shutil
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qsl, urlparse
+
+from nba_cache import CACHE_DIR, cache_key
+
+# ─── Config ───────────────────────────────────────────────────────────────────
+
+FIXTURE_DIR = os.environ.get("NBA_FIXTURE_DIR") or \
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".nba_fixtures")
+
+RECORDED_ENDPOINTS = {
+    "leaguedashplayerstats", "playercareerstats", "commonplayerinfo",
+    "commonteamroster", "leaguegamelog", "boxscoretraditionalv2",
+    "playerindex", "drafthistory",
+}
+
+ERROR_KINDS = ("429", "500", "empty", "timeout")
+
+
+def parse_errors(spec: str) -> dict[str, float]:
+    """'429:0.05,timeout:0.01' → {'429': 0.05, 'timeout': 0.01}"""
+    out: dict[str, float] = {}
+    for part in filter(None, (p.strip() for p in (spec or "").split(","))):
+        kind, _, prob = part.partition(":")
+        if kind not in ERROR_KINDS:
+            raise ValueError(f"unknown error kind {kind!r} (expected one of {', '.join(ERROR_KINDS)})")
+        out[kind] = float(prob or 0)
+    return out
+
+
+# ─── Fixtures ─────────────────────────────────────────────────────────────────
+
+def record_from_cache(cache_dir: str = CACHE_DIR, fixture_dir: str = FIXTURE_DIR) -> int:
+    """Copy every cached response for a recorded endpoint into the fixture dir."""
+    copied = 0
+    if not os.path.isdir(cache_dir):
+        return copied
+    os.makedirs(fixture_dir, exist_ok=True)
+    for shard in os.scandir(cache_dir):
+        if not shard.is_dir():
+            continue
+        for f in os.scandir(shard.path):
+            if not f.name.endswith(".json.gz"):
+                continue
+            try:
+                with gzip.open(f.path, "rt", encoding="utf-8") as fh:
+                    endpoint = json.load(fh).get("endpoint", "").lower()
+            except (OSError, ValueError):
+                continue
+            if endpoint in RECORDED_ENDPOINTS:
+                shutil.copyfile(f.path, os.path.join(fixture_dir, f.name))
+                copied += 1
+    return copied
+
+
+class FixtureStore:
+    """Fixture bodies by cache key, loaded lazily; plus an endpoint → keys index for --loose."""
+
+    def __init__(self, root: str = FIXTURE_DIR):
+        self.root = root
+        self._keys = [name[:-len(".json.gz")] for name in os.listdir(root)
+                      if name.endswith(".json.gz")] if os.path.isdir(root) else []
+        self._bodies: dict[str, str] = {}
+        self._by_endpoint: dict[str, list[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _load(self, key: str) -> Optional[dict]:
+        path = os.path.join(self.root, key + ".json.gz")
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get(self, endpoint: str, params: dict) -> Optional[str]:
+        key = cache_key(endpoint, params)
+        with self._lock:
+            if key in self._bodies:
+                return self._bodies[key]
+        entry = self._load(key)
+        body = entry["body"] if entry else None
+        if body is not None:
+            with self._lock:
+                self._bodies[key] = body
+        return body
+
+    def any_for(self, endpoint: str) -> Optional[str]:
+        """Some fixture of this endpoint (indexes the fixture dir on first use)."""
+        endpoint = endpoint.lower()
+        with self._lock:
+            indexed = endpoint in self._by_endpoint
+        if not indexed:
+            keys = []
+            for key in self._keys:
+                entry = self._load(key)
+                if entry and entry.get("endpoint", "").lower() == endpoint:
+                    keys.append(key)
+            with self._lock:
+                self._by_endpoint[endpoint] = keys
+        keys = self._by_endpoint[endpoint]
+        if not keys:
+            return None
+        entry = self._load(random.choice(keys))
+        return entry["body"] if entry else None
+
+
+# ─── Server ───────────────────────────────────────────────────────────────────
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, addr, fixtures: FixtureStore, latency_ms: float = 0, jitter_ms: float = 0,
+                 errors: Optional[dict] = None, hang_s: float = 60, loose: bool = False,
+                 seed: Optional[int] = None):
+        super().__init__(addr, StandinHandler)
+        self.fixtures   = fixtures
+        self.latency_ms = latency_ms
+        self.jitter_ms  = jitter_ms
+        self.errors     = errors or {}
+        self.hang_s     = hang_s
+        self.loose      = loose
+        self.rng        = random.Random(seed)
+        self.counts     = {"requests": 0, "served": 0, "loose": 0, "misses": 0,
+                           **{f"injected_{k}": 0 for k in ERROR_KINDS}}
+        self.by_endpoint: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def count(self, name: str, endpoint: Optional[str] = None) -> None:
+        with self._lock:
+            self.counts[name] += 1
+            if endpoint:
+                self.by_endpoint[endpoint] = self.by_endpoint.get(endpoint, 0) + 1
+
+    def draw(self) -> tuple[float, Optional[str]]:
+        """Delay (seconds) and injected error kind for one request."""
+        with self._lock:
+            delay = max(0.0, self.latency_ms + self.rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+            roll, error = self.rng.random(), None
+            for kind, prob in self.errors.items():
+                if roll < prob:
+                    error = kind
+                    break
+                roll -= prob
+        return delay, error
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {**self.counts, "by_endpoint": dict(self.by_endpoint)}
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    server: StandinServer
+
+    def log_message(self, fmt, *args):   # quiet; /__stats has the numbers
+        pass
+
+    def _send(self, status: int, body: str) -> None:
+        data = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/__stats":
+            return self._send(200, json.dumps(self.server.stats()))
+
+        parts = [p for p in url.path.split("/") if p]
+        if len(parts) < 2 or parts[0] != "stats":
+            return self._send(404, '{"Message":"unknown path"}')
+        endpoint = parts[1].lower()
+        params   = dict(parse_qsl(url.query, keep_blank_values=True))
+        srv      = self.server
+        srv.count("requests", endpoint)
+
+        delay, error = srv.draw()
+        if error == "timeout":
+            srv.count("injected_timeout")
+            time.sleep(srv.hang_s)
+        elif delay:
+            time.sleep(delay)
+        if error == "429":
+            srv.count("injected_429")
+            return self._send(429, '{"Message":"Too Many Requests"}')
+        if error == "500":
+            srv.count("injected_500")
+            return self._send(500, '{"Message":"An error has occurred."}')
+        if error == "empty":
+            srv.count("injected_empty")
+            return self._send(200, "{}")
+
+        body = srv.fixtures.get(endpoint, params)
+        if body is None and srv.loose:
+            body = srv.fixtures.any_for(endpoint)
+            if body is not None:
+                srv.count("loose")
+        if body is None:
+            srv.count("misses")
+            return self._send(404, json.dumps({"Message": f"no fixture for {endpoint}", "params": params}))
+        srv.count("served")
+        return self._send(200, body)
+
+
+def serve(host: str = "127.0.0.1", port: int = 8765, **kwargs) -> StandinServer:
+    """Start a stand-in server on a background thread (port 0 picks a free port)."""
+    srv = StandinServer((host, port), kwargs.pop("fixtures", None) or FixtureStore(), **kwargs)
+    threading.Thread(target=srv.serve_forever, name="nba-standin", daemon=True).start()
+    return srv
+
+
+# ─── Main ─────────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded stats.nba.com responses locally.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixtures", default=FIXTURE_DIR, help="Fixture directory")
+    parser.add_argument("--record", action="store_true",
+                        help="Export recorded endpoints from the nba_api cache into --fixtures and exit")
+    parser.add_argument("--latency", type=float, default=0, help="Added latency per request (ms)")
+    parser.add_argument("--jitter", type=float, default=0, help="± uniform jitter on --latency (ms)")
+    parser.add_argument("--errors", default="", help="Injected errors, e.g. 429:0.05,timeout:0.01,empty:0.02")
+    parser.add_argument("--hang", type=float, default=60, help="Seconds a 'timeout' error stalls")
+    parser.add_argument("--loose", action="store_true",
+                        help="Answer unrecorded requests with any fixture of the same endpoint")
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed for jitter / error injection")
+    args = parser.parse_args()
+
+    if args.record:
+        n = record_from_cache(CACHE_DIR, args.fixtures)
+        print(f"Recorded {n} responses from {CACHE_DIR} → {args.fixtures}")
+        return
+
+    fixtures = FixtureStore(args.fixtures)
+    srv = StandinServer((args.host, args.port), fixtures, args.latency, args.jitter,
+                        parse_errors(args.errors), args.hang, args.loose, args.seed)
+    print(f"stats.nba.com stand-in on http://{args.host}:{srv.server_address[1]}/stats "
+          f"({len(fixtures)} fixtures from {args.fixtures})")
+    print(f"  NBA_STATS_BASE_URL=http://{args.host}:{srv.server_address[1]}/stats")
+    try:
+        srv.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(srv.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+nfl_build.py — Run the NFL generators as stages of one process sharing one session.
+
+Run separately, generate_nfl_careers.py, generate_nfl_lineup_pool.py,
+patch_nfl_oline_kicker_pool.py, generate_nfl_defensive_names.py and
+generate_nfl_rosters.py each load overlapping roster and stats frames from
+scratch, and the lineup pool re-parses the nfl_careers.json the previous step
+just wrote. Here every stage's build(session) runs against one NFLBuildSession
+(nfl_session.py): each roster / stats / snap-count season is read once, with
+the union of the columns the selected stages use, and each stage's output is
+handed to the next in memory. The JSON files written are the same as running
+the scripts one after another.
+
+Run:
+    cd scripts
+    python nfl_build.py                                  # careers → lineup pool → O-line/K patch → defensive names
+    python nfl_build.py --stages lineup-pool,oline-kicker
+    python nfl_build.py --stages all                     # also the team roster files
+    python nfl_build.py --year 2025                      # incremental: update_nfl_careers for one season
+
+--refresh / --offline are passed to the nflverse mirror (see nflverse_mirror.py).
+"""
+
+import argparse
+import sys
+import time
+
+import nflverse_mirror
+from nfl_session import NFLBuildSession
+
+import generate_nfl_careers
+import generate_nfl_defensive_names
+import generate_nfl_lineup_pool
+import generate_nfl_rosters
+import patch_nfl_oline_kicker_pool
+import update_nfl_careers
+from nflverse_loader import CAREER_ROSTER_COLUMNS
+
+# ─── Stages ───────────────────────────────────────────────────────────────────
+
+# name → (run(session, args), {dataset: columns read})
+STAGES = {
+    "careers":         (lambda s, a: generate_nfl_careers.build(s),
+                        {"rosters": CAREER_ROSTER_COLUMNS}),
+    "lineup-pool":     (lambda s, a: generate_nfl_lineup_pool.build(s),
+                        {"rosters": CAREER_ROSTER_COLUMNS, "stats_player_reg": None}),
+    "oline-kicker":    (lambda s, a: patch_nfl_oline_kicker_pool.build(s),
+                        {"rosters": CAREER_ROSTER_COLUMNS, "stats_player_reg": None}),
+    "defensive-names": (lambda s, a: generate_nfl_defensive_names.build(s),
+                        {"rosters": generate_nfl_defensive_names.ROSTER_COLUMNS}),
+    "rosters":         (lambda s, a: generate_nfl_rosters.build(s, generate_nfl_rosters.parse_args([])),
+                        {"rosters": generate_nfl_rosters.ROSTER_COLUMNS,
+                         "weekly_rosters": generate_nfl_rosters.ROSTER_COLUMNS}),
+    "update":          (lambda s, a: update_nfl_careers.build(s, a.year),
+                        {"rosters": update_nfl_careers.ROSTER_COLUMNS, "stats_player_reg": None}),
+}
+
+DEFAULT_STAGES = ["careers", "lineup-pool", "oline-kicker", "defensive-names"]
+ALL_STAGES     = DEFAULT_STAGES + ["rosters"]
+
+
+def select_stages(args) -> list[str]:
+    if args.year is not None:
+        return ["update"]
+    if args.stages in (None, "default"):
+        return DEFAULT_STAGES
+    if args.stages == "all":
+        return ALL_STAGES
+    names = [s.strip() for s in args.stages.split(",") if s.strip()]
+    unknown = [s for s in names if s not in STAGES or s == "update"]
+    if unknown:
+        print(f"ERROR: unknown stage(s) {unknown}. Choose from: {', '.join(ALL_STAGES)}")
+        sys.exit(1)
+    # Always run in dependency order, whatever order they were listed in
+    return [s for s in ALL_STAGES if s in names]
+
+
+# ─── Main ─────────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stages", default=None,
+                        help=f"Comma-separated stages, 'default' or 'all' (default: {','.join(DEFAULT_STAGES)})")
+    parser.add_argument("--year", type=int, default=None,
+                        help="Incremental update of one season (update_nfl_careers) instead of a rebuild")
+    nflverse_mirror.add_arguments(parser)
+    args = parser.parse_args()
+    mirror = nflverse_mirror.install()
+
+    stages  = select_stages(args)
+    session = NFLBuildSession()
+    for name in stages:
+        for dataset, columns in STAGES[name][1].items():
+            session.declare(dataset, columns)
+
+    timings = []
+    for name in stages:
+        print(f"\n{'═' * 20} {name} {'═' * (40 - len(name))}")
+        t0 = time.perf_counter()
+        STAGES[name][0](session, args)
+        timings.append((name, time.perf_counter() - t0))
+
+    print(f"\n{'═' * 62}")
+    for name, secs in timings:
+        print(f"  {name:<16} {secs:7.1f}s")
+    session.report()
+    if mirror is not None:
+        mirror.report()
+
+
+if __name__ == "__main__":
+    main()
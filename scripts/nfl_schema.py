@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+nfl_schema.py — Compact dtypes for the multi-season NFL frames.
+
+As read, the roster and stats frames keep every string column as Python
+objects and every stat as float64 (nfl_data_py's seasonal aggregation makes
+even counts floats). Concatenated over 1999–2025 that is most of the careers
+build's memory. normalize() is applied to every frame as it is loaded
+(NFLBuildSession does this for the generators):
+
+  - columns not asked for are dropped first
+  - low-cardinality labels (team, position, status, college, ...) become
+    category
+  - counting stats become the smallest integer type that holds them, with
+    missing values filled as 0 — what every generator's safe_int() read them
+    as. A column with a fractional value is left as float.
+
+Player ids and names stay object strings: they are the groupby / join keys
+of every generator, and nearly unique per player.
+
+Frames normalized separately and concatenated lose their categories when the
+category sets differ; concat() re-unifies them.
+
+The before / after memory of every normalized frame is tallied per dataset:
+
+    nfl_schema.report()
+    #   [memory] rosters             27 frames    412.3 MB →  61.8 MB
+"""
+
+import sys
+from collections import defaultdict
+from typing import Optional
+
+try:
+    import pandas as pd
+except ImportError:
+    print("ERROR: pandas not installed. Run: pip install pandas pyarrow")
+    sys.exit(1)
+
+# ─── Schema ───────────────────────────────────────────────────────────────────
+
+CATEGORY_COLUMNS = {
+    "team", "recent_team", "opponent_team", "position", "position_group",
+    "depth_chart_position", "status", "college", "draft_club", "season_type",
+}
+
+COUNT_COLUMNS = {
+    "games",
+    "completions", "attempts", "passing_yards", "passing_tds", "interceptions",
+    "passing_interceptions", "sacks", "sack_yards",
+    "carries", "rushing_yards", "rushing_tds",
+    "targets", "receptions", "receiving_yards", "receiving_tds",
+    "fg_made", "fg_att", "fg_missed", "fg_blocked",
+    "fg_made_0_19", "fg_made_20_29", "fg_made_30_39", "fg_made_40_49",
+    "fg_made_50_59", "fg_made_60_",
+    "pat_made", "pat_att", "pat_missed", "pat_blocked",
+}
+
+# dataset → [frames, bytes before, bytes after]
+MEMORY: dict = defaultdict(lambda: [0, 0, 0])
+
+
+def memory_bytes(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+# ─── Normalization ────────────────────────────────────────────────────────────
+
+def count_col(col: pd.Series) -> pd.Series:
+    """A counting stat as the smallest integer dtype, missing → 0 (left as is if fractional)."""
+    values = pd.to_numeric(col, errors="coerce").fillna(0)
+    if not (values % 1 == 0).all():
+        return col
+    return pd.to_numeric(values.astype("int64"), downcast="integer")
+
+
+def compact(df: pd.DataFrame) -> pd.DataFrame:
+    """Category labels and integer counts, in place of object / float64 columns."""
+    out = {}
+    for name in df.columns:
+        col = df[name]
+        if name in CATEGORY_COLUMNS and col.dtype == object:
+            out[name] = col.astype("category")
+        elif name in COUNT_COLUMNS and col.dtype.kind in "fiu" and col.dtype.itemsize > 1:
+            out[name] = count_col(col)
+        else:
+            out[name] = col
+    return pd.DataFrame(out, index=df.index)
+
+
+def normalize(df: pd.DataFrame, dataset: str, columns: Optional[list] = None) -> pd.DataFrame:
+    """Project to `columns` (None keeps all) and compact the dtypes, tallying memory under dataset."""
+    before = memory_bytes(df)
+    if columns is not None:
+        df = df[[c for c in columns if c in df.columns]]
+    df = compact(df)
+    tally = MEMORY[dataset]
+    tally[0] += 1
+    tally[1] += before
+    tally[2] += memory_bytes(df)
+    return df
+
+
+def concat(frames: list) -> pd.DataFrame:
+    """pd.concat that keeps category columns categorical when the pieces' categories differ."""
+    df = pd.concat(frames, ignore_index=True)
+    for name in CATEGORY_COLUMNS & set(df.columns):
+        if df[name].dtype == object:
+            df[name] = df[name].astype("category")
+    return df
+
+
+def report() -> None:
+    mb = 1024 * 1024
+    for dataset, (frames, before, after) in sorted(MEMORY.items()):
+        print(f"  [memory] {dataset:<18} {frames:>3} frames  "
+              f"{before / mb:8.1f} MB → {after / mb:6.1f} MB")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+nfl_session.py — In-memory dataset cache shared by the NFL generators.
+
+Each NFL generator exposes build(session) and reads its inputs through an
+NFLBuildSession instead of calling the loaders itself:
+
+    roster_df = session.load("rosters", YEARS, columns=CAREER_ROSTER_COLUMNS)
+    stats_df  = session.seasonal_stats(YEARS)
+    snap_gp   = session.snap_gp(SNAP_YEARS)
+
+Frames are cached per (dataset, season), so generators asking for overlapping
+year ranges (careers 1999–2024, lineup pool 2010–2025, ...) share every season
+they have in common. Run standalone, a generator gets a fresh session and
+behaves exactly as before; run through nfl_build.py, one session serves every
+stage, so each file is read and parsed once per refresh.
+
+Column projection (nflverse_loader) still applies: a session reads the union
+of the columns its stages need. nfl_build declares each stage's needs up front
+with declare(); a request for a column nobody declared re-reads that season
+with the wider projection.
+
+Every frame is passed through nfl_schema.normalize() as it is read (category
+labels, small-integer counts), and report() includes its per-dataset
+before / after memory.
+
+Stage outputs are kept in session.outputs (e.g. "nfl_careers",
+"nfl_lineup_pool") so downstream stages use them directly instead of
+re-parsing the JSON just written.
+"""
+
+import sys
+from typing import Optional
+
+try:
+    import nfl_data_py as nfl
+except ImportError:
+    print("ERROR: nfl_data_py not installed. Run: pip install nfl-data-py")
+    sys.exit(1)
+
+try:
+    import pandas as pd
+except ImportError:
+    print("ERROR: pandas not installed. Run: pip install pandas pyarrow")
+    sys.exit(1)
+
+import nfl_schema
+import nflverse_loader
+
+ALL = None      # column spec meaning "every column"
+
+
+class NFLBuildSession:
+    """Loaded frames keyed by (dataset, year), plus the outputs of stages already run."""
+
+    def __init__(self):
+        self._frames: dict = {}       # (dataset, year) → DataFrame
+        self._read_with: dict = {}    # (dataset, year) → columns it was read with, or ALL
+        self._needs: dict = {}        # dataset → set of columns, or ALL
+        self._stats: dict = {}        # year → seasonal stats frame (None if unavailable)
+        self._snap_gp: dict = {}      # tuple(years) → SnapGP
+        self.outputs: dict = {}
+        self.reads = self.reuses = 0
+
+    # ── Column bookkeeping ──────────────────────────────────────────────────
+
+    def declare(self, dataset: str, columns: Optional[list]) -> None:
+        """Widen what will be read for dataset (columns=None means every column)."""
+        if columns is ALL or self._needs.get(dataset, set()) is ALL:
+            self._needs[dataset] = ALL
+        else:
+            self._needs[dataset] = self._needs.get(dataset, set()) | set(columns)
+
+    def _covers(self, key: tuple, columns: Optional[list]) -> bool:
+        read_with = self._read_with[key]
+        if read_with is ALL:
+            return True
+        return columns is not ALL and set(columns) <= read_with
+
+    # ── Loaders ─────────────────────────────────────────────────────────────
+
+    def frame(self, dataset: str, year: int, columns: Optional[list] = ALL) -> pd.DataFrame:
+        """One season of dataset with at least `columns`, read at most once."""
+        key = (dataset, year)
+        cached = self._frames.get(key)
+        if cached is not None and self._covers(key, columns):
+            self.reuses += 1
+            return cached
+
+        self.declare(dataset, columns)
+        needs = self._needs[dataset]
+        df = nflverse_loader.read(dataset, year, None if needs is ALL else sorted(needs))
+        df = nfl_schema.normalize(df, dataset)
+        self._frames[key] = df
+        self._read_with[key] = needs if needs is ALL else set(needs)
+        self.reads += 1
+        return df
+
+    def load(self, dataset: str, years, columns: Optional[list] = ALL) -> pd.DataFrame:
+        """Seasons concatenated and projected to `columns` (a fresh frame the caller may modify)."""
+        parts = []
+        for year in years:
+            df = self.frame(dataset, year, columns)
+            if columns is not ALL:
+                df = df[[c for c in columns if c in df.columns]]
+            parts.append(df)
+        return nfl_schema.concat(parts)
+
+    def seasonal_stats(self, years) -> Optional[pd.DataFrame]:
+        """Regular-season stats per player-season.
+
+        - Years ≤ 2024: nfl_data_py import_seasonal_data (one season at a time,
+          so overlapping ranges share seasons; its aggregation is per season)
+        - Years ≥ 2025: the stats_player_reg release file
+        'interceptions' is the QB ints column in both. Only
+        CAREER_STATS_COLUMNS are kept.
+        """
+        frames = []
+        for year in years:
+            if year not in self._stats:
+                self._stats[year] = self._load_stats_year(year)
+            else:
+                self.reuses += 1
+            if self._stats[year] is not None:
+                frames.append(self._stats[year])
+        if not frames:
+            return None
+        return nfl_schema.concat(frames)
+
+    def _load_stats_year(self, year: int) -> Optional[pd.DataFrame]:
+        self.reads += 1
+        if year <= 2024:
+            df = nfl.import_seasonal_data([year])
+            if df is None or df.empty:
+                return None
+            return nfl_schema.normalize(df, "seasonal_stats", nflverse_loader.CAREER_STATS_COLUMNS)
+        url = nflverse_loader.DATASETS["stats_player_reg"].format(year=year)
+        print(f"  Fetching {year} stats from nflverse-data ({url})...")
+        try:
+            df = self.frame("stats_player_reg", year, nflverse_loader.CAREER_STATS_COLUMNS)
+        except Exception as e:
+            print(f"  WARNING: Could not fetch {year} stats: {e}")
+            return None
+        print(f"    → {len(df)} rows loaded for {year}")
+        return df[[c for c in nflverse_loader.CAREER_STATS_COLUMNS if c in df.columns]]
+
+    def snap_gp(self, years, refresh: bool = False):
+        """Snap-count games played (nfl_snap_counts.SnapGP) for these seasons."""
+        from nfl_snap_counts import load_snap_gp
+        key = tuple(years)
+        if key not in self._snap_gp:
+            self._snap_gp[key] = load_snap_gp(years, refresh=refresh)
+        return self._snap_gp[key]
+
+    def report(self) -> None:
+        print(f"  [nfl session] {self.reads} dataset-seasons read, {self.reuses} served from memory")
+        nfl_schema.report()
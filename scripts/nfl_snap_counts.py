@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+nfl_snap_counts.py — Games played per (player, season, team) from nflverse snap counts.
+
+Defensive players, kickers and offensive linemen have no stat columns, so the
+NFL pool scripts count their games from import_snap_counts: one row per player
+per game, so games played = rows per (pfr_player_id, season, team). Players
+whose pfr_id is missing from the rosters are matched on a normalised name
+(lowercase, accents stripped) instead.
+
+Both generate_nfl_lineup_pool.py and patch_nfl_oline_kicker_pool.py used to
+build those two lookups with the same iterrows loop over ~300k rows. Here the
+counts are one groupby().size() each, stored as MultiIndex Series
+(key, season, team) → gp, and saved to scripts/.nfl_derived/ so the second
+script (or a re-run) reads a few thousand aggregated rows instead of
+re-downloading and re-counting the raw snaps.
+
+Usage:
+    from nfl_snap_counts import load_snap_gp, normalize_name
+
+    snap_gp = load_snap_gp(SNAP_YEARS)
+    player_snap_gp = snap_gp.games(pfr_id, normalize_name(name))
+    # → {(season, team): gp}, pfr_id counts winning over name counts
+"""
+
+import os
+import sys
+import time
+
+try:
+    import pandas as pd
+except ImportError:
+    print("ERROR: pandas not installed. Run: pip install pandas pyarrow")
+    sys.exit(1)
+
+import nflverse_loader
+
+# ─── Config ───────────────────────────────────────────────────────────────────
+
+DERIVED_DIR = os.environ.get(
+    "NFL_DERIVED_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".nfl_derived"))
+SNAP_GP_TTL = 24 * 3600     # the current season's snaps change weekly
+
+SNAP_COLUMNS = ["season", "team", "pfr_player_id", "player"]
+
+MISSING = ("nan", "None", "")   # what safe_str treats as empty
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, accents stripped — the key for the name fallback."""
+    return name.lower().encode("ascii", "ignore").decode()
+
+
+def _clean(col: pd.Series) -> pd.Series:
+    s = col.astype(str)
+    return s.where(~s.isin(MISSING), "")
+
+
+# ─── Aggregation ──────────────────────────────────────────────────────────────
+
+def aggregate(snaps_df: pd.DataFrame) -> pd.DataFrame:
+    """Raw snap rows → one row per (kind, key, season, team) with its gp count.
+
+    kind is "pfr" (key = pfr_player_id) or "name" (key = normalised player name).
+    Rows without a season or team are ignored, as are empty ids / names.
+    """
+    season = pd.to_numeric(snaps_df["season"], errors="coerce").fillna(0).astype("int64")
+    team   = _clean(snaps_df["team"])
+    keep   = (season != 0) & ~team.isin(("", "???"))
+
+    frame = pd.DataFrame({"season": season, "team": team})[keep]
+    pfr   = _clean(snaps_df["pfr_player_id"])[keep]
+    raw   = _clean(snaps_df["player"])[keep]
+    name  = raw.str.lower().str.encode("ascii", "ignore").str.decode("ascii")
+
+    parts = []
+    for kind, key, valid in (("pfr", pfr, pfr != ""), ("name", name, raw != "")):
+        gp = (frame[valid].assign(key=key[valid])
+                          .groupby(["key", "season", "team"], sort=True).size()
+                          .rename("gp").reset_index())
+        parts.append(gp.assign(kind=kind))
+    return pd.concat(parts, ignore_index=True)[["kind", "key", "season", "team", "gp"]]
+
+
+# ─── Lookup ───────────────────────────────────────────────────────────────────
+
+class SnapGP:
+    """(key, season, team) → gp for pfr ids and names, with per-key slices precomputed."""
+
+    def __init__(self, table: pd.DataFrame):
+        self.pfr  = self._series(table[table["kind"] == "pfr"])
+        self.name = self._series(table[table["kind"] == "name"])
+        self._pos = {kind: s.groupby(level="key", sort=False).indices
+                     for kind, s in (("pfr", self.pfr), ("name", self.name))}
+
+    @staticmethod
+    def _series(rows: pd.DataFrame) -> pd.Series:
+        return rows.set_index(["key", "season", "team"])["gp"].sort_index()
+
+    def _lookup(self, kind: str, key: str) -> dict:
+        pos = self._pos[kind].get(key)
+        if pos is None:
+            return {}
+        s = self.pfr if kind == "pfr" else self.name
+        part = s.iloc[pos]
+        return {(int(season), team): int(gp)
+                for (_, season, team), gp in zip(part.index, part.to_numpy())}
+
+    def games(self, pfr_id: str, norm_name: str) -> dict:
+        """{(season, team): gp} for one player; pfr_id counts beat name counts for the same key."""
+        by_pfr = self._lookup("pfr", pfr_id) if pfr_id else {}
+        return {**self._lookup("name", norm_name), **by_pfr}
+
+    def __repr__(self) -> str:
+        return f"{len(self._pos['pfr'])} players (pfr), {len(self._pos['name'])} (name)"
+
+
+def snap_gp_path(years) -> str:
+    return os.path.join(DERIVED_DIR, f"snap_gp_{min(years)}_{max(years)}.parquet")
+
+
+def load_snap_gp(years, refresh: bool = False) -> SnapGP:
+    """The saved aggregate for these years if fresh, otherwise rebuilt from the snap_counts release."""
+    path = snap_gp_path(years)
+    if not refresh and os.path.exists(path) and time.time() - os.path.getmtime(path) < SNAP_GP_TTL:
+        print(f"  Snap GP table from {os.path.relpath(path)}")
+        return SnapGP(pd.read_parquet(path))
+
+    snaps_df = nflverse_loader.load("snap_counts", years, columns=SNAP_COLUMNS)
+    if snaps_df is None or snaps_df.empty:
+        return SnapGP(pd.DataFrame({"kind": [], "key": [], "season": [], "team": [], "gp": []}))
+
+    table = aggregate(snaps_df)
+    os.makedirs(DERIVED_DIR, exist_ok=True)
+    tmp = path + ".tmp"
+    table.to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+    print(f"  {len(snaps_df)} snap rows → {len(table)} (key, season, team) counts, saved to {os.path.relpath(path)}")
+    return SnapGP(table)
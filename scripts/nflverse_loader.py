@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+nflverse_loader.py — Column-projected, filtered reads of nflverse release files.
+
+nfl_data_py's loaders read whole files: every roster column for every year,
+every weekly stat column for every week, then the scripts keep ~20 columns
+and a fraction of the rows. Here each generator declares what it needs:
+
+    load("weekly_rosters", years, columns=["player_id", "season", "week", "jersey_number"])
+    read("player_stats", 2024, columns=WEEKLY_COLUMNS, where={"week": [1, 2, 3]})
+
+Mirrored files (see nflverse_mirror.py) are scanned with pyarrow.dataset:
+only the requested columns are decoded and the `where` filters (column → allowed
+values) are pushed into the scan, so skipped row groups are never read and
+filtered rows never become pandas objects. With the mirror off the file is
+read through pandas as before and projected/filtered afterwards.
+
+Columns are named as the scripts see them: the same renames nfl_data_py applies
+(gsis_id → player_id, ...) and the ones the scripts used to do for the 2025+
+stats layout (team → recent_team, passing_interceptions → interceptions).
+Requested columns a year's file doesn't have are simply absent from that
+year's frame, like any other schema drift across seasons.
+
+Roster rows without a player_id (gsis id) are dropped in both paths, as
+nfl_data_py's roster loaders did; the filter is pushed into the scan and works
+whether or not player_id is among the requested columns.
+"""
+
+import sys
+from typing import Optional
+
+try:
+    import pandas as pd
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+except ImportError:
+    print("ERROR: pandas/pyarrow not installed. Run: pip install pandas pyarrow")
+    sys.exit(1)
+
+import nflverse_mirror
+
+# ─── Datasets ─────────────────────────────────────────────────────────────────
+
+RELEASES = "https://github.com/nflverse/nflverse-data/releases/download/"
+
+DATASETS = {
+    "rosters":           RELEASES + "rosters/roster_{year}.parquet",
+    "weekly_rosters":    RELEASES + "weekly_rosters/roster_weekly_{year}.parquet",
+    "snap_counts":       RELEASES + "snap_counts/snap_counts_{year}.parquet",
+    "depth_charts":      RELEASES + "depth_charts/depth_charts_{year}.parquet",
+    "player_stats":      RELEASES + "player_stats/player_stats_{year}.parquet",        # weekly, ≤ 2024
+    "stats_player_week": RELEASES + "stats_player/stats_player_week_{year}.parquet",   # weekly, 2025+
+    "stats_player_reg":  RELEASES + "stats_player/stats_player_reg_{year}.parquet",    # season, 2025+
+}
+
+ROSTER_RENAMES = {"gsis_id": "player_id", "full_name": "player_name"}
+
+# source column → name used by the scripts (applied only if the target is absent)
+RENAMES = {
+    "rosters":           ROSTER_RENAMES,
+    "weekly_rosters":    ROSTER_RENAMES,
+    "stats_player_week": {"team": "recent_team", "passing_interceptions": "interceptions"},
+    "stats_player_reg":  {"passing_interceptions": "interceptions"},
+}
+
+# Rows dropped when any of these (script-named) columns is null, as nfl_data_py's
+# roster loaders did with dropna(subset=["player_id"]).
+REQUIRED = {
+    "rosters":        ["player_id"],
+    "weekly_rosters": ["player_id"],
+}
+
+# Roster fields the career / lineup-pool builders use.
+CAREER_ROSTER_COLUMNS = [
+    "player_id", "player_name", "season", "position", "team", "pfr_id",
+    "height", "weight", "college", "years_exp", "draft_club", "draft_number",
+]
+
+# Seasonal stat fields the career / lineup-pool builders use.
+CAREER_STATS_COLUMNS = [
+    "player_id", "season", "recent_team", "games",
+    "completions", "attempts", "passing_yards", "passing_tds", "interceptions",
+    "carries", "rushing_yards", "rushing_tds",
+    "targets", "receptions", "receiving_yards", "receiving_tds",
+]
+
+
+def _renames(dataset: str, names) -> dict:
+    """source → script name for this file's columns."""
+    names = set(names)
+    return {src: dst for src, dst in RENAMES.get(dataset, {}).items()
+            if src in names and dst not in names}
+
+
+# ─── Reads ────────────────────────────────────────────────────────────────────
+
+def read(dataset: str, year: int, columns: Optional[list] = None,
+         where: Optional[dict] = None) -> pd.DataFrame:
+    """One year of a dataset, projected to `columns` and filtered by `where` {column: values}."""
+    url    = DATASETS[dataset].format(year=year)
+    mirror = nflverse_mirror.open_mirror()
+    where  = where or {}
+
+    if mirror is None:
+        df = pd.read_parquet(url)
+        df = df.rename(columns=_renames(dataset, df.columns))
+        required = [c for c in REQUIRED.get(dataset, []) if c in df.columns]
+        if required:
+            df = df.dropna(subset=required)
+        for col, values in where.items():
+            if col in df.columns:
+                df = df[df[col].isin(list(values))]
+        if columns is not None:
+            df = df[[c for c in columns if c in df.columns]]
+        return df.reset_index(drop=True)
+
+    data   = ds.dataset(mirror.local_path(url), format="parquet")
+    names  = data.schema.names
+    rename = _renames(dataset, names)
+    source = {dst: src for src, dst in rename.items()}   # script name → file column
+
+    def src(col):
+        return source.get(col, col)
+
+    projection = None
+    if columns is not None:
+        projection = [src(c) for c in columns if src(c) in names]
+
+    expr = None
+    for col, values in where.items():
+        if src(col) not in names:
+            continue
+        term = pc.field(src(col)).isin(list(values))
+        expr = term if expr is None else expr & term
+    for col in REQUIRED.get(dataset, []):
+        if src(col) in names:
+            term = pc.field(src(col)).is_valid()
+            expr = term if expr is None else expr & term
+
+    table = data.to_table(columns=projection, filter=expr)
+    return table.to_pandas().rename(columns=rename)
+
+
+def load(dataset: str, years, columns: Optional[list] = None,
+         where: Optional[dict] = None) -> pd.DataFrame:
+    """read() for each year, concatenated (the import_* equivalent)."""
+    return pd.concat([read(dataset, y, columns, where) for y in years], ignore_index=True)
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+nflverse_mirror.py — Local, pinned mirror of the nflverse release files the NFL scripts read.
+
+Every nfl_data_py loader (import_seasonal_rosters, import_seasonal_data,
+import_weekly_rosters, import_snap_counts, import_schedules,
+import_depth_charts, ...) is a pandas.read_parquet / read_csv of a GitHub
+release URL, and the scripts read a few URLs directly too. Without a mirror
+every run re-downloads the same multi-year files.
+
+install() routes every http(s) read_parquet / read_csv through the mirror:
+the first read of a URL downloads it once into MIRROR_DIR, records it in
+manifest.json and reads the local copy; later reads (any script, any run)
+never touch the network.
+
+    manifest.json   {url: {"path", "sha256", "size", "fetched"}}
+
+The manifest pins the snapshot: a rebuild against the same mirror reads
+byte-identical inputs, and a file whose checksum no longer matches is an error
+rather than silently used.
+
+  --refresh   re-download every file this run reads (once each), re-pinning it
+  --offline   never download; a file missing from the mirror is an error
+
+(or NFLVERSE_REFRESH=1 / NFLVERSE_OFFLINE=1). NFLVERSE_MIRROR=0 turns the
+mirror off, e.g. under the bench harness, which serves its own snapshots.
+
+Usage:
+    import nflverse_mirror
+    nflverse_mirror.install()              # at the top of main()
+
+    path = nflverse_mirror.open_mirror().local_path(url)   # non-pandas readers
+
+    python nflverse_mirror.py              # list mirrored files
+    python nflverse_mirror.py --verify     # re-hash everything against the manifest
+
+Location: scripts/.nflverse_mirror/  (override with NFLVERSE_MIRROR_DIR)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+import urllib.request
+from typing import Optional
+from urllib.parse import urlparse
+
+# ─── Config ───────────────────────────────────────────────────────────────────
+
+MIRROR_DIR = os.environ.get("NFLVERSE_MIRROR_DIR") or \
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".nflverse_mirror")
+
+DOWNLOAD_TIMEOUT = 120
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").lower() in ("1", "true", "yes")
+
+
+def _sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+# ─── Mirror ───────────────────────────────────────────────────────────────────
+
+class NflverseMirror:
+    """URL → local file, downloaded at most once and pinned by checksum."""
+
+    def __init__(self, root: str = MIRROR_DIR, refresh: bool = False, offline: bool = False):
+        self.root = root
+        self.manifest_path = os.path.join(root, "manifest.json")
+        self.refresh = refresh
+        self.offline = offline
+        self._manifest = self._load_manifest()
+        self._verified: set = set()     # checked this process
+        self._refreshed: set = set()    # re-downloaded this process (--refresh)
+        self._lock = threading.Lock()
+        self.hits = self.downloads = 0
+        self.bytes_downloaded = self.bytes_served = 0
+
+    def _load_manifest(self) -> dict:
+        try:
+            with open(self.manifest_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self) -> None:
+        # Merge with the file on disk: worker processes (generate_nfl_box_scores
+        # --workers) each download different files into the same mirror
+        self._manifest = {**self._load_manifest(), **self._manifest}
+        os.makedirs(self.root, exist_ok=True)
+        tmp = f"{self.manifest_path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(self._manifest, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.manifest_path)
+
+    def path_for(self, url: str) -> str:
+        u = urlparse(url)
+        return os.path.join(self.root, u.netloc, *[p for p in u.path.split("/") if p])
+
+    def _download(self, url: str, path: str) -> dict:
+        if self.offline:
+            raise FileNotFoundError(f"offline: {url} is not in the nflverse mirror ({self.root})")
+        print(f"  [mirror] downloading {url}")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as resp, open(tmp, "wb") as out:
+            while chunk := resp.read(1 << 20):
+                out.write(chunk)
+        os.replace(tmp, path)
+        entry = {
+            "path":    os.path.relpath(path, self.root),
+            "sha256":  _sha256(path),
+            "size":    os.path.getsize(path),
+            "fetched": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+        self.downloads += 1
+        self.bytes_downloaded += entry["size"]
+        return entry
+
+    def local_path(self, url: str) -> str:
+        """Local copy of url, downloading it first if it is not mirrored yet (or --refresh)."""
+        with self._lock:
+            entry = self._manifest.get(url)
+            path  = self.path_for(url)
+            stale = self.refresh and url not in self._refreshed
+
+            if entry is None or stale or not os.path.exists(path):
+                self._manifest[url] = entry = self._download(url, path)
+                self._refreshed.add(url)
+                self._verified.add(url)
+                self._save_manifest()
+            else:
+                if url not in self._verified:
+                    if _sha256(path) != entry["sha256"]:
+                        raise ValueError(f"nflverse mirror: checksum mismatch for {path} "
+                                         f"(pinned {entry['sha256'][:12]}…); re-run with --refresh")
+                    self._verified.add(url)
+                self.hits += 1
+            self.bytes_served += entry["size"]
+            return path
+
+    def verify(self) -> list[str]:
+        """URLs whose mirrored file is missing or no longer matches the manifest."""
+        bad = []
+        for url, entry in sorted(self._manifest.items()):
+            path = os.path.join(self.root, entry["path"])
+            if not os.path.exists(path) or _sha256(path) != entry["sha256"]:
+                bad.append(url)
+        return bad
+
+    def report(self) -> None:
+        mb = 1024 * 1024
+        print(f"  [nflverse mirror] {self.hits} files from disk ({self.bytes_served / mb:.1f} MB read), "
+              f"{self.downloads} downloaded ({self.bytes_downloaded / mb:.1f} MB)")
+
+
+MIRROR: Optional[NflverseMirror] = None
+
+
+def open_mirror(refresh: Optional[bool] = None, offline: Optional[bool] = None) -> Optional[NflverseMirror]:
+    """The process-wide mirror, or None if NFLVERSE_MIRROR=0.
+
+    refresh / offline default to the --refresh / --offline command-line flags
+    (or NFLVERSE_REFRESH / NFLVERSE_OFFLINE).
+    """
+    global MIRROR
+    if os.environ.get("NFLVERSE_MIRROR", "1") == "0":
+        return None
+    if MIRROR is None:
+        if refresh is None:
+            refresh = "--refresh" in sys.argv or _env_flag("NFLVERSE_REFRESH")
+        if offline is None:
+            offline = "--offline" in sys.argv or _env_flag("NFLVERSE_OFFLINE")
+        MIRROR = NflverseMirror(refresh=refresh, offline=offline)
+    return MIRROR
+
+
+_installed = False
+
+
+def install(refresh: Optional[bool] = None, offline: Optional[bool] = None) -> Optional[NflverseMirror]:
+    """Serve every http(s) pandas.read_parquet / read_csv from the mirror. Safe to call twice."""
+    global _installed
+    mirror = open_mirror(refresh, offline)
+    if mirror is None or _installed:
+        return mirror
+
+    try:
+        import pandas as pd
+    except ImportError:
+        print("ERROR: pandas not installed. Run: pip install pandas pyarrow")
+        sys.exit(1)
+
+    read_parquet, read_csv = pd.read_parquet, pd.read_csv
+
+    def localize(src):
+        if isinstance(src, str) and src.startswith(("http://", "https://")):
+            return mirror.local_path(src)
+        return src
+
+    def mirrored_read_parquet(path, *args, **kwargs):
+        return read_parquet(localize(path), *args, **kwargs)
+
+    def mirrored_read_csv(path, *args, **kwargs):
+        return read_csv(localize(path), *args, **kwargs)
+
+    pd.read_parquet = mirrored_read_parquet
+    pd.read_csv     = mirrored_read_csv
+    _installed = True
+    return mirror
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Accept --refresh / --offline in scripts that parse their own arguments (install() reads them)."""
+    parser.add_argument("--refresh", action="store_true",
+                        help="Re-download the nflverse files this run reads and re-pin them")
+    parser.add_argument("--offline", action="store_true",
+                        help="Read nflverse files only from the local mirror; never download")
+
+
+# ─── CLI ──────────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or verify the local nflverse mirror.")
+    parser.add_argument("--verify", action="store_true", help="Re-hash every mirrored file")
+    args = parser.parse_args()
+
+    mirror = NflverseMirror()
+    entries = mirror._manifest
+    total = sum(e["size"] for e in entries.values())
+    print(f"{len(entries)} files in {mirror.root} ({total / (1024 * 1024):.1f} MB)")
+    for url, entry in sorted(entries.items()):
+        print(f"  {entry['fetched']}  {entry['size'] / 1024:>9.0f} KB  {entry['sha256'][:12]}  {url}")
+
+    if args.verify:
+        bad = mirror.verify()
+        if bad:
+            print(f"\n{len(bad)} file(s) missing or modified:")
+            for url in bad:
+                print(f"  {url}")
+            sys.exit(1)
+        print("\nAll files match the manifest.")
+
+
+if __name__ == "__main__":
+    main()
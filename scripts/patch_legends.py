@@ -13,6 +13,7 @@ After: cp data/nfl_careers.json ../public/data/nfl_careers.json
 """
 
 import json, os
+from typing import Optional
 
 CAREERS_PATH = os.path.join(os.path.dirname(__file__), "data", "nfl_careers.json")
 POOL_PATH    = os.path.join(os.path.dirname(__file__), "data", "nfl_lineup_pool.json")
@@ -755,37 +756,75 @@ NEW_PLAYERS = [
 ]
 
 
-def main():
-    with open(CAREERS_PATH) as f:
-        careers = json.load(f)
+# ─── Apply ────────────────────────────────────────────────────────────────────
 
-    careers_by_id = {str(p["player_id"]): p for p in careers}
+def prepend_pre1999(careers: list) -> list[tuple[str, Optional[dict], int]]:
+    """Add the missing PRE1999_PATCHES seasons in place.
 
-    # ── Patch pre-1999 seasons onto existing players ──────────────────────────
-    patched = 0
+    Returns (player_id, player or None if not in careers, seasons added) per patch.
+    """
+    careers_by_id = {str(p["player_id"]): p for p in careers}
+    results = []
     for pid, seasons in PRE1999_PATCHES.items():
         player = careers_by_id.get(pid)
         if not player:
-            print(f"  WARNING: {pid} not found — skipping")
+            results.append((pid, None, 0))
             continue
         existing = {s["season"] for s in player["seasons"]}
         new = [s for s in seasons if s["season"] not in existing]
-        if not new:
-            print(f"  {player['player_name']}: already complete")
-            continue
-        player["seasons"] = sorted(player["seasons"] + new, key=lambda s: s["season"])
-        print(f"  {player['player_name']}: +{len(new)} seasons prepended")
-        patched += 1
+        if new:
+            player["seasons"] = sorted(player["seasons"] + new, key=lambda s: s["season"])
+        results.append((pid, player, len(new)))
+    return results
 
-    # ── Add brand-new entries ─────────────────────────────────────────────────
+
+def add_new_players(careers: list) -> tuple[list, list]:
+    """Append the NEW_PLAYERS not already in careers, in place; returns (added, already present)."""
     existing_ids = {str(p["player_id"]) for p in careers}
-    added = 0
+    added, present = [], []
     for player in NEW_PLAYERS:
         if str(player["player_id"]) in existing_ids:
-            print(f"  {player['player_name']}: already present — skipping")
+            present.append(player)
             continue
         careers.append(player)
-        added += 1
+        added.append(player)
+    return added, present
+
+
+def apply_bio_fixes(players: list) -> int:
+    """Apply BIO_FIXES in place; returns how many players were patched."""
+    by_id = {str(p["player_id"]): p for p in players}
+    bio_patched = 0
+    for pid, fixes in BIO_FIXES.items():
+        player = by_id.get(pid)
+        if not player:
+            continue
+        player.setdefault("bio", {}).update(fixes)
+        bio_patched += 1
+    return bio_patched
+
+
+def main():
+    with open(CAREERS_PATH) as f:
+        careers = json.load(f)
+
+    # ── Patch pre-1999 seasons onto existing players ──────────────────────────
+    patched = 0
+    for pid, player, n_new in prepend_pre1999(careers):
+        if player is None:
+            print(f"  WARNING: {pid} not found — skipping")
+        elif not n_new:
+            print(f"  {player['player_name']}: already complete")
+        else:
+            print(f"  {player['player_name']}: +{n_new} seasons prepended")
+            patched += 1
+
+    # ── Add brand-new entries ─────────────────────────────────────────────────
+    added_players, present = add_new_players(careers)
+    for player in present:
+        print(f"  {player['player_name']}: already present — skipping")
+    added = len(added_players)
+    for player in added_players:
         pos = player["position"]
         if pos == "QB":
             yds = sum(s["passing_yards"] for s in player["seasons"])
@@ -813,14 +852,7 @@ def main():
             continue
         with open(path) as f:
             players = json.load(f)
-        by_id = {str(p["player_id"]): p for p in players}
-        bio_patched = 0
-        for pid, fixes in BIO_FIXES.items():
-            player = by_id.get(pid)
-            if not player:
-                continue
-            player.setdefault("bio", {}).update(fixes)
-            bio_patched += 1
+        bio_patched = apply_bio_fixes(players)
         with open(path, "w") as f:
             json.dump(players, f, separators=(",", ":"))
         print(f"  {label}: {bio_patched} bio fields updated")
@@ -25,6 +25,12 @@ Run:
     cd scripts
     python patch_nba_fg3m.py [--skip-api]   # --skip-api skips API fetch (totals only)
 
+Per-player frames are read from the local career store (nba_career_store.py)
+first, then the shared nba_api cache (nba_cache.py), so players already fetched
+by the career generators cost no API call. For players in the store,
+generate_nba_careers.py / generate_nba_lineup_pool.py --from-store now emit
+these fields directly.
+
 Then copy outputs:
     cp data/nba_lineup_pool.json ../public/data/nba_lineup_pool.json
     cp data/nba_careers.json ../public/data/nba_careers.json
@@ -34,7 +40,6 @@ import json
 import math
 import os
 import sys
-import time
 
 SKIP_API = "--skip-api" in sys.argv
 
@@ -44,8 +49,12 @@ if not SKIP_API:
     except ImportError:
         print("ERROR: nba_api not installed. Run: pip install nba_api")
         sys.exit(1)
+    import nba_career_store as store
+
+from fetch_scheduler import FetchScheduler
+from nba_cache import CACHE
 
-REQUEST_DELAY = 1.5
+SCHEDULER = FetchScheduler(workers=1, label="nba fg3m patch")
 
 SCRIPT_DIR   = os.path.dirname(__file__)
 LINEUP_PATH  = os.path.join(SCRIPT_DIR, "data", "nba_lineup_pool.json")
@@ -84,41 +93,40 @@ def compute_totals(season: dict) -> None:
         season["total_pf"]  = round((season.get("pf")   or 0) * gp)
 
 
+def extra_stats_from_frame(df) -> dict:
+    """{season_id: {fg3m, ftm, pf}} from a PlayerCareerStats per-game frame (TOT row for traded players)."""
+    result = {}
+    for season_id, group in df.groupby("SEASON_ID", sort=False):
+        tot = group[group["TEAM_ABBREVIATION"] == "TOT"]
+        src = tot.iloc[0] if not tot.empty else group.iloc[0]
+        result[str(season_id)] = {
+            "fg3m": safe_float(src.get("FG3M"), 1),
+            "ftm":  safe_float(src.get("FTM"),  1),
+            "pf":   safe_float(src.get("PF"),   1),
+        }
+    return result
+
+
 def fetch_extra_stats_by_season(player_id: int) -> dict:
     """
     Returns {season_id: {fg3m, ftm, pf}} per game for all seasons.
-    Uses TOT row for traded players. Returns empty dict on total failure.
+    Reads the local career store first; only players never stored there hit
+    the API. Returns empty dict on total failure.
     """
-    result = {}
-    retry_delays = [5, 15, 30]
-    for attempt in range(4):
-        if attempt > 0:
-            wait = retry_delays[attempt - 1]
-            print(f"      Retry {attempt}/3 (waiting {wait}s)...")
-            time.sleep(wait)
-        try:
-            career = PlayerCareerStats(player_id=player_id, per_mode36="PerGame")
-            time.sleep(REQUEST_DELAY)
-            df = career.get_data_frames()[0]
-            if df.empty:
-                return result
-            for season_id, group in df.groupby("SEASON_ID", sort=False):
-                tot = group[group["TEAM_ABBREVIATION"] == "TOT"]
-                src = tot.iloc[0] if not tot.empty else group.iloc[0]
-                result[str(season_id)] = {
-                    "fg3m": safe_float(src.get("FG3M"), 1),
-                    "ftm":  safe_float(src.get("FTM"),  1),
-                    "pf":   safe_float(src.get("PF"),   1),
-                }
-            return result
-        except Exception as e:
-            err_str = str(e)
-            print(f"      API error: {e}")
-            if "resultSet" in err_str or "resultSets" in err_str:
-                return result
-            if attempt == 3:
-                return result
-    return result
+    stored = store.load_career(player_id)
+    if stored is not None:
+        return extra_stats_from_frame(stored)
+
+    try:
+        career = CACHE.fetch(PlayerCareerStats, SCHEDULER, player_id=player_id, per_mode36="PerGame")
+        df = career.get_data_frames()[0]
+    except Exception as e:
+        print(f"      API error: {e}")
+        return {}
+    if df.empty:
+        return {}
+    store.save_career(player_id, df)
+    return extra_stats_from_frame(df)
 
 
 def build_lineup_pool_index(lineup_path: str) -> dict:
@@ -245,6 +253,8 @@ def main():
     print("\nDone. Next steps:")
     print("  cp scripts/data/nba_lineup_pool.json public/data/nba_lineup_pool.json")
     print("  cp scripts/data/nba_careers.json public/data/nba_careers.json")
+    if "--cache-stats" in sys.argv:
+        CACHE.report()
 
 
 if __name__ == "__main__":
@@ -328,6 +328,15 @@ NBA_LEGENDS = [
 # Always replaces existing legend entries (identified by negative player_id)
 # so re-running picks up any updates to stats or bio above.
 
+def apply_legends(players: list) -> tuple[list, int]:
+    """players with every NBA_LEGENDS entry (re)appended; also returns how many were replaced."""
+    legend_ids = {l["player_id"] for l in NBA_LEGENDS}
+
+    # Remove existing legend entries so we can re-add the updated versions.
+    kept = [p for p in players if p["player_id"] not in legend_ids]
+    return kept + NBA_LEGENDS, len(players) - len(kept)
+
+
 def inject(path: str, label: str) -> None:
     if not os.path.exists(path):
         print(f"File not found, skipping: {path}")
@@ -336,15 +345,9 @@ def inject(path: str, label: str) -> None:
     with open(path) as f:
         players = json.load(f)
 
-    legend_ids = {l["player_id"] for l in NBA_LEGENDS}
-
-    # Remove existing legend entries so we can re-add the updated versions.
-    before = len(players)
-    players = [p for p in players if p["player_id"] not in legend_ids]
-    removed = before - len(players)
+    players, removed = apply_legends(players)
 
     for legend in NBA_LEGENDS:
-        players.append(legend)
         action = "UPDATE" if removed > 0 else "ADD   "
         print(f"  {action} {legend['player_name']} ({len(legend['seasons'])} seasons) → {label}")
 
@@ -18,20 +18,25 @@ After running:
 """
 
 import json
-import math
 import os
 import sys
-import time
-from typing import Optional
+from typing import Union
 
 try:
-    from nba_api.stats.endpoints import LeagueDashPlayerStats, PlayerCareerStats
-    from nba_api.stats.endpoints import commonplayerinfo as CommonPlayerInfoModule
+    from nba_api.stats.endpoints import PlayerCareerStats
 except ImportError:
     print("ERROR: nba_api not installed. Run: pip install nba_api")
     sys.exit(1)
 
-REQUEST_DELAY = 1.5
+from checkpoint_journal import CheckpointJournal, FetchError
+from fetch_scheduler import FetchScheduler, is_no_data_error
+from nba_cache import CACHE
+import nba_bio_index as bio_index
+import nba_career_store as store
+import nba_season_scan as season_scan
+from nba_season_scan import season_str
+
+WORKERS = 4   # players fetched concurrently (pace set by fetch_scheduler)
 MIN_PPG       = 3.0
 MIN_GP        = 20
 SCAN_YEARS    = list(range(2010, 2019))  # 2010-11 through 2018-19
@@ -39,144 +44,44 @@ SCAN_YEARS    = list(range(2010, 2019))  # 2010-11 through 2018-19
 DATA_DIR     = os.path.join(os.path.dirname(__file__), "data")
 LINEUP_PATH  = os.path.join(DATA_DIR, "nba_lineup_pool.json")
 CAREERS_PATH = os.path.join(DATA_DIR, "nba_careers.json")
-PARTIAL_PATH = LINEUP_PATH + ".historical_partial"
-
-
-def safe_float(val, decimals=1):
-    try:
-        if val is None: return 0.0
-        f = float(val)
-        if math.isnan(f) or math.isinf(f): return 0.0
-        return round(f, decimals)
-    except (ValueError, TypeError):
-        return 0.0
-
-
-def safe_int(val):
-    try:
-        if val is None: return 0
-        f = float(val)
-        if math.isnan(f) or math.isinf(f): return 0
-        return int(f)
-    except (ValueError, TypeError):
-        return 0
+SCHEDULER    = FetchScheduler(workers=WORKERS, label="nba historical")
+JOURNAL_PATH = LINEUP_PATH + ".historical_journal"
 
 
 def scan_seasons() -> dict[int, str]:
     """Scan 2010-18 seasons; return {player_id: player_name} for anyone with 3+ PPG."""
-    found: dict[int, str] = {}
-    seasons = [f"{y}-{str(y + 1)[-2:]}" for y in SCAN_YEARS]
+    seasons = [season_str(y) for y in SCAN_YEARS]
     print(f"Scanning {len(seasons)} seasons (2010-11 → 2018-19) for {MIN_PPG}+ PPG / {MIN_GP}+ GP...\n")
 
-    for i, season in enumerate(seasons):
-        try:
-            stats = LeagueDashPlayerStats(
-                season=season,
-                per_mode_detailed="PerGame",
-                season_type_all_star="Regular Season",
-            )
-            time.sleep(REQUEST_DELAY)
-            sdf = stats.get_data_frames()[0]
-            name_col = "PLAYER_NAME" if "PLAYER_NAME" in sdf.columns else "PLAYER"
-            count = 0
-            for _, row in sdf.iterrows():
-                try:
-                    pts = safe_float(row.get("PTS", 0))
-                    gp  = safe_int(row.get("GP", 0))
-                    if pts >= MIN_PPG and gp >= MIN_GP:
-                        pid = int(row["PLAYER_ID"])
-                        found[pid] = str(row.get(name_col, ""))
-                        count += 1
-                except (ValueError, TypeError):
-                    continue
-            print(f"  [{i+1}/{len(seasons)}] {season}: {count} qualifying players  ({len(found)} unique so far)")
-        except Exception as e:
-            print(f"  [{i+1}/{len(seasons)}] {season}: skipped ({e})")
-            time.sleep(REQUEST_DELAY)
+    scan  = season_scan.scan_seasons(seasons, [{"PTS": MIN_PPG, "GP": MIN_GP}], SCHEDULER)
+    found = season_scan.qualifying_players(scan)
 
     print(f"\nTotal unique qualifying player IDs: {len(found)}")
     return found
 
 
-def fetch_career(player_id: int, player_name: str) -> Optional[dict]:
-    """Fetch full career stats + bio. Retries up to 3 times on transient errors."""
-    retry_delays = [5, 15, 30]
-    for attempt in range(4):
-        if attempt > 0:
-            wait = retry_delays[attempt - 1]
-            print(f"    Retry {attempt}/3 for {player_name} (waiting {wait}s)...")
-            time.sleep(wait)
-        try:
-            career = PlayerCareerStats(player_id=player_id, per_mode36="PerGame")
-            time.sleep(REQUEST_DELAY)
-            season_df = career.get_data_frames()[0]
-            if season_df.empty:
-                return None
-
-            seasons = []
-            for season_id, group in season_df.groupby("SEASON_ID", sort=False):
-                tot_rows  = group[group["TEAM_ABBREVIATION"] == "TOT"]
-                team_rows = group[group["TEAM_ABBREVIATION"] != "TOT"]
-                if len(team_rows) <= 1 and tot_rows.empty:
-                    row = group.iloc[0]
-                    seasons.append({
-                        "season":  str(row.get("SEASON_ID", "")),
-                        "team":    str(row.get("TEAM_ABBREVIATION", "???")),
-                        "gp":      safe_int(row.get("GP")),
-                        "min":     safe_float(row.get("MIN")),
-                        "pts":     safe_float(row.get("PTS")),
-                        "reb":     safe_float(row.get("REB")),
-                        "ast":     safe_float(row.get("AST")),
-                        "stl":     safe_float(row.get("STL")),
-                        "blk":     safe_float(row.get("BLK")),
-                        "fg_pct":  safe_float(row.get("FG_PCT"), 3),
-                        "fg3_pct": safe_float(row.get("FG3_PCT"), 3),
-                    })
-                else:
-                    team_names = "/".join(team_rows["TEAM_ABBREVIATION"].tolist()) if not team_rows.empty else "???"
-                    src = tot_rows.iloc[0] if not tot_rows.empty else team_rows.iloc[0]
-                    seasons.append({
-                        "season":  str(season_id),
-                        "team":    team_names,
-                        "gp":      safe_int(src.get("GP")),
-                        "min":     safe_float(src.get("MIN")),
-                        "pts":     safe_float(src.get("PTS")),
-                        "reb":     safe_float(src.get("REB")),
-                        "ast":     safe_float(src.get("AST")),
-                        "stl":     safe_float(src.get("STL")),
-                        "blk":     safe_float(src.get("BLK")),
-                        "fg_pct":  safe_float(src.get("FG_PCT"), 3),
-                        "fg3_pct": safe_float(src.get("FG3_PCT"), 3),
-                    })
-
-            if not seasons:
-                return None
-
-            bio = {"height": "", "weight": 0, "school": "", "exp": 0, "draft_year": 0}
-            try:
-                info = CommonPlayerInfoModule.CommonPlayerInfo(player_id=player_id)
-                time.sleep(REQUEST_DELAY)
-                info_df = info.get_data_frames()[0]
-                if not info_df.empty:
-                    irow = info_df.iloc[0]
-                    bio["height"]     = str(irow.get("HEIGHT", "") or "")
-                    bio["weight"]     = safe_int(irow.get("WEIGHT"))
-                    bio["school"]     = str(irow.get("SCHOOL", "") or "")
-                    bio["exp"]        = safe_int(irow.get("SEASON_EXP"))
-                    dy = irow.get("DRAFT_YEAR")
-                    bio["draft_year"] = int(dy) if dy and str(dy).isdigit() else 0
-            except Exception as e:
-                print(f"    [warn] bio fetch failed for {player_name}: {e}")
-
-            return {"player_id": player_id, "player_name": player_name, "seasons": seasons, "bio": bio}
-
-        except Exception as e:
-            err_str = str(e)
-            print(f"    ERROR fetching {player_name} ({player_id}): {e}")
-            if "resultSet" in err_str or "resultSets" in err_str:
-                return None
-            if attempt == 3:
-                return None
+def fetch_career(player_id: int, player_name: str) -> Union[dict, None, FetchError]:
+    """Fetch full career stats + bio. Throttle errors are retried by the shared scheduler.
+
+    None if no usable data, FetchError if the fetch failed (retried on --resume).
+    """
+    try:
+        career = CACHE.fetch(PlayerCareerStats, SCHEDULER, player_id=player_id, per_mode36="PerGame")
+        season_df = career.get_data_frames()[0]
+        if season_df.empty:
+            return None
+        store.save_career(player_id, season_df)
+
+        seasons = store.build_seasons(season_df)
+        if not seasons:
+            return None
+
+        return {"player_id": player_id, "player_name": player_name, "seasons": seasons,
+                "bio": bio_index.player_bio(player_id, player_name, SCHEDULER)}
+
+    except Exception as e:
+        print(f"    ERROR fetching {player_name} ({player_id}): {e}")
+        return None if is_no_data_error(e) else FetchError(e)
 
 
 def main():
@@ -202,14 +107,11 @@ def main():
     skip_ids = pool_ids | career_ids
     print(f"Will skip {len(skip_ids)} already-known player IDs\n")
 
-    # Load partial checkpoint if resuming
-    done_ids: set[int] = set()
-    new_players: list[dict] = []
-    if resume and os.path.exists(PARTIAL_PATH):
-        with open(PARTIAL_PATH) as f:
-            new_players = json.load(f)
-        done_ids = {p["player_id"] for p in new_players}
-        print(f"Resuming: {len(new_players)} players already fetched\n")
+    # Replay the checkpoint journal if resuming (otherwise start a fresh one)
+    journal = CheckpointJournal(JOURNAL_PATH)
+    new_players, done_ids = journal.open(resume)
+    if resume:
+        print(f"Resuming: {len(done_ids)} players already fetched\n")
 
     # Scan historical seasons
     candidates = scan_seasons()
@@ -226,22 +128,19 @@ def main():
     print(f"  {len(to_fetch)} new players to fetch\n")
     print("Ctrl-C is safe — run with --resume to continue.\n")
 
-    for i, (pid, pname) in enumerate(to_fetch):
-        print(f"[{i+1}/{len(to_fetch)}] {pname}...", end=" ", flush=True)
-        result = fetch_career(pid, pname)
+    results = SCHEDULER.map(lambda p: fetch_career(*p), to_fetch)
+    for i, ((pid, pname), result) in enumerate(results):
+        journal.record(pid, result)
         if result:
             new_players.append(result)
-            print(f"OK ({len(result['seasons'])} seasons)")
+            print(f"[{i+1}/{len(to_fetch)}] {pname}: OK ({len(result['seasons'])} seasons)")
+        elif isinstance(result, FetchError):
+            print(f"[{i+1}/{len(to_fetch)}] {pname}: error (retried on --resume)")
         else:
-            print("skipped")
-
-        # Checkpoint every 50 players
-        if (i + 1) % 50 == 0:
-            with open(PARTIAL_PATH, "w") as f:
-                json.dump(new_players, f, separators=(",", ":"))
-            print(f"  [checkpoint: {len(new_players)} new players saved]\n")
+            print(f"[{i+1}/{len(to_fetch)}] {pname}: skipped")
 
     if not new_players:
+        journal.close(remove=True)
         print("No new players to add.")
         return
 
@@ -249,13 +148,14 @@ def main():
     updated_pool = existing_pool + new_players
     with open(LINEUP_PATH, "w") as f:
         json.dump(updated_pool, f, separators=(",", ":"))
-
-    # Clean up partial file
-    if os.path.exists(PARTIAL_PATH):
-        os.remove(PARTIAL_PATH)
+    journal.close(remove=True)
 
     size_kb = os.path.getsize(LINEUP_PATH) / 1024
     print(f"\nDone! Added {len(new_players)} new players  |  {len(updated_pool)} total  |  {size_kb:.1f} KB")
+    SCHEDULER.report()
+    bio_index.INDEX.report()
+    if "--cache-stats" in sys.argv:
+        CACHE.report()
     print(f"Next: cp data/nba_lineup_pool.json ../public/data/nba_lineup_pool.json")
 
 
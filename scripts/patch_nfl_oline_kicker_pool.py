@@ -20,18 +20,17 @@ import json
 import os
 import sys
 
-try:
-    import nfl_data_py as nfl
-except ImportError:
-    print("ERROR: nfl_data_py not installed. Run: pip install nfl-data-py")
-    sys.exit(1)
-
 try:
     import pandas as pd
 except ImportError:
     print("ERROR: pandas not installed. Run: pip install pandas pyarrow")
     sys.exit(1)
 
+import nflverse_mirror
+from nflverse_loader import CAREER_ROSTER_COLUMNS
+from nfl_session import NFLBuildSession
+from nfl_snap_counts import normalize_name
+
 # ─── Config ──────────────────────────────────────────────────────────────────
 
 POOL_PATH  = os.path.join(os.path.dirname(__file__), "data", "nfl_lineup_pool.json")
@@ -44,11 +43,6 @@ MIN_SEASONS_OL = 4  # must have appeared on a roster for at least this many seas
 # New kickers added to the pool must have fg_made >= 10 in at least this many seasons
 MIN_K_QUALIFYING_SEASONS = 2
 
-NFLVERSE_STATS_URL = (
-    "https://github.com/nflverse/nflverse-data/releases/download/"
-    "stats_player/stats_player_reg_{year}.parquet"
-)
-
 # ─── Helpers ─────────────────────────────────────────────────────────────────
 
 def safe_int(val, default=0):
@@ -68,18 +62,15 @@ def safe_str(val, default=""):
     return default if s in ("nan", "None", "") else s
 
 
-def load_kicking_stats(years):
+def load_kicking_stats(session, years):
     """Load kicker seasonal stats from nflverse parquet files.
     The nflverse stats_player_reg parquet includes all positions (including K)
     and exists for all years. We filter to position=='K' after loading.
     """
     frames = []
     for year in years:
-        url = NFLVERSE_STATS_URL.format(year=year)
         try:
-            df = pd.read_parquet(url)
-            if "passing_interceptions" in df.columns and "interceptions" not in df.columns:
-                df = df.rename(columns={"passing_interceptions": "interceptions"})
+            df = session.frame("stats_player_reg", year)
             # Keep only kicker rows
             if "position" in df.columns:
                 df = df[df["position"] == "K"]
@@ -117,50 +108,34 @@ def build_bio(roster_row) -> dict:
 
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
-def main():
-    if not os.path.exists(POOL_PATH):
+def build(session: NFLBuildSession) -> list:
+    """Patch the lineup pool (this session's, or nfl_lineup_pool.json); returns the patched pool."""
+    if "nfl_lineup_pool" in session.outputs:
+        pool = session.outputs["nfl_lineup_pool"]
+        print(f"Patching {len(pool)} players from this build's nfl_lineup_pool")
+    elif not os.path.exists(POOL_PATH):
         print(f"ERROR: {POOL_PATH} not found. Run generate_nfl_lineup_pool.py first.")
         sys.exit(1)
-
-    with open(POOL_PATH) as f:
-        pool = json.load(f)
+    else:
+        with open(POOL_PATH) as f:
+            pool = json.load(f)
+        print(f"Loaded {len(pool)} existing players from nfl_lineup_pool.json")
     pool_by_id: dict[str, dict] = {str(p["player_id"]): p for p in pool}
-    print(f"Loaded {len(pool)} existing players from nfl_lineup_pool.json")
 
     # ── Rosters ───────────────────────────────────────────────────────────────
     print(f"\nLoading rosters ({YEARS[0]}–{YEARS[-1]})...")
-    roster_df = nfl.import_seasonal_rosters(YEARS)
+    roster_df = session.load("rosters", YEARS, columns=CAREER_ROSTER_COLUMNS)
     roster_df = roster_df.drop_duplicates(subset=["player_id", "season"], keep="first")
     print(f"  {len(roster_df)} roster rows")
 
     # ── Snap counts (OL GP) ───────────────────────────────────────────────────
     print(f"Loading snap counts ({SNAP_YEARS[0]}–{SNAP_YEARS[-1]})...")
-    snaps_df = nfl.import_snap_counts(SNAP_YEARS)
-    snap_gp_pfr:  dict[str, dict] = {}
-    snap_gp_name: dict[str, dict] = {}
-    if snaps_df is not None and not snaps_df.empty:
-        for _, row in snaps_df.iterrows():
-            season = safe_int(row.get("season"))
-            team   = safe_str(row.get("team"), "???")
-            if not season or team == "???":
-                continue
-            key = (season, team)
-            pfr_id = safe_str(row.get("pfr_player_id"))
-            if pfr_id:
-                if pfr_id not in snap_gp_pfr:
-                    snap_gp_pfr[pfr_id] = {}
-                snap_gp_pfr[pfr_id][key] = snap_gp_pfr[pfr_id].get(key, 0) + 1
-            raw_name = safe_str(row.get("player"))
-            if raw_name:
-                norm = raw_name.lower().encode("ascii", "ignore").decode()
-                if norm not in snap_gp_name:
-                    snap_gp_name[norm] = {}
-                snap_gp_name[norm][key] = snap_gp_name[norm].get(key, 0) + 1
-    print(f"  Snap GP built: {len(snap_gp_pfr)} pfr IDs, {len(snap_gp_name)} name keys")
+    snap_gp = session.snap_gp(SNAP_YEARS, refresh="--refresh" in sys.argv)
+    print(f"  Snap GP built: {snap_gp}")
 
     # ── Kicking stats (kicker upgrade) ────────────────────────────────────────
     print(f"Loading kicking stats ({YEARS[0]}–{YEARS[-1]})...")
-    stats_df = load_kicking_stats(YEARS)
+    stats_df = load_kicking_stats(session, YEARS)
 
     # Extract kicker rows and build per-(player_id, season) lookup
     kicker_stats_by_pid_yr: dict[tuple, dict] = {}
@@ -228,10 +203,10 @@ def main():
             continue
 
         pfr_id    = safe_str(latest_roster.get("pfr_id"))
-        norm_name = name.lower().encode("ascii", "ignore").decode()
+        norm_name = normalize_name(name)
 
         # pfr_id beats name for same key
-        player_snap_gp = {**snap_gp_name.get(norm_name, {}), **snap_gp_pfr.get(pfr_id, {})}
+        player_snap_gp = snap_gp.games(pfr_id, norm_name)
         if not player_snap_gp:
             ol_skipped_no_snaps += 1
             continue
@@ -357,6 +332,16 @@ def main():
     print(f"\nNext step:")
     print(f"  cp data/nfl_lineup_pool.json ../public/data/nfl_lineup_pool.json")
 
+    session.outputs["nfl_lineup_pool"] = out
+    return out
+
+
+def main():
+    nflverse_mirror.install()
+    session = NFLBuildSession()
+    build(session)
+    session.report()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+publish_data.py — Content-hashed copies and precompressed sidecars for everything under public/data.
+
+The ~50 MB of generated JSON under public/data (careers, pools, shards,
+rosters, box scores, ...) is served as static files. Compressing on the fly,
+a CDN uses a fast, low compression level, or does not compress at all. This
+writes every file once at the maximum level, next to the original:
+
+    public/data/nba_careers.json
+    public/data/nba_careers.json.br     brotli, quality 11
+    public/data/nba_careers.json.gz     gzip, level 9 (no timestamp: same input → same bytes)
+
+so a server that serves precompressed sidecars (nginx gzip_static /
+brotli_static, a CDN's precompressed-asset option) never compresses them
+itself. Files are compressed in parallel across cores. The sha256 of every
+published file is recorded in scripts/.publish_state.json; a file whose
+content has not changed since the last run, and whose sidecars are still on
+disk, is skipped.
+
+brotli is optional (pip install brotli). Without it only the .gz sidecars are
+written.
+
+Every file also gets a content-hashed copy, and data-manifest.json maps each
+logical path (relative to /data) to it:
+
+    public/data/nfl/box_scores/2024.json
+    public/data/nfl/box_scores/2024.3f9a1c2b7d04.json      (+ .br / .gz)
+    public/data/data-manifest.json
+        {"version": 1, "files": {"nfl/box_scores/2024.json":
+                                 "nfl/box_scores/2024.3f9a1c2b7d04.json", ...}}
+
+A hashed path never changes content, so it can be served with an immutable
+cache header; only the manifest has to be revalidated. The frontend resolves
+paths through it (src/services/dataManifest.ts). Files that are already
+content-addressed (the career_shards.py shards) are not copied again, and
+hashed copies no longer in the manifest are deleted.
+
+The deploy build (`npm run build:deploy`, vercel.json's buildCommand) runs it
+on the built tree after `vite build` via `npm run publish:data`, so every
+deploy ships the copies, manifest and sidecars; none of them are committed.
+`npm run build` stays frontend-only, and publish:data skips with a warning
+where python3 is not installed. By hand:
+
+    cd scripts
+    python publish_data.py --data-dir ../dist/data --workers 4
+    python publish_data.py                      # ../public/data, for local serving
+    python publish_data.py --force              # recompress everything
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from career_shards import HASH_LEN
+
+# ─── Config ───────────────────────────────────────────────────────────────────
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR    = os.path.join(SCRIPTS_DIR, "..", "public", "data")
+STATE_PATH  = os.path.join(SCRIPTS_DIR, ".publish_state.json")
+
+GZIP_LEVEL     = 9
+BROTLI_QUALITY = 11
+
+MANIFEST_NAME  = "data-manifest.json"
+MANIFEST_VERSION = 1
+
+HASHED_FILE = re.compile(r"^(?P<stem>.+)\.[0-9a-f]{%d}\.json$" % HASH_LEN)
+
+
+def sidecars() -> list[str]:
+    """Sidecar extensions written by this run."""
+    return [".gz", ".br"] if brotli is not None else [".gz"]
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write(path: str, data: bytes) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+# ─── Files ────────────────────────────────────────────────────────────────────
+
+def is_hashed_copy(path: str) -> bool:
+    """True for stem.<hash>.json written by this script (stem.json exists next to it)."""
+    m = HASHED_FILE.match(os.path.basename(path))
+    return bool(m) and os.path.exists(os.path.join(os.path.dirname(path), m["stem"] + ".json"))
+
+
+def hashed_path(rel: str, digest: str) -> str:
+    """Content-hashed name for rel; files already named by their hash keep their name."""
+    if HASHED_FILE.match(os.path.basename(rel)):
+        return rel
+    return f"{rel[:-len('.json')]}.{digest[:HASH_LEN]}.json"
+
+
+def published_files(data_dir: str) -> list[str]:
+    """Every generated .json under data_dir (not the hashed copies or manifest), relative to it."""
+    files = []
+    for root, _, names in os.walk(data_dir):
+        for name in names:
+            path = os.path.join(root, name)
+            if name.endswith(".json") and not is_hashed_copy(path):
+                files.append(os.path.relpath(path, data_dir))
+    return sorted(f for f in files if f != MANIFEST_NAME)
+
+
+def hashed_copies(data_dir: str) -> list[str]:
+    """Every hashed copy under data_dir, relative to it."""
+    return sorted(os.path.relpath(os.path.join(root, name), data_dir)
+                  for root, _, names in os.walk(data_dir) for name in names
+                  if is_hashed_copy(os.path.join(root, name)))
+
+
+def dataset(rel: str) -> str:
+    """Report group: the directory for files in a subdirectory, else the file name."""
+    folder = os.path.dirname(rel)
+    return folder.replace(os.sep, "/") + "/" if folder else rel
+
+
+def load_state() -> dict:
+    try:
+        with open(STATE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state: dict) -> None:
+    _write(STATE_PATH, json.dumps(state, indent=1, sort_keys=True).encode())
+
+
+# ─── Compression ──────────────────────────────────────────────────────────────
+
+def write_sidecars(path: str, data: bytes) -> dict:
+    """Write path.gz (and path.br) for data; returns their sizes."""
+    gz = gzip.compress(data, GZIP_LEVEL, mtime=0)
+    _write(path + ".gz", gz)
+    sizes = {"gz": len(gz), "br": None}
+    if brotli is not None:
+        br = brotli.compress(data, quality=BROTLI_QUALITY)
+        _write(path + ".br", br)
+        sizes["br"] = len(br)
+    elif os.path.exists(path + ".br"):
+        os.remove(path + ".br")            # stale: from a run with brotli, content changed since
+    return sizes
+
+
+def compress(data_dir: str, rel: str) -> dict:
+    """Hashed copy and sidecars for one file; returns its hash, sizes and hashed path."""
+    path = os.path.join(data_dir, rel)
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = sha256(data)
+    entry  = {"sha256": digest, "raw": len(data), "hashed": hashed_path(rel, digest),
+              **write_sidecars(path, data)}
+    if entry["hashed"] != rel:
+        copy = os.path.join(data_dir, entry["hashed"])
+        if not os.path.exists(copy):
+            _write(copy, data)
+        for ext in sidecars():
+            shutil.copyfile(path + ext, copy + ext)
+    return entry
+
+
+def is_current(data_dir: str, rel: str, entry: dict) -> bool:
+    """True if rel still hashes to entry and its hashed copy and sidecars are on disk."""
+    if not entry or "hashed" not in entry:
+        return False
+    path = os.path.join(data_dir, rel)
+    copy = os.path.join(data_dir, entry["hashed"])
+    if any(not os.path.exists(p + ext) for p in (path, copy) for ext in ["", *sidecars()]):
+        return False
+    with open(path, "rb") as f:
+        return sha256(f.read()) == entry["sha256"]
+
+
+def write_manifest(data_dir: str, files: dict) -> dict:
+    """data-manifest.json: logical path → hashed path, for every file that has a copy."""
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "files":   {rel.replace(os.sep, "/"): entry["hashed"].replace(os.sep, "/")
+                    for rel, entry in sorted(files.items()) if entry["hashed"] != rel},
+    }
+    path = os.path.join(data_dir, MANIFEST_NAME)
+    data = json.dumps(manifest, separators=(",", ":")).encode()
+    _write(path, data)
+    write_sidecars(path, data)
+    return manifest
+
+
+def remove_stale_copies(data_dir: str, files: dict) -> int:
+    """Delete hashed copies (and their sidecars) that no file maps to any more."""
+    live = {entry["hashed"] for entry in files.values()}
+    removed = 0
+    for rel in hashed_copies(data_dir):
+        if rel not in live:
+            for ext in ["", ".gz", ".br"]:
+                if os.path.exists(os.path.join(data_dir, rel + ext)):
+                    os.remove(os.path.join(data_dir, rel + ext))
+            removed += 1
+    return removed
+
+
+def publish(data_dir: str, workers: int = 0, force: bool = False) -> dict:
+    """Copy / compress every changed file under data_dir and write the manifest.
+
+    Returns {rel path: hash, sizes and hashed path} for all files.
+    """
+    data_dir = os.path.abspath(data_dir)
+    state = load_state()
+    previous = state.get(data_dir, {})
+
+    files = published_files(data_dir)
+    todo = [rel for rel in files
+            if force or not is_current(data_dir, rel, previous.get(rel))]
+    dirs = [data_dir] * len(todo)
+
+    if workers == 1 or len(todo) < 2:
+        results = list(map(compress, dirs, todo))
+    else:
+        with ProcessPoolExecutor(max_workers=workers or None) as pool:
+            results = list(pool.map(compress, dirs, todo, chunksize=8))
+
+    current = {rel: previous[rel] for rel in files if rel in previous}
+    current.update(zip(todo, results))
+    state[data_dir] = current
+    save_state(state)
+
+    manifest = write_manifest(data_dir, current)
+    removed  = remove_stale_copies(data_dir, current)
+    print(f"  {len(todo)} compressed, {len(files) - len(todo)} unchanged; "
+          f"{MANIFEST_NAME}: {len(manifest['files'])} hashed paths, {removed} stale copies removed")
+    return current
+
+
+# ─── Report ───────────────────────────────────────────────────────────────────
+
+def report(files: dict) -> None:
+    """Raw / gzip / brotli size per dataset."""
+    totals = defaultdict(lambda: [0, 0, 0, 0])
+    for rel, sizes in files.items():
+        row = totals[dataset(rel)]
+        row[0] += 1
+        row[1] += sizes["raw"]
+        row[2] += sizes["gz"]
+        row[3] += sizes["br"] or 0
+    rows = sorted(totals.items())
+    rows.append(("total", [sum(r[i] for _, r in rows) for i in range(4)]))
+
+    kb = 1024
+    print(f"\n  {'dataset':<28} {'files':>5} {'raw KB':>9} {'gzip KB':>9} {'brotli KB':>10}")
+    for name, (count, raw, gz, br) in rows:
+        br_col = f"{br / kb:10.0f}" if brotli is not None else f"{'—':>10}"
+        print(f"  {name:<28} {count:>5} {raw / kb:9.0f} {gz / kb:9.0f} {br_col}")
+
+
+# ─── Main ─────────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="Write hashed copies, data-manifest.json and .br / .gz sidecars for the published JSON.")
+    parser.add_argument("--data-dir", default=DATA_DIR,
+                        help="Directory to publish (default: public/data)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Compression processes (default: one per core)")
+    parser.add_argument("--force", action="store_true",
+                        help="Recompress every file, changed or not")
+    args = parser.parse_args()
+
+    if brotli is None:
+        print("  brotli not installed — writing .gz sidecars only (pip install brotli)")
+    t0 = time.time()
+    files = publish(args.data_dir, args.workers, args.force)
+    report(files)
+    print(f"\n  done in {time.time() - t0:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
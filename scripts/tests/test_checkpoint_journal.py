@@ -0,0 +1,66 @@
+"""Exercise checkpoint_journal.py's resume semantics with a stand-in fetch loop."""
+
+import json
+
+from checkpoint_journal import CheckpointJournal, FetchError
+
+PLAYERS = [1, 2, 3]
+
+
+def run(journal_path, fetch, resume):
+    """The NBA generators' loop: replay, fetch what is not done, journal each result."""
+    journal = CheckpointJournal(journal_path)
+    results, done_ids = journal.open(resume)
+    for pid in [p for p in PLAYERS if p not in done_ids]:
+        result = fetch(pid)
+        journal.record(pid, result)
+        if result:
+            results.append(result)
+    journal.close()
+    return results
+
+
+class TestCheckpointJournal:
+    """Failed fetches are retried on --resume; finished and empty ones are not."""
+
+    def test_failed_fetch_is_fetched_again_on_resume(self, tmp_path):
+        path = str(tmp_path / 'out.json.journal')
+        calls = []
+
+        def flaky(pid):
+            calls.append(pid)
+            if pid == 2:
+                return FetchError(TimeoutError('read timed out'))
+            if pid == 3:
+                return None                     # fetched, no usable data
+            return {'player_id': pid}
+
+        assert run(path, flaky, resume=False) == [{'player_id': 1}]
+        assert calls == [1, 2, 3]
+
+        calls.clear()
+        results = run(path, lambda pid: calls.append(pid) or {'player_id': pid}, resume=True)
+        assert calls == [2]
+        assert results == [{'player_id': 1}, {'player_id': 2}]
+
+    def test_failure_is_journaled_with_its_error(self, tmp_path):
+        path = tmp_path / 'out.json.journal'
+        journal = CheckpointJournal(str(path))
+        journal.open(resume=False)
+        journal.record(7, FetchError(ConnectionError('reset by peer')))
+        journal.close()
+        entry = json.loads(path.read_text())
+        assert entry['id'] == 7 and 'reset by peer' in entry['error'] and 'result' not in entry
+        assert CheckpointJournal(str(path)).replay() == ([], set())
+
+    def test_torn_last_line_is_ignored(self, tmp_path):
+        path = tmp_path / 'out.json.journal'
+        path.write_text('{"id":1,"result":{"player_id":1}}\n{"id":2,"res')
+        journal = CheckpointJournal(str(path))
+        assert journal.open(resume=True) == ([{'player_id': 1}], {1})
+        journal.record(2, None)
+        journal.close()
+        assert journal.replay() == ([{'player_id': 1}], {1, 2})
+
+    def test_fetch_error_is_falsy(self):
+        assert not FetchError(TimeoutError())
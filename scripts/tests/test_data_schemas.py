@@ -1,5 +1,6 @@
 """Validate the structure and integrity of generated JSON data files."""
 
+import hashlib
 import json
 import os
 import glob
@@ -232,3 +233,125 @@ class TestBoxScoreFiles:
                 assert 'game_id' in game or 'gameId' in game or isinstance(game, dict), (
                     f"Unexpected box score structure in {filepath}"
                 )
+
+
+SHARDED_SOURCES = ['nba_careers', 'nba_lineup_pool', 'nfl_careers', 'nfl_lineup_pool']
+
+
+def _load_shards(name):
+    shard_dir = os.path.join(DATA_DIR, 'shards', name)
+    with open(os.path.join(shard_dir, 'manifest.json')) as f:
+        manifest = json.load(f)
+    shards = []
+    for entry in manifest['shards']:
+        with open(os.path.join(shard_dir, entry['file']), 'rb') as f:
+            shards.append(f.read())
+    return manifest, shards
+
+
+@pytest.mark.parametrize('name', SHARDED_SOURCES)
+class TestCareerShards:
+    """Validate public/data/shards/{name}/ against its manifest and the monolithic file."""
+
+    def test_hashes_match_content(self, name):
+        manifest, shards = _load_shards(name)
+        for entry, data in zip(manifest['shards'], shards):
+            sha = hashlib.sha256(data).hexdigest()
+            assert entry['sha256'] == sha, f"{name}/{entry['file']} content does not match its hash"
+            assert entry['file'].split('.')[1] == sha[:12], f"{name}/{entry['file']} name is stale"
+            assert entry['bytes'] == len(data)
+
+    def test_manifest_players_in_their_shard(self, name):
+        manifest, shards = _load_shards(name)
+        shard_ids = [[p['player_id'] for p in json.loads(data)] for data in shards]
+        for entry, ids in zip(manifest['shards'], shard_ids):
+            assert entry['count'] == len(ids)
+            assert (entry['first_id'], entry['last_id']) == (ids[0], ids[-1])
+        for player in manifest['players']:
+            assert player['player_id'] in shard_ids[player['shard']], (
+                f"{name}: {player['player_name']} not in shard {player['shard']}"
+            )
+        assert len(manifest['players']) == manifest['count'] == sum(len(ids) for ids in shard_ids)
+
+    def test_shards_are_sorted_id_ranges(self, name):
+        manifest, _ = _load_shards(name)
+        ids = [p['player_id'] for p in manifest['players']]
+        assert ids == sorted(ids), f"{name}: shards are not in player_id order"
+        shard_nums = [p['shard'] for p in manifest['players']]
+        assert shard_nums == sorted(shard_nums)
+
+    def test_matches_monolithic_file(self, name):
+        """Shards hold exactly the players of {name}.json (re-run career_shards.py if this fails)."""
+        manifest, shards = _load_shards(name)
+        with open(os.path.join(DATA_DIR, f'{name}.json')) as f:
+            players = {p['player_id']: p for p in json.load(f)}
+        sharded = {p['player_id']: p for data in shards for p in json.loads(data)}
+        assert sharded == players, f"{name}: shards are stale"
+        for entry in manifest['players']:
+            seasons = [str(s['season']) for s in players[entry['player_id']]['seasons']]
+            assert entry['first_season'] == (min(seasons) if seasons else None)
+            assert entry['last_season'] == (max(seasons) if seasons else None)
+
+
+@pytest.mark.parametrize('sport', ['nba', 'nfl'])
+class TestMergedPlayerPool:
+    """Validate {sport}_player_pool.json (merge_player_pool.py) against its two sources."""
+
+    def test_covers_both_sources_once(self, sport):
+        with open(os.path.join(DATA_DIR, f'{sport}_player_pool.json')) as f:
+            merged = json.load(f)
+        ids = [p['player_id'] for p in merged]
+        assert len(ids) == len(set(ids)), "Duplicate player_id found"
+        expected = set()
+        for name in ('careers', 'lineup_pool'):
+            with open(os.path.join(DATA_DIR, f'{sport}_{name}.json')) as f:
+                expected |= {p['player_id'] for p in json.load(f)}
+        assert set(ids) >= expected, "player pool is stale — re-run merge_player_pool.py"
+
+    def test_matches_sources(self, sport):
+        """The pool is exactly the merge of the current sources (re-run merge_player_pool.py if this fails)."""
+        from merge_player_pool import inject_legends, merge_pools
+        with open(os.path.join(DATA_DIR, f'{sport}_careers.json')) as f:
+            careers = json.load(f)
+        with open(os.path.join(DATA_DIR, f'{sport}_lineup_pool.json')) as f:
+            pool = json.load(f)
+        expected, _ = merge_pools(*inject_legends(sport, careers, pool))
+        with open(os.path.join(DATA_DIR, f'{sport}_player_pool.json')) as f:
+            merged = json.load(f)
+        assert merged == expected, f"{sport}_player_pool.json is stale"
+
+    def test_seasons_unique_and_sorted(self, sport):
+        with open(os.path.join(DATA_DIR, f'{sport}_player_pool.json')) as f:
+            merged = json.load(f)
+        for player in merged:
+            seasons = [s['season'] for s in player['seasons']]
+            assert len(seasons) == len(set(seasons)), f"Duplicate season for {player['player_name']}"
+
+
+COMPACT_SOURCES = ['nba_careers', 'nba_lineup_pool', 'nba_player_pool',
+                   'nfl_careers', 'nfl_lineup_pool', 'nfl_player_pool']
+
+
+@pytest.mark.parametrize('name', COMPACT_SOURCES)
+class TestCompactSeasons:
+    """Round-trip {name}.json through the compact season encoding (compact_seasons.py)."""
+
+    def test_round_trip_is_exact(self, name):
+        from compact_seasons import decode, dumps, encode
+        with open(os.path.join(DATA_DIR, f'{name}.json')) as f:
+            players = json.load(f)
+        doc = json.loads(dumps(encode(players)))
+        decoded = decode(doc)
+        assert decoded == players
+        # key order too, so the decoded file is byte-identical
+        assert dumps(decoded) == dumps(players)
+
+    def test_rows_match_their_shape(self, name):
+        from compact_seasons import encode
+        with open(os.path.join(DATA_DIR, f'{name}.json')) as f:
+            doc = encode(json.load(f))
+        shapes = doc['shapes']
+        assert len({tuple(s) for s in shapes}) == len(shapes), "Duplicate shape"
+        for player in doc['players']:
+            for row in player['seasons']:
+                assert len(row) == 1 + len(shapes[row[0]])
@@ -0,0 +1,45 @@
+"""Exercise fetch_scheduler.py's retry / backoff decisions without touching the network."""
+
+import pytest
+
+from fetch_scheduler import AdaptiveLimiter, FetchScheduler, Throttled, is_no_data_error
+
+
+def scheduler():
+    # no state file, fast enough that acquire() never sleeps noticeably
+    limiter = AdaptiveLimiter(rate=1000.0, state_path=None)
+    return FetchScheduler(workers=1, label="test", limiter=limiter, retries=3)
+
+
+def failing(exc, calls):
+    def fn():
+        calls.append(1)
+        raise exc
+    return fn
+
+
+class TestFetchScheduler:
+    """A missing resultSet is 'no data': not retried and not a throttle."""
+
+    @pytest.mark.parametrize('key', ['resultSet', 'resultSets'])
+    def test_missing_result_set_is_not_retried(self, key):
+        sched, calls = scheduler(), []
+        rate = sched.limiter.rate
+        with pytest.raises(KeyError) as err:
+            sched.call(failing(KeyError(key), calls))
+        assert is_no_data_error(err.value)
+        assert len(calls) == 1
+        assert sched.limiter.throttles == 0
+        assert sched.limiter.rate == rate
+
+    def test_other_key_errors_are_not_no_data(self):
+        assert not is_no_data_error(KeyError('player_id'))
+        assert not is_no_data_error(TimeoutError())
+
+    def test_throttle_is_retried_and_halves_rate(self, monkeypatch):
+        monkeypatch.setattr('fetch_scheduler.time.sleep', lambda s: None)
+        sched, calls = scheduler(), []
+        with pytest.raises(Throttled):
+            sched.call(failing(Throttled('429'), calls))
+        assert len(calls) == 4
+        assert sched.limiter.throttles == 4
@@ -0,0 +1,149 @@
+"""Exercise publish_data.py (incremental publish, hashed copies, manifest) on a throwaway data directory."""
+
+import gzip
+import json
+import os
+
+import pytest
+
+import publish_data
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """A small data tree, with the publish state kept out of the repo."""
+    monkeypatch.setattr(publish_data, 'STATE_PATH', str(tmp_path / 'state.json'))
+    root = tmp_path / 'data'
+    (root / 'nba' / 'box_scores').mkdir(parents=True)
+    (root / 'nba_careers.json').write_text(json.dumps([{'player_id': 1, 'seasons': []}]))
+    (root / 'nba' / 'box_scores' / '2024.json').write_text(json.dumps([{'game_id': 'a'}]))
+    (root / 'nba' / 'box_scores' / '2025.json').write_text(json.dumps([{'game_id': 'b'}]))
+    return str(root)
+
+
+@pytest.fixture
+def compressed(monkeypatch):
+    """Relative paths passed to compress(), in call order."""
+    calls = []
+    compress = publish_data.compress
+
+    def counting(data_dir, rel):
+        calls.append(rel)
+        return compress(data_dir, rel)
+
+    monkeypatch.setattr(publish_data, 'compress', counting)
+    return calls
+
+
+def publish(data_dir):
+    return publish_data.publish(data_dir, workers=1)
+
+
+class TestIncrementalPublish:
+    """Unchanged files are skipped; changed files are recompressed."""
+
+    def test_second_run_compresses_nothing(self, data_dir, compressed):
+        publish(data_dir)
+        assert len(compressed) == 3
+        compressed.clear()
+        publish(data_dir)
+        assert compressed == []
+
+    def test_edit_recompresses_only_that_file(self, data_dir, compressed):
+        publish(data_dir)
+        compressed.clear()
+        path = os.path.join(data_dir, 'nba', 'box_scores', '2024.json')
+        with open(path, 'w') as f:
+            json.dump([{'game_id': 'changed'}], f)
+        publish(data_dir)
+        assert compressed == [os.path.join('nba', 'box_scores', '2024.json')]
+        with gzip.open(path + '.gz') as f:
+            assert json.load(f) == [{'game_id': 'changed'}]
+
+    def test_missing_sidecar_is_rewritten(self, data_dir, compressed):
+        publish(data_dir)
+        compressed.clear()
+        os.remove(os.path.join(data_dir, 'nba_careers.json.gz'))
+        publish(data_dir)
+        assert compressed == ['nba_careers.json']
+
+    def test_stale_brotli_sidecar_removed_without_brotli(self, data_dir, monkeypatch):
+        monkeypatch.setattr(publish_data, 'brotli', None)
+        publish(data_dir)
+        path = os.path.join(data_dir, 'nba_careers.json')
+        with open(path + '.br', 'wb') as f:      # left over from a run with brotli
+            f.write(b'stale')
+        with open(path, 'w') as f:
+            json.dump([{'player_id': 2, 'seasons': []}], f)
+        publish(data_dir)
+        assert not os.path.exists(path + '.br')
+        assert os.path.exists(path + '.gz')
+
+
+def read_manifest(data_dir):
+    with open(os.path.join(data_dir, publish_data.MANIFEST_NAME)) as f:
+        return json.load(f)
+
+
+class TestHashedCopies:
+    """Content-hashed copies, data-manifest.json and stale-copy removal."""
+
+    def test_manifest_maps_to_hashed_copies(self, data_dir):
+        publish(data_dir)
+        files = read_manifest(data_dir)['files']
+        assert set(files) == {'nba_careers.json', 'nba/box_scores/2024.json',
+                              'nba/box_scores/2025.json'}
+        for logical, hashed in files.items():
+            with open(os.path.join(data_dir, logical), 'rb') as f:
+                data = f.read()
+            digest = publish_data.sha256(data)[:publish_data.HASH_LEN]
+            assert hashed == logical[:-len('.json')] + f'.{digest}.json'
+            with open(os.path.join(data_dir, hashed), 'rb') as f:
+                assert f.read() == data
+            assert os.path.exists(os.path.join(data_dir, hashed + '.gz'))
+
+    def test_changed_file_gets_new_copy_and_old_one_removed(self, data_dir):
+        publish(data_dir)
+        old = read_manifest(data_dir)['files']['nba/box_scores/2024.json']
+        with open(os.path.join(data_dir, 'nba', 'box_scores', '2024.json'), 'w') as f:
+            json.dump([{'game_id': 'changed'}], f)
+        publish(data_dir)
+        new = read_manifest(data_dir)['files']['nba/box_scores/2024.json']
+        assert new != old
+        assert os.path.exists(os.path.join(data_dir, new))
+        for ext in ['', '.gz', '.br']:
+            assert not os.path.exists(os.path.join(data_dir, old + ext))
+
+    def test_unchanged_file_keeps_its_copy(self, data_dir, compressed):
+        publish(data_dir)
+        before = read_manifest(data_dir)
+        compressed.clear()
+        publish(data_dir)
+        assert compressed == []
+        assert read_manifest(data_dir) == before
+        assert publish_data.hashed_copies(data_dir) == sorted(
+            p.replace('/', os.sep) for p in before['files'].values())
+
+    def test_shards_are_not_copied_again(self, data_dir):
+        shard_dir = os.path.join(data_dir, 'shards', 'nba_careers')
+        os.makedirs(shard_dir)
+        shard = '000.0123456789ab.json'
+        with open(os.path.join(shard_dir, shard), 'w') as f:
+            json.dump([{'player_id': 1, 'seasons': []}], f)
+        with open(os.path.join(shard_dir, 'manifest.json'), 'w') as f:
+            json.dump({'shards': [{'file': shard}]}, f)
+        publish(data_dir)
+
+        files = read_manifest(data_dir)['files']
+        assert 'shards/nba_careers/' + shard not in files
+        assert 'shards/nba_careers/manifest.json' in files
+        names = os.listdir(shard_dir)
+        assert [n for n in names if n.startswith('000.') and n.endswith('.json')] == [shard]
+        assert shard + '.gz' in names
+
+    def test_hashed_path(self):
+        digest = 'f' * 64
+        assert publish_data.hashed_path('nba/box_scores/2024.json', digest) == \
+            'nba/box_scores/2024.ffffffffffff.json'
+        assert publish_data.hashed_path('shards/x/000.0123456789ab.json', digest) == \
+            'shards/x/000.0123456789ab.json'
@@ -5,7 +5,9 @@ update_nba_careers.py — Incrementally append new season(s) to nba_careers.json
 Much faster than a full regeneration:
   - 1 API call per season fetches all player stats
   - Existing players just get the new season row appended (no extra API calls)
-  - Only brand-new qualifying players trigger a full career fetch (2 calls each)
+  - Only brand-new qualifying players trigger a career fetch (1 call each); their
+    bios come from the bulk PlayerIndex / DraftHistory index (nba_bio_index.py),
+    with a CommonPlayerInfo call only for players the index misses
 
 Usage:
     python update_nba_careers.py --years 2025          # adds 2024-25
@@ -22,23 +24,26 @@ import json
 import math
 import os
 import sys
-import time
 from typing import Optional
 
 try:
     from nba_api.stats.endpoints import LeagueDashPlayerStats, PlayerCareerStats
-    from nba_api.stats.endpoints import commonplayerinfo as CommonPlayerInfoModule
 except ImportError:
     print("ERROR: nba_api not installed. Run: pip install nba_api")
     sys.exit(1)
 
+from fetch_scheduler import FetchScheduler
+from nba_cache import CACHE
+import nba_bio_index as bio_index
+import nba_career_store as store
+
 # ─── Config ──────────────────────────────────────────────────────────────────
 
-REQUEST_DELAY = 0.7   # seconds between API calls
 MIN_PPG       = 10.0  # new players must avg 10+ PPG to be added
 MIN_GP        = 20    # and played at least 20 games
 
-OUT_PATH = os.path.join(os.path.dirname(__file__), "data", "nba_careers.json")
+SCHEDULER = FetchScheduler(workers=1, label="nba careers update")
+OUT_PATH  = os.path.join(os.path.dirname(__file__), "data", "nba_careers.json")
 
 # ─── Helpers ─────────────────────────────────────────────────────────────────
 
@@ -68,93 +73,27 @@ def safe_int(val):
         return 0
 
 def build_season_row(row: dict, season: str) -> dict:
-    """Build a season entry from a LeagueDashPlayerStats row."""
-    return {
-        "season":  season,
-        "team":    row.get("TEAM_ABBREVIATION", "???"),
-        "gp":      safe_int(row.get("GP")),
-        "min":     safe_float(row.get("MIN")),
-        "pts":     safe_float(row.get("PTS")),
-        "reb":     safe_float(row.get("REB")),
-        "ast":     safe_float(row.get("AST")),
-        "stl":     safe_float(row.get("STL")),
-        "blk":     safe_float(row.get("BLK")),
-        "fg_pct":  safe_float(row.get("FG_PCT"), 3),
-        "fg3_pct": safe_float(row.get("FG3_PCT"), 3),
-    }
+    return store.season_row(row, season, row.get("TEAM_ABBREVIATION", "???"))
 
 def fetch_full_career(player_id: int, player_name: str) -> Optional[dict]:
     """Fetch full career stats + bio for a brand-new player."""
     try:
-        career = PlayerCareerStats(player_id=player_id, per_mode36="PerGame")
-        time.sleep(REQUEST_DELAY)
+        career = CACHE.fetch(PlayerCareerStats, SCHEDULER, player_id=player_id, per_mode36="PerGame")
         season_df = career.get_data_frames()[0]
 
         if season_df.empty:
             return None
+        store.save_career(player_id, season_df)
 
-        seasons = []
-        for season_id, group in season_df.groupby("SEASON_ID", sort=False):
-            tot_rows  = group[group["TEAM_ABBREVIATION"] == "TOT"]
-            team_rows = group[group["TEAM_ABBREVIATION"] != "TOT"]
-
-            if len(team_rows) <= 1 and tot_rows.empty:
-                row = group.iloc[0]
-                seasons.append({
-                    "season":  row.get("SEASON_ID", ""),
-                    "team":    row.get("TEAM_ABBREVIATION", "???"),
-                    "gp":      safe_int(row.get("GP")),
-                    "min":     safe_float(row.get("MIN")),
-                    "pts":     safe_float(row.get("PTS")),
-                    "reb":     safe_float(row.get("REB")),
-                    "ast":     safe_float(row.get("AST")),
-                    "stl":     safe_float(row.get("STL")),
-                    "blk":     safe_float(row.get("BLK")),
-                    "fg_pct":  safe_float(row.get("FG_PCT"), 3),
-                    "fg3_pct": safe_float(row.get("FG3_PCT"), 3),
-                })
-            else:
-                team_names = "/".join(team_rows["TEAM_ABBREVIATION"].tolist()) if not team_rows.empty else "???"
-                src = tot_rows.iloc[0] if not tot_rows.empty else team_rows.iloc[0]
-                seasons.append({
-                    "season":  str(season_id),
-                    "team":    team_names,
-                    "gp":      safe_int(src.get("GP")),
-                    "min":     safe_float(src.get("MIN")),
-                    "pts":     safe_float(src.get("PTS")),
-                    "reb":     safe_float(src.get("REB")),
-                    "ast":     safe_float(src.get("AST")),
-                    "stl":     safe_float(src.get("STL")),
-                    "blk":     safe_float(src.get("BLK")),
-                    "fg_pct":  safe_float(src.get("FG_PCT"), 3),
-                    "fg3_pct": safe_float(src.get("FG3_PCT"), 3),
-                })
-
+        seasons = store.build_seasons(season_df)
         if len(seasons) < 2:
             return None
 
-        # Bio
-        bio = {"height": "", "weight": 0, "school": "", "exp": 0, "draft_year": 0}
-        try:
-            info = CommonPlayerInfoModule.CommonPlayerInfo(player_id=player_id)
-            time.sleep(REQUEST_DELAY)
-            info_df = info.get_data_frames()[0]
-            if not info_df.empty:
-                irow = info_df.iloc[0]
-                bio["height"]     = irow.get("HEIGHT", "") or ""
-                bio["weight"]     = safe_int(irow.get("WEIGHT"))
-                bio["school"]     = irow.get("SCHOOL", "") or ""
-                bio["exp"]        = safe_int(irow.get("SEASON_EXP"))
-                dy = irow.get("DRAFT_YEAR")
-                bio["draft_year"] = int(dy) if dy and str(dy).isdigit() else 0
-        except Exception as e:
-            print(f"    [warn] bio fetch failed for {player_name}: {e}")
-
         return {
             "player_id":   player_id,
             "player_name": player_name,
             "seasons":     seasons,
-            "bio":         bio,
+            "bio":         bio_index.player_bio(player_id, player_name, SCHEDULER),
         }
 
     except Exception as e:
@@ -167,6 +106,8 @@ def main():
     parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument("--years", type=int, nargs="+", required=True,
                         help="Start year(s) of season(s) to add, e.g. 2025 for 2024-25")
+    parser.add_argument("--cache-stats", action="store_true",
+                        help="Print nba_api response cache hits/misses at the end")
     args = parser.parse_args()
 
     if not os.path.exists(OUT_PATH):
@@ -189,12 +130,12 @@ def main():
         # One API call gets all player stats for this season
         print(f"  Fetching player stats for {season}...")
         try:
-            stats = LeagueDashPlayerStats(
+            stats = CACHE.fetch(
+                LeagueDashPlayerStats, SCHEDULER,
                 season=season,
                 per_mode_detailed="PerGame",
                 season_type_all_star="Regular Season",
             )
-            time.sleep(REQUEST_DELAY)
             sdf = stats.get_data_frames()[0]
         except Exception as e:
             print(f"  ERROR fetching {season}: {e}")
@@ -257,6 +198,8 @@ def main():
     print(f"Done!  {total_updated} existing players updated  |  {total_added} new players added")
     print(f"{len(updated_list)} total players  |  {size_kb:.1f} KB  →  {OUT_PATH}")
     print(f"\nNext: cp data/nba_careers.json ../public/data/nba_careers.json")
+    if args.cache_stats:
+        CACHE.report()
 
 
 if __name__ == "__main__":
@@ -21,21 +21,24 @@ import json
 import math
 import os
 import sys
-import time
 from typing import Optional
 
 try:
     from nba_api.stats.endpoints import LeagueDashPlayerStats, PlayerCareerStats
-    from nba_api.stats.endpoints import commonplayerinfo as CommonPlayerInfoModule
 except ImportError:
     print("ERROR: nba_api not installed. Run: pip install nba_api")
     sys.exit(1)
 
-REQUEST_DELAY = 1.5
+from fetch_scheduler import FetchScheduler
+from nba_cache import CACHE
+import nba_bio_index as bio_index
+import nba_career_store as store
+
 MIN_PPG       = 5.0   # threshold for new players to be added
 MIN_GP        = 20
 
-OUT_PATH = os.path.join(os.path.dirname(__file__), "data", "nba_lineup_pool.json")
+SCHEDULER = FetchScheduler(workers=1, label="nba pool update")
+OUT_PATH  = os.path.join(os.path.dirname(__file__), "data", "nba_lineup_pool.json")
 
 def format_season(year: int) -> str:
     return f"{year}-{str(year + 1)[-2:]}"
@@ -59,85 +62,28 @@ def safe_int(val):
         return 0
 
 def build_season_row(row: dict, season: str) -> dict:
-    return {
-        "season":  season,
-        "team":    row.get("TEAM_ABBREVIATION", "???"),
-        "gp":      safe_int(row.get("GP")),
-        "min":     safe_float(row.get("MIN")),
-        "pts":     safe_float(row.get("PTS")),
-        "reb":     safe_float(row.get("REB")),
-        "ast":     safe_float(row.get("AST")),
-        "stl":     safe_float(row.get("STL")),
-        "blk":     safe_float(row.get("BLK")),
-        "fg_pct":  safe_float(row.get("FG_PCT"), 3),
-        "fg3_pct": safe_float(row.get("FG3_PCT"), 3),
-    }
+    return store.season_row(row, season, row.get("TEAM_ABBREVIATION", "???"))
 
 def fetch_full_career(player_id: int, player_name: str) -> Optional[dict]:
     """Fetch full career stats + bio for a brand-new player."""
     try:
-        career = PlayerCareerStats(player_id=player_id, per_mode36="PerGame")
-        time.sleep(REQUEST_DELAY)
+        career = CACHE.fetch(PlayerCareerStats, SCHEDULER, player_id=player_id, per_mode36="PerGame")
         season_df = career.get_data_frames()[0]
+
         if season_df.empty:
             return None
+        store.save_career(player_id, season_df)
 
-        seasons = []
-        for season_id, group in season_df.groupby("SEASON_ID", sort=False):
-            tot_rows  = group[group["TEAM_ABBREVIATION"] == "TOT"]
-            team_rows = group[group["TEAM_ABBREVIATION"] != "TOT"]
-            if len(team_rows) <= 1 and tot_rows.empty:
-                row = group.iloc[0]
-                seasons.append({
-                    "season":  row.get("SEASON_ID", ""),
-                    "team":    row.get("TEAM_ABBREVIATION", "???"),
-                    "gp":      safe_int(row.get("GP")),
-                    "min":     safe_float(row.get("MIN")),
-                    "pts":     safe_float(row.get("PTS")),
-                    "reb":     safe_float(row.get("REB")),
-                    "ast":     safe_float(row.get("AST")),
-                    "stl":     safe_float(row.get("STL")),
-                    "blk":     safe_float(row.get("BLK")),
-                    "fg_pct":  safe_float(row.get("FG_PCT"), 3),
-                    "fg3_pct": safe_float(row.get("FG3_PCT"), 3),
-                })
-            else:
-                team_names = "/".join(team_rows["TEAM_ABBREVIATION"].tolist()) if not team_rows.empty else "???"
-                src = tot_rows.iloc[0] if not tot_rows.empty else team_rows.iloc[0]
-                seasons.append({
-                    "season":  str(season_id),
-                    "team":    team_names,
-                    "gp":      safe_int(src.get("GP")),
-                    "min":     safe_float(src.get("MIN")),
-                    "pts":     safe_float(src.get("PTS")),
-                    "reb":     safe_float(src.get("REB")),
-                    "ast":     safe_float(src.get("AST")),
-                    "stl":     safe_float(src.get("STL")),
-                    "blk":     safe_float(src.get("BLK")),
-                    "fg_pct":  safe_float(src.get("FG_PCT"), 3),
-                    "fg3_pct": safe_float(src.get("FG3_PCT"), 3),
-                })
-
+        seasons = store.build_seasons(season_df)
         if not seasons:
             return None
 
-        bio = {"height": "", "weight": 0, "school": "", "exp": 0, "draft_year": 0}
-        try:
-            info = CommonPlayerInfoModule.CommonPlayerInfo(player_id=player_id)
-            time.sleep(REQUEST_DELAY)
-            info_df = info.get_data_frames()[0]
-            if not info_df.empty:
-                irow = info_df.iloc[0]
-                bio["height"]     = irow.get("HEIGHT", "") or ""
-                bio["weight"]     = safe_int(irow.get("WEIGHT"))
-                bio["school"]     = irow.get("SCHOOL", "") or ""
-                bio["exp"]        = safe_int(irow.get("SEASON_EXP"))
-                dy = irow.get("DRAFT_YEAR")
-                bio["draft_year"] = int(dy) if dy and str(dy).isdigit() else 0
-        except Exception as e:
-            print(f"    [warn] bio fetch failed for {player_name}: {e}")
-
-        return {"player_id": player_id, "player_name": player_name, "seasons": seasons, "bio": bio}
+        return {
+            "player_id":   player_id,
+            "player_name": player_name,
+            "seasons":     seasons,
+            "bio":         bio_index.player_bio(player_id, player_name, SCHEDULER),
+        }
 
     except Exception as e:
         print(f"    ERROR fetching {player_name} ({player_id}): {e}")
@@ -148,6 +94,8 @@ def main():
     parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument("--year", type=int, required=True,
                         help="Start year of the season to add, e.g. 2025 for 2025-26")
+    parser.add_argument("--cache-stats", action="store_true",
+                        help="Print nba_api response cache hits/misses at the end")
     args = parser.parse_args()
 
     if not os.path.exists(OUT_PATH):
@@ -163,12 +111,12 @@ def main():
     season = format_season(args.year)
     print(f"Fetching {season} stats from NBA API...")
     try:
-        stats = LeagueDashPlayerStats(
+        stats = CACHE.fetch(
+            LeagueDashPlayerStats, SCHEDULER,
             season=season,
             per_mode_detailed="PerGame",
             season_type_all_star="Regular Season",
         )
-        time.sleep(REQUEST_DELAY)
         sdf = stats.get_data_frames()[0]
     except Exception as e:
         print(f"ERROR: {e}")
@@ -224,6 +172,8 @@ def main():
     size_kb = os.path.getsize(OUT_PATH) / 1024
     print(f"\nDone! {updated} updated, {total_added} new  |  {len(updated_list)} total  |  {size_kb:.1f} KB")
     print(f"Next: cp data/nba_lineup_pool.json ../public/data/nba_lineup_pool.json")
+    if args.cache_stats:
+        CACHE.report()
 
 
 if __name__ == "__main__":
@@ -24,17 +24,8 @@ import json
 import os
 import sys
 
-try:
-    import nfl_data_py as nfl
-except ImportError:
-    print("ERROR: nfl_data_py not installed. Run: pip install nfl-data-py")
-    sys.exit(1)
-
-try:
-    import pandas as pd
-except ImportError:
-    print("ERROR: pandas not installed. Run: pip install pandas pyarrow")
-    sys.exit(1)
+import nflverse_mirror
+from nfl_session import NFLBuildSession
 
 # ─── Config ──────────────────────────────────────────────────────────────────
 
@@ -47,6 +38,7 @@ NFLVERSE_STATS_URL = (
 )
 
 CAREER_POSITIONS = {"QB", "RB", "WR", "TE"}
+ROSTER_COLUMNS   = ["player_id", "player_name", "season", "team"]
 
 # ─── Known abbreviations (mirrors NFL_FRANCHISE_ALIASES + NFL_TEAMS in capCrunch.ts) ──
 KNOWN_NFL_ABBRS = {
@@ -178,28 +170,29 @@ def meets_pool_threshold(row: dict, position: str, season_year: int) -> bool:
 
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
-def main():
-    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
-    parser.add_argument("--year", type=int, required=True,
-                        help="Season year to add, e.g. 2025")
-    args = parser.parse_args()
-    year     = args.year
+def build(session: NFLBuildSession, year: int) -> None:
+    """Merge one season into nfl_careers / nfl_lineup_pool (this session's outputs, or the files)."""
     year_str = str(year)
 
     # ── Load existing files ────────────────────────────────────────────────────
-    if not os.path.exists(CAREERS_PATH):
+    if "nfl_careers" in session.outputs:
+        careers = session.outputs["nfl_careers"]
+    elif not os.path.exists(CAREERS_PATH):
         print(f"ERROR: {CAREERS_PATH} not found. Run generate_nfl_careers.py first.")
         sys.exit(1)
-
-    with open(CAREERS_PATH) as f:
-        careers = json.load(f)
+    else:
+        with open(CAREERS_PATH) as f:
+            careers = json.load(f)
     careers_by_id: dict[str, dict] = {str(c["player_id"]): c for c in careers}
     print(f"Loaded {len(careers)} players from nfl_careers.json")
 
-    pool_exists = os.path.exists(POOL_PATH)
+    pool_exists = "nfl_lineup_pool" in session.outputs or os.path.exists(POOL_PATH)
     if pool_exists:
-        with open(POOL_PATH) as f:
-            pool = json.load(f)
+        if "nfl_lineup_pool" in session.outputs:
+            pool = session.outputs["nfl_lineup_pool"]
+        else:
+            with open(POOL_PATH) as f:
+                pool = json.load(f)
         pool_by_id: dict[str, dict] = {str(p["player_id"]): p for p in pool}
         print(f"Loaded {len(pool)} players from nfl_lineup_pool.json")
     else:
@@ -210,7 +203,7 @@ def main():
     url = NFLVERSE_STATS_URL.format(year=year)
     print(f"\nFetching {year} stats: {url}")
     try:
-        stats_df = pd.read_parquet(url)
+        stats_df = session.load("stats_player_reg", [year])
         print(f"  {len(stats_df)} rows loaded")
     except Exception as e:
         print(f"ERROR: Could not fetch {year} stats: {e}")
@@ -221,7 +214,7 @@ def main():
     team_by_pid: dict[str, str] = {}
     name_by_pid: dict[str, str] = {}
     try:
-        roster_df = nfl.import_seasonal_rosters([year])
+        roster_df = session.load("rosters", [year], columns=ROSTER_COLUMNS)
         roster_df = roster_df.drop_duplicates(subset=["player_id", "season"], keep="first")
         for _, rrow in roster_df.iterrows():
             pid  = safe_str(rrow.get("player_id"))
@@ -315,6 +308,22 @@ def main():
     if pool_exists or pool_added > 0:
         print(f"  cp data/nfl_lineup_pool.json ../public/data/nfl_lineup_pool.json")
 
+    session.outputs["nfl_careers"] = careers_out
+    if pool_exists or pool_added > 0:
+        session.outputs["nfl_lineup_pool"] = pool_out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--year", type=int, required=True,
+                        help="Season year to add, e.g. 2025")
+    nflverse_mirror.add_arguments(parser)
+    args = parser.parse_args()
+    nflverse_mirror.install()
+    session = NFLBuildSession()
+    build(session, args.year)
+    session.report()
+
 
 if __name__ == "__main__":
     main()
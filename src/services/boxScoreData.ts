@@ -2,10 +2,13 @@
  * boxScoreData.ts — Static box score data loader for the Box Score game mode.
  *
  * Fetches /data/nfl/box_scores/{year}.json from the Vercel CDN once per
- * session per year, caches in memory, and exposes random game selection.
+ * session per year (through its content-hashed copy, see dataManifest.ts),
+ * caches in memory, and exposes random game selection.
  * No backend required — all data is static JSON.
  */
 
+import { fetchData } from './dataManifest';
+
 // ─── Types ────────────────────────────────────────────────────────────────────
 
 export interface BoxScorePassingPlayer {
@@ -83,7 +86,7 @@ const _cache: Record<number, Promise<BoxScoreGame[]>> = {};
 
 export function loadBoxScoreYear(year: number): Promise<BoxScoreGame[]> {
   if (!_cache[year]) {
-    _cache[year] = fetch(`/data/nfl/box_scores/${year}.json`, { cache: 'no-store' })
+    _cache[year] = fetchData(`nfl/box_scores/${year}.json`)
       .then((r) => {
         if (!r.ok) throw new Error(`Box score fetch failed: ${r.status} for ${year}`);
         return r.json() as Promise<BoxScoreGame[]>;
@@ -112,33 +112,29 @@ export function loadNBACareers(): Promise<NBACareerPlayer[]> {
   return _nbaPromise;
 }
 
+/**
+ * Prebuilt {sport}_player_pool.json (scripts/merge_player_pool.py): careers +
+ * lineup pool already merged with the rules below. Resolves to null if it
+ * hasn't been generated, so callers fall back to merging the two files.
+ */
+function loadMergedPool<T>(sport: 'nba' | 'nfl'): Promise<T[] | null> {
+  return fetch(`/data/${sport}_player_pool.json`)
+    .then((r) => (r.ok ? (r.json() as Promise<T[]>) : null))
+    .catch(() => null);
+}
+
 /**
  * Extended NBA player pool for Lineup Is Right and Scramble.
  * Merges nba_careers.json with nba_lineup_pool.json, which includes recent
  * players who don't yet meet the 5-season / 10 PPG thresholds
  * (e.g. Chet Holmgren, Victor Wembanyama, Brandin Podziemski).
+ * Uses the prebuilt nba_player_pool.json when present.
  * Falls back gracefully if nba_lineup_pool.json hasn't been generated yet.
  */
 export function loadNBALineupPool(): Promise<NBACareerPlayer[]> {
   if (!_nbaLineupPoolPromise) {
-    _nbaLineupPoolPromise = Promise.all([
-      fetch('/data/nba_careers.json').then((r) => {
-        if (!r.ok) throw new Error('Failed to load nba_careers.json');
-        return r.json();
-      }),
-      fetch('/data/nba_lineup_pool.json')
-        .then((r) => (r.ok ? r.json() : ([] as NBACareerPlayer[])))
-        .catch(() => [] as NBACareerPlayer[]), // pool file optional — falls back to empty
-    ])
-      .then(([base, pool]: [NBACareerPlayer[], NBACareerPlayer[]]) => {
-        const map = new Map<number, NBACareerPlayer>();
-        base.forEach((p) => map.set(p.player_id, p));
-        pool.forEach((p) => {
-          const existing = map.get(p.player_id);
-          map.set(p.player_id, existing ? mergeNBAPlayer(existing, p) : p);
-        });
-        return Array.from(map.values());
-      })
+    _nbaLineupPoolPromise = loadMergedPool<NBACareerPlayer>('nba')
+      .then((merged) => merged ?? mergeNBAFiles())
       .catch((err) => {
         _nbaLineupPoolPromise = null;
         throw err;
@@ -147,6 +143,26 @@ export function loadNBALineupPool(): Promise<NBACareerPlayer[]> {
   return _nbaLineupPoolPromise;
 }
 
+function mergeNBAFiles(): Promise<NBACareerPlayer[]> {
+  return Promise.all([
+    fetch('/data/nba_careers.json').then((r) => {
+      if (!r.ok) throw new Error('Failed to load nba_careers.json');
+      return r.json();
+    }),
+    fetch('/data/nba_lineup_pool.json')
+      .then((r) => (r.ok ? r.json() : ([] as NBACareerPlayer[])))
+      .catch(() => [] as NBACareerPlayer[]), // pool file optional — falls back to empty
+  ]).then(([base, pool]: [NBACareerPlayer[], NBACareerPlayer[]]) => {
+    const map = new Map<number, NBACareerPlayer>();
+    base.forEach((p) => map.set(p.player_id, p));
+    pool.forEach((p) => {
+      const existing = map.get(p.player_id);
+      map.set(p.player_id, existing ? mergeNBAPlayer(existing, p) : p);
+    });
+    return Array.from(map.values());
+  });
+}
+
 export function loadNFLCareers(): Promise<NFLCareerPlayer[]> {
   if (!_nflPromise) {
     _nflPromise = fetch('/data/nfl_careers.json')
@@ -190,29 +206,13 @@ function mergeNFLPlayer(base: NFLCareerPlayer, incoming: NFLCareerPlayer): NFLCa
  * players who don't yet meet the 5-season / career-yards thresholds
  * (e.g. Bijan Robinson, Drake London). Seasons are unioned per player so no
  * data is lost when the same player appears in both files.
+ * Uses the prebuilt nfl_player_pool.json when present.
  * Falls back gracefully if nfl_lineup_pool.json hasn't been generated yet.
  */
 export function loadNFLLineupPool(): Promise<NFLCareerPlayer[]> {
   if (!_nflLineupPoolPromise) {
-    _nflLineupPoolPromise = Promise.all([
-      fetch('/data/nfl_careers.json').then((r) => {
-        if (!r.ok) throw new Error('Failed to load nfl_careers.json');
-        return r.json();
-      }),
-      fetch('/data/nfl_lineup_pool.json')
-        .then((r) => (r.ok ? r.json() : ([] as NFLCareerPlayer[])))
-        .catch(() => [] as NFLCareerPlayer[]), // pool file optional — falls back to empty
-    ])
-      .then(([base, pool]: [NFLCareerPlayer[], NFLCareerPlayer[]]) => {
-        const map = new Map<string, NFLCareerPlayer>();
-        base.forEach((p) => map.set(p.player_id, p));
-        pool.forEach((p) => {
-          const existing = map.get(p.player_id);
-          // If player is in both files, union their seasons rather than clobbering
-          map.set(p.player_id, existing ? mergeNFLPlayer(existing, p) : p);
-        });
-        return Array.from(map.values());
-      })
+    _nflLineupPoolPromise = loadMergedPool<NFLCareerPlayer>('nfl')
+      .then((merged) => merged ?? mergeNFLFiles())
       .catch((err) => {
         _nflLineupPoolPromise = null;
         throw err;
@@ -221,6 +221,27 @@ export function loadNFLLineupPool(): Promise<NFLCareerPlayer[]> {
   return _nflLineupPoolPromise;
 }
 
+function mergeNFLFiles(): Promise<NFLCareerPlayer[]> {
+  return Promise.all([
+    fetch('/data/nfl_careers.json').then((r) => {
+      if (!r.ok) throw new Error('Failed to load nfl_careers.json');
+      return r.json();
+    }),
+    fetch('/data/nfl_lineup_pool.json')
+      .then((r) => (r.ok ? r.json() : ([] as NFLCareerPlayer[])))
+      .catch(() => [] as NFLCareerPlayer[]), // pool file optional — falls back to empty
+  ]).then(([base, pool]: [NFLCareerPlayer[], NFLCareerPlayer[]]) => {
+    const map = new Map<string, NFLCareerPlayer>();
+    base.forEach((p) => map.set(p.player_id, p));
+    pool.forEach((p) => {
+      const existing = map.get(p.player_id);
+      // If player is in both files, union their seasons rather than clobbering
+      map.set(p.player_id, existing ? mergeNFLPlayer(existing, p) : p);
+    });
+    return Array.from(map.values());
+  });
+}
+
 /** Call this early (e.g. on homepage load) to warm the cache before career mode is entered. */
 export function warmCareerCache(sport: 'nba' | 'nfl'): void {
   if (sport === 'nba') loadNBACareers().catch(() => {});
@@ -0,0 +1,89 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+
+const HASHED = 'nba/box_scores/2024.3f9a1c2b7d04.json';
+
+function jsonResponse(body: unknown): Response {
+  return new Response(JSON.stringify(body), { status: 200 });
+}
+
+// dataManifest.ts caches the manifest per module instance; load a fresh one per test
+async function loadFetchData(manifest: () => Promise<Response>) {
+  const fetchMock = vi.fn((url: string) =>
+    url === '/data/data-manifest.json' ? manifest() : Promise.resolve(jsonResponse([])),
+  );
+  vi.stubGlobal('fetch', fetchMock);
+  vi.resetModules();
+  const { fetchData } = await import('./dataManifest');
+  return { fetchData, fetchMock };
+}
+
+describe('fetchData', () => {
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  it('fetches the hashed copy listed in the manifest', async () => {
+    const { fetchData, fetchMock } = await loadFetchData(() =>
+      Promise.resolve(
+        jsonResponse({ version: 1, files: { 'nba/box_scores/2024.json': HASHED } }),
+      ),
+    );
+    await fetchData('nba/box_scores/2024.json');
+    expect(fetchMock).toHaveBeenLastCalledWith(`/data/${HASHED}`);
+  });
+
+  it('falls back to the plain path, uncached, for files not in the manifest', async () => {
+    const { fetchData, fetchMock } = await loadFetchData(() =>
+      Promise.resolve(jsonResponse({ version: 1, files: {} })),
+    );
+    await fetchData('nba/box_scores/2025.json');
+    expect(fetchMock).toHaveBeenLastCalledWith('/data/nba/box_scores/2025.json', {
+      cache: 'no-store',
+    });
+  });
+
+  it('falls back to the plain path when the manifest is missing', async () => {
+    const { fetchData, fetchMock } = await loadFetchData(() =>
+      Promise.resolve(new Response('Not found', { status: 404 })),
+    );
+    await fetchData('nba/box_scores/2024.json');
+    expect(fetchMock).toHaveBeenLastCalledWith('/data/nba/box_scores/2024.json', {
+      cache: 'no-store',
+    });
+  });
+
+  it('falls back to the plain path when the manifest is not JSON', async () => {
+    // e.g. the SPA's index.html served in its place
+    const { fetchData, fetchMock } = await loadFetchData(() =>
+      Promise.resolve(new Response('<!doctype html><html></html>', { status: 200 })),
+    );
+    await fetchData('nba/box_scores/2024.json');
+    expect(fetchMock).toHaveBeenLastCalledWith('/data/nba/box_scores/2024.json', {
+      cache: 'no-store',
+    });
+  });
+
+  it('falls back to the plain path when the manifest request fails', async () => {
+    const { fetchData, fetchMock } = await loadFetchData(() =>
+      Promise.reject(new TypeError('network error')),
+    );
+    await fetchData('nba/box_scores/2024.json');
+    expect(fetchMock).toHaveBeenLastCalledWith('/data/nba/box_scores/2024.json', {
+      cache: 'no-store',
+    });
+  });
+
+  it('fetches the manifest only once', async () => {
+    const { fetchData, fetchMock } = await loadFetchData(() =>
+      Promise.resolve(
+        jsonResponse({ version: 1, files: { 'nba/box_scores/2024.json': HASHED } }),
+      ),
+    );
+    await fetchData('nba/box_scores/2024.json');
+    await fetchData('nba/box_scores/2024.json');
+    const manifestCalls = fetchMock.mock.calls.filter(
+      ([url]) => url === '/data/data-manifest.json',
+    );
+    expect(manifestCalls).toHaveLength(1);
+  });
+});
@@ -0,0 +1,36 @@
+/**
+ * dataManifest.ts — Resolves /data paths to their content-hashed copies.
+ *
+ * scripts/publish_data.py writes a hashed copy of every data file
+ * (nfl/box_scores/2024.json → nfl/box_scores/2024.3f9a1c2b7d04.json) and
+ * /data/data-manifest.json mapping one to the other. A hashed path never
+ * changes content, so it is fetched with normal HTTP caching (vercel.json
+ * marks it immutable) and unchanged seasons are never downloaded twice.
+ *
+ * Without a manifest (dev server, unpublished tree) the plain path is fetched
+ * uncached, as before.
+ */
+
+interface DataManifest {
+  version: number;
+  files: Record<string, string>; // logical path → hashed path, both relative to /data
+}
+
+let _manifestPromise: Promise<Record<string, string>> | null = null;
+
+function loadDataManifest(): Promise<Record<string, string>> {
+  if (!_manifestPromise) {
+    _manifestPromise = fetch('/data/data-manifest.json', { cache: 'no-cache' })
+      .then((r) => (r.ok ? (r.json() as Promise<DataManifest>) : null))
+      .then((m) => m?.files ?? {})
+      .catch(() => ({}));
+  }
+  return _manifestPromise;
+}
+
+/** Fetch /data/{path}, through its content-hashed copy when the manifest lists one. */
+export async function fetchData(path: string): Promise<Response> {
+  const files = await loadDataManifest();
+  const hashed = files[path];
+  return hashed ? fetch(`/data/${hashed}`) : fetch(`/data/${path}`, { cache: 'no-store' });
+}
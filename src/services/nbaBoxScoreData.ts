@@ -1,3 +1,5 @@
+import { fetchData } from './dataManifest';
+
 export interface NBABoxScorePlayer {
   id: string;
   name: string;
@@ -41,7 +43,7 @@ const _cache: Record<number, Promise<NBABoxScoreGame[]>> = {};
 
 export function loadNBABoxScoreYear(year: number): Promise<NBABoxScoreGame[]> {
   if (!_cache[year]) {
-    _cache[year] = fetch(`/data/nba/box_scores/${year}.json`, { cache: 'no-store' })
+    _cache[year] = fetchData(`nba/box_scores/${year}.json`)
       .then((r) => {
         if (!r.ok) throw new Error(`NBA box score fetch failed: ${r.status} for ${year}`);
         return r.json() as Promise<NBABoxScoreGame[]>;